@@ -0,0 +1,295 @@
+// JSON file codec suite. `lib/jsonFile.js` backs `storage-write-json`,
+// `storage-read-json` and the competitions index, so a regression here
+// either loses a session (torn write read back as null) or surfaces as a
+// phantom "no competition" on launch. Pins the ENOENT → null contract, the
+// atomic temp-file + rename write, and the round-trip.
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { createRequire } from 'node:module';
+
+const require = createRequire(import.meta.url);
+const {
+  TMP_SUFFIX,
+  encodeJSON,
+  encodeJSONText,
+  decodeJSON,
+  readJSONFileSync,
+  writeJSONFileSync,
+  readJSONFile,
+  readJSONText,
+  writeJSONFile,
+  updateJSONFile,
+  writeFileAtomic,
+  pruneStaleTempFiles,
+} = require('../lib/jsonFile');
+
+let tmpDir;
+
+beforeEach(() => {
+  tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'airq-jsonfile-'));
+});
+
+afterEach(() => {
+  fs.rmSync(tmpDir, { recursive: true, force: true });
+});
+
+describe('encodeJSON / decodeJSON', () => {
+  it('round-trips nested session-shaped data', () => {
+    const session = {
+      id: 'session-1',
+      version: 3,
+      sets: { set1: { title: 'SP - TP1', photos: [{ id: 'a', canvasState: { scale: 1.5 } }] } },
+    };
+    const buf = encodeJSON(session);
+    expect(Buffer.isBuffer(buf)).toBe(true);
+    expect(decodeJSON(buf)).toEqual(session);
+  });
+
+  it('encodes non-ASCII names as UTF-8', () => {
+    // Czech competition names are the common case (feedback uses "Plasy").
+    const buf = encodeJSON({ competition_name: 'Příbram – Čáslav' });
+    expect(decodeJSON(buf).competition_name).toBe('Příbram – Čáslav');
+    expect(buf.toString('utf8')).toContain('Příbram');
+  });
+
+  it('writes compact JSON by default', () => {
+    const buf = encodeJSON({ a: 1, nested: { b: [1, 2] } });
+    expect(buf.toString('utf8')).toBe('{"a":1,"nested":{"b":[1,2]}}');
+  });
+
+  it('accepts a string as well as a Buffer', () => {
+    expect(decodeJSON('{"a":1}')).toEqual({ a: 1 });
+  });
+
+  it('writes renderer-serialized text verbatim by default', () => {
+    const text = '{"competition_name":"Příbram","sets":{}}';
+    expect(encodeJSONText(text).toString('utf8')).toBe(text);
+  });
+});
+
+describe('readJSONFileSync', () => {
+  it('returns null for a missing file instead of throwing', () => {
+    expect(readJSONFileSync(path.join(tmpDir, 'missing.json'))).toBeNull();
+  });
+
+  it('throws on malformed JSON so the caller can log it', () => {
+    const p = path.join(tmpDir, 'broken.json');
+    fs.writeFileSync(p, '{"truncated": ');
+    expect(() => readJSONFileSync(p)).toThrow();
+  });
+});
+
+describe('writeJSONFileSync', () => {
+  it('writes a file that readJSONFileSync reads back', () => {
+    const p = path.join(tmpDir, 'session.json');
+    writeJSONFileSync(p, { version: 1, sets: {} });
+    expect(readJSONFileSync(p)).toEqual({ version: 1, sets: {} });
+  });
+
+  it('replaces existing content and leaves no temp file behind', () => {
+    const p = path.join(tmpDir, 'session.json');
+    writeJSONFileSync(p, { version: 1 });
+    writeJSONFileSync(p, { version: 2 });
+    expect(readJSONFileSync(p)).toEqual({ version: 2 });
+    expect(fs.existsSync(p + TMP_SUFFIX)).toBe(false);
+    expect(fs.readdirSync(tmpDir)).toEqual(['session.json']);
+  });
+
+  it('keeps the previous content when the write fails', () => {
+    // Unserializable payload (BigInt) fails at encode time — the target
+    // must still hold the last good version, not a truncated file.
+    const p = path.join(tmpDir, 'session.json');
+    writeJSONFileSync(p, { version: 1 });
+    expect(() => writeJSONFileSync(p, { version: 10n })).toThrow();
+    expect(readJSONFileSync(p)).toEqual({ version: 1 });
+  });
+
+  it('cleans up the temp file when the rename fails', () => {
+    // Target is an existing directory → rename fails on every platform.
+    const p = path.join(tmpDir, 'occupied');
+    fs.mkdirSync(p);
+    fs.writeFileSync(path.join(p, 'child'), 'x');
+    expect(() => writeJSONFileSync(p, { a: 1 })).toThrow();
+    expect(fs.existsSync(p + TMP_SUFFIX)).toBe(false);
+  });
+});
+
+describe('readJSONFile / writeJSONFile (async)', () => {
+  it('round-trips and returns null for a missing file', async () => {
+    const p = path.join(tmpDir, 'session.json');
+    expect(await readJSONFile(p)).toBeNull();
+    await writeJSONFile(p, { version: 1 });
+    expect(await readJSONFile(p)).toEqual({ version: 1 });
+  });
+
+  it('survives overlapping writes to the same file without temp-file collisions', async () => {
+    // Two renderers (or a session + its index) can write concurrently. Each
+    // write must use its own temp file, otherwise one truncates the other's
+    // temp between write and rename and a torn payload is renamed in.
+    const p = path.join(tmpDir, 'session.json');
+    const big = (n) => ({ version: n, photos: Array.from({ length: 500 }, (_, i) => ({ id: `p${n}-${i}` })) });
+    await Promise.all([1, 2, 3, 4, 5].map(n => writeJSONFile(p, big(n))));
+    const result = await readJSONFile(p);
+    expect(result.photos).toHaveLength(500);
+    expect(result.photos[0].id).toBe(`p${result.version}-0`);
+    expect(fs.readdirSync(tmpDir)).toEqual(['session.json']);
+  });
+
+  it('leaves the previous content and no temp file when the encode fails', async () => {
+    const p = path.join(tmpDir, 'session.json');
+    await writeJSONFile(p, { version: 1 });
+    await expect(writeJSONFile(p, { version: 10n })).rejects.toThrow();
+    expect(await readJSONFile(p)).toEqual({ version: 1 });
+    expect(fs.readdirSync(tmpDir)).toEqual(['session.json']);
+  });
+});
+
+describe('readJSONText', () => {
+  it('returns the file text unparsed, or null when missing', async () => {
+    const p = path.join(tmpDir, 'session.json');
+    expect(await readJSONText(p)).toBeNull();
+    await writeJSONFile(p, { competition_name: 'Příbram', version: 2 });
+    const text = await readJSONText(p);
+    expect(typeof text).toBe('string');
+    expect(JSON.parse(text)).toEqual({ competition_name: 'Příbram', version: 2 });
+  });
+});
+
+describe('pruneStaleTempFiles', () => {
+  const DAY = 24 * 60 * 60 * 1000;
+
+  function ageFile(p, ms) {
+    const t = (Date.now() - ms) / 1000;
+    fs.utimesSync(p, t, t);
+  }
+
+  it('removes old temp files at any depth but keeps fresh ones and real data', async () => {
+    const compDir = path.join(tmpDir, 'competitions', 'comp-1');
+    fs.mkdirSync(compDir, { recursive: true });
+    const oldRoot = path.join(tmpDir, `competitions-index.json.123-1${TMP_SUFFIX}`);
+    const oldNested = path.join(compDir, `session.json${TMP_SUFFIX}`);
+    const fresh = path.join(compDir, `session.json.456-2${TMP_SUFFIX}`);
+    const session = path.join(compDir, 'session.json');
+    for (const p of [oldRoot, oldNested, fresh, session]) fs.writeFileSync(p, '{}');
+    ageFile(oldRoot, 2 * DAY);
+    ageFile(oldNested, 2 * DAY);
+    ageFile(session, 400 * DAY);
+
+    expect(await pruneStaleTempFiles(tmpDir)).toBe(2);
+    expect(fs.existsSync(oldRoot)).toBe(false);
+    expect(fs.existsSync(oldNested)).toBe(false);
+    expect(fs.existsSync(fresh)).toBe(true);
+    expect(fs.existsSync(session)).toBe(true);
+  });
+
+  it('removes stale photo temp files but does not recurse below photos/', async () => {
+    // Photo saves are atomic too, so a crash mid-save leaves
+    // `<id>.<ext>.<pid>-<n>.tmp` next to the photos.
+    const photosDir = path.join(tmpDir, 'competitions', 'comp-1', 'photos');
+    const nestedDir = path.join(photosDir, 'nested');
+    fs.mkdirSync(nestedDir, { recursive: true });
+    const orphan = path.join(photosDir, `p1.jpg.123-4${TMP_SUFFIX}`);
+    const photo = path.join(photosDir, 'p1.jpg');
+    const nested = path.join(nestedDir, `deep${TMP_SUFFIX}`);
+    for (const p of [orphan, photo, nested]) fs.writeFileSync(p, 'x');
+    for (const p of [orphan, photo, nested]) ageFile(p, 10 * DAY);
+    expect(await pruneStaleTempFiles(tmpDir)).toBe(1);
+    expect(fs.existsSync(orphan)).toBe(false);
+    expect(fs.existsSync(photo)).toBe(true);
+    expect(fs.existsSync(nested)).toBe(true);
+  });
+
+  it('is a no-op for a missing root', async () => {
+    expect(await pruneStaleTempFiles(path.join(tmpDir, 'nope'))).toBe(0);
+  });
+});
+
+describe('writeFileAtomic', () => {
+  it('writes binary payloads byte-for-byte and leaves no temp file', async () => {
+    const p = path.join(tmpDir, 'photo.jpg');
+    const bytes = Buffer.from([0xff, 0xd8, 0xff, 0xe0, 0x00, 0x10]);
+    await writeFileAtomic(p, bytes);
+    await writeFileAtomic(p, bytes.subarray(0, 3));
+    expect([...fs.readFileSync(p)]).toEqual([0xff, 0xd8, 0xff]);
+    expect(fs.readdirSync(tmpDir)).toEqual(['photo.jpg']);
+  });
+
+  it('applies overlapping writes to one path in submission order', async () => {
+    // A large payload submitted first must not land after a small one
+    // submitted later — the newest write wins regardless of its size.
+    const p = path.join(tmpDir, 'session.json');
+    const large = Buffer.alloc(4 * 1024 * 1024, 0x61);
+    const small = Buffer.from('newest');
+    await Promise.all([writeFileAtomic(p, large), writeFileAtomic(p, small)]);
+    expect(fs.readFileSync(p, 'utf8')).toBe('newest');
+  });
+
+  it('runs the next queued write after one fails', async () => {
+    const p = path.join(tmpDir, 'session.json');
+    const results = await Promise.allSettled([
+      writeFileAtomic(p, 42), // invalid payload → this write rejects
+      writeFileAtomic(p, Buffer.from('first')),
+      writeFileAtomic(p, Buffer.from('second')),
+    ]);
+    expect(results.map(r => r.status)).toEqual(['rejected', 'fulfilled', 'fulfilled']);
+    expect(fs.readFileSync(p, 'utf8')).toBe('second');
+  });
+
+  it('keeps the previous file when the rename fails', async () => {
+    const p = path.join(tmpDir, 'occupied');
+    fs.mkdirSync(p);
+    fs.writeFileSync(path.join(p, 'child'), 'x');
+    await expect(writeFileAtomic(p, Buffer.from('new'))).rejects.toThrow();
+    expect(fs.readdirSync(tmpDir)).toEqual(['occupied']);
+  });
+});
+
+describe('sync vs async writers of one path', () => {
+  it('lets an in-flight async write overtake a later sync write', async () => {
+    // Why IPC handlers must not use writeJSONFileSync for files the
+    // renderer also writes: the sync write bypasses the per-path chain, so
+    // the older async payload still renames in after it.
+    const p = path.join(tmpDir, 'competitions-index.json');
+    const older = writeJSONFile(p, { name: 'older' });
+    writeJSONFileSync(p, { name: 'newer' });
+    await older;
+    expect(readJSONFileSync(p)).toEqual({ name: 'older' });
+  });
+
+  it('queues an update behind the in-flight write, so the newer content lands last', async () => {
+    const p = path.join(tmpDir, 'competitions-index.json');
+    const older = writeJSONFile(p, { name: 'older', competitions: [] });
+    const renamed = updateJSONFile(p, () => ({ ...readJSONFileSync(p), name: 'newer' }));
+    await Promise.all([older, renamed]);
+    expect(readJSONFileSync(p)).toEqual({ name: 'newer', competitions: [] });
+    expect(fs.readdirSync(tmpDir)).toEqual(['competitions-index.json']);
+  });
+});
+
+describe('updateJSONFile', () => {
+  it('applies overlapping read-modify-writes without losing one', async () => {
+    const p = path.join(tmpDir, 'competitions-index.json');
+    await writeJSONFile(p, { competitions: [] });
+    const add = (id) => updateJSONFile(p, () => {
+      const index = readJSONFileSync(p);
+      index.competitions.push(id);
+      return index;
+    });
+    await Promise.all(['a', 'b', 'c'].map(add));
+    expect(readJSONFileSync(p).competitions).toEqual(['a', 'b', 'c']);
+  });
+
+  it('leaves the file alone when the update returns undefined or throws', async () => {
+    const p = path.join(tmpDir, 'session.json');
+    await writeJSONFile(p, { version: 1 });
+    await updateJSONFile(p, () => undefined);
+    await expect(updateJSONFile(p, () => { throw new Error('not found'); })).rejects.toThrow('not found');
+    expect(readJSONFileSync(p)).toEqual({ version: 1 });
+    // The chain keeps going after a failed update.
+    await updateJSONFile(p, () => ({ version: 2 }));
+    expect(readJSONFileSync(p)).toEqual({ version: 2 });
+  });
+});
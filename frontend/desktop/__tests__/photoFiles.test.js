@@ -0,0 +1,163 @@
+// Photo-file helper suite. `lib/photoFiles.js` sits between the renderer's
+// IPC payloads and the bytes written under `photo-sessions/`; a decode
+// regression here silently corrupts every saved photo, so the accepted
+// payload shapes are pinned explicitly.
+
+import { describe, it, expect } from 'vitest';
+import { createRequire } from 'node:module';
+
+const require = createRequire(import.meta.url);
+const {
+  toPhotoBuffer,
+  sniffImageType,
+  PHOTO_EXTENSIONS,
+  extForMimeType,
+  mimeTypeForExt,
+  createPhotoExtCache,
+  photoExtCandidates,
+} = require('../lib/photoFiles');
+
+const JPEG_HEAD = [0xff, 0xd8, 0xff, 0xe0, 0x00, 0x10];
+
+describe('toPhotoBuffer', () => {
+  it('wraps a Uint8Array (the renderer transport) byte-for-byte', () => {
+    const buf = toPhotoBuffer(new Uint8Array(JPEG_HEAD));
+    expect(Buffer.isBuffer(buf)).toBe(true);
+    expect([...buf]).toEqual(JPEG_HEAD);
+  });
+
+  it('respects the view offset of a typed-array slice', () => {
+    // A subarray shares its parent's ArrayBuffer — decoding the whole
+    // backing buffer would prepend/append foreign bytes.
+    const backing = new Uint8Array([1, 2, ...JPEG_HEAD, 3]);
+    const view = backing.subarray(2, 2 + JPEG_HEAD.length);
+    expect([...toPhotoBuffer(view)]).toEqual(JPEG_HEAD);
+  });
+
+  it('accepts a bare ArrayBuffer', () => {
+    expect([...toPhotoBuffer(new Uint8Array(JPEG_HEAD).buffer)]).toEqual(JPEG_HEAD);
+  });
+
+  it('decodes legacy base64 strings from older renderer bundles', () => {
+    const b64 = Buffer.from(JPEG_HEAD).toString('base64');
+    expect([...toPhotoBuffer(b64)]).toEqual(JPEG_HEAD);
+  });
+
+  it('passes a Buffer through untouched', () => {
+    const buf = Buffer.from(JPEG_HEAD);
+    expect(toPhotoBuffer(buf)).toBe(buf);
+  });
+
+  it('rejects anything else', () => {
+    expect(() => toPhotoBuffer(null)).toThrow(TypeError);
+    expect(() => toPhotoBuffer(42)).toThrow(TypeError);
+    expect(() => toPhotoBuffer({ length: 3 })).toThrow(TypeError);
+  });
+});
+
+describe('extForMimeType / mimeTypeForExt', () => {
+  it('round-trips the supported image types', () => {
+    for (const mime of ['image/jpeg', 'image/png', 'image/gif', 'image/webp']) {
+      expect(mimeTypeForExt(extForMimeType(mime))).toBe(mime);
+    }
+  });
+
+  it('falls back to JPEG for unknown or missing types', () => {
+    expect(extForMimeType(undefined)).toBe('.jpg');
+    expect(extForMimeType('application/octet-stream')).toBe('.jpg');
+    expect(mimeTypeForExt('')).toBe('image/jpeg');
+    expect(mimeTypeForExt('.jpeg')).toBe('image/jpeg');
+  });
+});
+
+describe('photoExtCandidates', () => {
+  it('probes the full list when the extension is unknown', () => {
+    expect(photoExtCandidates(undefined)).toEqual(PHOTO_EXTENSIONS);
+  });
+
+  it('tries the cached extension first without repeating it', () => {
+    const order = photoExtCandidates('.png');
+    expect(order[0]).toBe('.png');
+    expect(order).toHaveLength(PHOTO_EXTENSIONS.length);
+    expect(new Set(order)).toEqual(new Set(PHOTO_EXTENSIONS));
+  });
+});
+
+describe('createPhotoExtCache', () => {
+  it('stores, replaces and deletes per base path', () => {
+    const cache = createPhotoExtCache();
+    cache.set('/s/a/photos/p1', '.jpg');
+    cache.set('/s/a/photos/p1', '.png');
+    expect(cache.get('/s/a/photos/p1')).toBe('.png');
+    cache.delete('/s/a/photos/p1');
+    expect(cache.get('/s/a/photos/p1')).toBeUndefined();
+  });
+
+  it('evicts the least recently used entry past its bound', () => {
+    const cache = createPhotoExtCache(2);
+    cache.set('/s/a/photos/p1', '.jpg');
+    cache.set('/s/a/photos/p2', '.png');
+    // Reading p1 makes p2 the oldest entry.
+    expect(cache.get('/s/a/photos/p1')).toBe('.jpg');
+    cache.set('/s/a/photos/p3', '.jpg');
+    expect(cache.size).toBe(2);
+    expect(cache.get('/s/a/photos/p2')).toBeUndefined();
+    expect(cache.get('/s/a/photos/p1')).toBe('.jpg');
+    expect(cache.get('/s/a/photos/p3')).toBe('.jpg');
+  });
+
+  it('drops only entries under a cleared directory', () => {
+    // `/s/a` must not match the sibling session `/s/ab`.
+    const cache = createPhotoExtCache();
+    cache.set('/s/a/photos/p1', '.jpg');
+    cache.set('/s/ab/photos/p2', '.jpg');
+    cache.deleteUnder('/s/a', '/');
+    expect(cache.get('/s/a/photos/p1')).toBeUndefined();
+    expect(cache.get('/s/ab/photos/p2')).toBe('.jpg');
+    expect(cache.size).toBe(1);
+  });
+});
+
+describe('sniffImageType', () => {
+  const PNG_HEAD = [0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a, 0, 0, 0, 0x0d];
+
+  it('recognises JPEG and PNG signatures', () => {
+    expect(sniffImageType(Buffer.from(JPEG_HEAD))).toBe('image/jpeg');
+    expect(sniffImageType(Buffer.from(PNG_HEAD))).toBe('image/png');
+  });
+
+  it('rejects renamed non-images and truncated headers', () => {
+    expect(sniffImageType(Buffer.from('hello, not a photo'))).toBeNull();
+    expect(sniffImageType(Buffer.from([0xff, 0xd8]))).toBeNull();
+    expect(sniffImageType(Buffer.alloc(0))).toBeNull();
+    // HEIC (ftyp box) is a realistic phone export with a .jpg rename.
+    expect(sniffImageType(Buffer.from([0, 0, 0, 0x18, 0x66, 0x74, 0x79, 0x70, 0x68, 0x65, 0x69, 0x63]))).toBeNull();
+  });
+});
+
+describe('createPhotoExtCache — primeDir', () => {
+  it('learns every photo extension from one directory listing', () => {
+    const cache = createPhotoExtCache();
+    expect(cache.isPrimed('/s/a/photos')).toBe(false);
+    cache.primeDir('/s/a/photos', ['p1.jpg', 'p2.png', 'legacy', 'session.json.tmp'], '/');
+    expect(cache.isPrimed('/s/a/photos')).toBe(true);
+    expect(cache.get('/s/a/photos/p1')).toBe('.jpg');
+    expect(cache.get('/s/a/photos/p2')).toBe('.png');
+    expect(cache.get('/s/a/photos/legacy')).toBe('');
+    expect(cache.size).toBe(3);
+  });
+
+  it('prefers the extension probing would find first', () => {
+    const cache = createPhotoExtCache();
+    cache.primeDir('/s/a/photos', ['p1.png', 'p1.jpg'], '/');
+    expect(cache.get('/s/a/photos/p1')).toBe('.jpg');
+  });
+
+  it('forgets the primed flag when the directory is cleared', () => {
+    const cache = createPhotoExtCache();
+    cache.primeDir('/s/a/photos', ['p1.jpg'], '/');
+    cache.deleteUnder('/s/a', '/');
+    expect(cache.isPrimed('/s/a/photos')).toBe(false);
+    expect(cache.get('/s/a/photos/p1')).toBeUndefined();
+  });
+});
@@ -0,0 +1,239 @@
+// JSON file codec shared by the Electron main process and the test suite.
+// Every session mutation in photo-helper / map-corridors lands in
+// `storage-write-json`, and the competitions index is rewritten on every
+// create / rename / activate — so these two paths are the hottest disk I/O
+// in the app and are worth keeping in one place.
+//
+// Encoding happens exactly once into a Buffer (no intermediate utf8 string
+// handed to `writeFileSync`, which would re-encode it), and the bytes land
+// via a temp file + rename so a crash or a full disk mid-write can never
+// leave a truncated `session.json` behind. A torn file used to surface as
+// `readJSON → null`, which photo-helper treats as "no session" and the
+// competition silently opened empty.
+//
+// Reads skip the `existsSync` pre-check: a missing file is reported by
+// `readFileSync` itself (ENOENT), so the extra stat syscall bought nothing
+// and left a TOCTOU window between the check and the read.
+//
+// The IPC handlers use the async variants so a large session write doesn't
+// block the main process's event loop — which also services window input,
+// menu shortcuts and every other renderer's IPC. Every handler that writes
+// a path the renderer also writes (session.json, the competitions index)
+// must go through them: only the async writers share the per-path ordering
+// chain, and a sync write can be overtaken by an async one already queued.
+// The sync variants remain for call sites that run outside a handler
+// (startup, config.json).
+
+const fs = require('fs');
+const path = require('path');
+
+const TMP_SUFFIX = '.tmp';
+
+// Async writes can overlap (two renderers, or a session and its index), so
+// each gets its own temp file — a shared `.tmp` name would let one write
+// truncate the other's temp file between its write and its rename.
+let tmpCounter = 0;
+function uniqueTmpPath(filePath) {
+  tmpCounter = (tmpCounter + 1) % Number.MAX_SAFE_INTEGER;
+  return `${filePath}.${process.pid}-${tmpCounter}${TMP_SUFFIX}`;
+}
+
+// Pretty-printing is opt-in for debugging (`AIRQ_PRETTY_JSON=1`). These
+// files are machine-read, and a session's indentation and newlines were
+// close to half its bytes — paid on every write and every read. The web
+// build (OPFSStorage) has always written compact JSON, so this also makes
+// the two backends produce identical files.
+const PRETTY_JSON = process.env.AIRQ_PRETTY_JSON === '1';
+
+// Serialize `data` to a UTF-8 Buffer. Kept separate from the write so the
+// encode cost is paid once even when the caller needs the bytes for more
+// than one destination.
+function encodeJSON(data) {
+  const text = PRETTY_JSON ? JSON.stringify(data, null, 2) : JSON.stringify(data);
+  return Buffer.from(text, 'utf8');
+}
+
+// Encode JSON text the renderer already serialized (`storage-write-json-text`).
+// Written verbatim, except that `AIRQ_PRETTY_JSON=1` re-formats it — session
+// files and the index arrive on this path, so without this the debug switch
+// would affect none of the files the apps actually write.
+function encodeJSONText(text) {
+  return Buffer.from(PRETTY_JSON ? JSON.stringify(JSON.parse(text), null, 2) : text, 'utf8');
+}
+
+// Parse a UTF-8 Buffer (or string) produced by `encodeJSON`.
+function decodeJSON(buf) {
+  return JSON.parse(typeof buf === 'string' ? buf : buf.toString('utf8'));
+}
+
+// Read and parse a JSON file. Returns null when the file does not exist;
+// any other failure (permission, malformed JSON) is thrown so the caller
+// decides whether to log-and-default or propagate.
+function readJSONFileSync(filePath) {
+  let buf;
+  try {
+    buf = fs.readFileSync(filePath);
+  } catch (e) {
+    if (e && e.code === 'ENOENT') return null;
+    throw e;
+  }
+  return decodeJSON(buf);
+}
+
+// Write `data` as JSON to `filePath` atomically: the payload goes to a
+// sibling `.tmp` file first and is then renamed over the target. `rename`
+// within one directory is atomic on NTFS and POSIX filesystems, so readers
+// observe either the old or the new content — never a prefix.
+function writeJSONFileSync(filePath, data) {
+  const payload = encodeJSON(data);
+  const tmpPath = filePath + TMP_SUFFIX;
+  try {
+    fs.writeFileSync(tmpPath, payload);
+    fs.renameSync(tmpPath, filePath);
+  } catch (e) {
+    try { fs.rmSync(tmpPath, { force: true }); } catch { /* best-effort */ }
+    throw e;
+  }
+}
+
+// Async counterpart of `readJSONFileSync`.
+async function readJSONFile(filePath) {
+  let buf;
+  try {
+    buf = await fs.promises.readFile(filePath);
+  } catch (e) {
+    if (e && e.code === 'ENOENT') return null;
+    throw e;
+  }
+  return decodeJSON(buf);
+}
+
+// Read a JSON file as UTF-8 text without parsing it. Returns null when the
+// file does not exist. Backs `storage-read-json-text`: the renderer parses
+// the string itself, so the main process neither parses the session nor
+// structured-clones the resulting object graph back across IPC.
+async function readJSONText(filePath) {
+  try {
+    return await fs.promises.readFile(filePath, 'utf8');
+  } catch (e) {
+    if (e && e.code === 'ENOENT') return null;
+    throw e;
+  }
+}
+
+// Tail of the pending-write chain per target path. Overlapping writes to
+// the SAME file run one after another in submission order; writes to
+// different files (other competitions, a session and its index) still run
+// in parallel. Without this, a large write submitted first could finish its
+// rename after a small one submitted later, and the older content would win.
+// Entries are removed once a path's chain drains, so the map only holds
+// files with a write in flight.
+const writeChains = new Map();
+
+function serializeWrites(filePath, task) {
+  const prev = writeChains.get(filePath) || Promise.resolve();
+  const run = prev.then(task);
+  const tail = run.catch(() => { /* the caller sees the rejection via `run` */ });
+  writeChains.set(filePath, tail);
+  tail.then(() => {
+    if (writeChains.get(filePath) === tail) writeChains.delete(filePath);
+  });
+  return run;
+}
+
+// Write `payload` (Buffer or string) to `filePath` atomically, async. Each
+// call uses its own temp file (see `uniqueTmpPath`), and calls for the same
+// path are applied in order (see `serializeWrites`). Also used for photo
+// bytes, where a torn write would leave a truncated JPEG that the renderer
+// loads as a half-grey image with no error.
+function writeFileAtomic(filePath, payload) {
+  return serializeWrites(filePath, () => replaceFileAtomic(filePath, payload));
+}
+
+// Temp file + rename, with no ordering of its own — callers go through
+// `serializeWrites`.
+async function replaceFileAtomic(filePath, payload) {
+  const tmpPath = uniqueTmpPath(filePath);
+  try {
+    await fs.promises.writeFile(tmpPath, payload);
+    await fs.promises.rename(tmpPath, filePath);
+  } catch (e) {
+    await fs.promises.rm(tmpPath, { force: true }).catch(() => { /* best-effort */ });
+    throw e;
+  }
+}
+
+// Read-modify-write `filePath` in the same per-path chain as
+// `writeFileAtomic`: `update` runs only after every earlier write to the
+// path has landed, and no later one starts until its result is written.
+// `update` reads the file itself (so callers keep their own fallback for a
+// missing or malformed file) and returns the data to write, or undefined
+// to leave the file alone. A throw rejects without writing.
+function updateJSONFile(filePath, update) {
+  return serializeWrites(filePath, async () => {
+    const data = await update();
+    if (data !== undefined) await replaceFileAtomic(filePath, encodeJSON(data));
+  });
+}
+
+// Async counterpart of `writeJSONFileSync`.
+async function writeJSONFile(filePath, data) {
+  await writeFileAtomic(filePath, encodeJSON(data));
+}
+
+// Temp files older than this are leftovers from a write that never reached
+// its rename (crash, power loss, killed process) — no live write takes
+// anywhere near a day, so deleting them cannot race an in-flight rename.
+const STALE_TMP_AGE_MS = 24 * 60 * 60 * 1000;
+
+// Delete stale `*.tmp` leftovers under `rootDir`. Without this they would
+// accumulate forever next to `session.json` / the competitions index, each
+// one a full session-sized copy — and in `photos/`, where photo saves go
+// through `writeFileAtomic` too, a crash mid-save leaves a multi-MB orphan
+// that `storage-get-stats` keeps counting. `photos/` directories are listed
+// but not recursed into: they are by far the largest directories, and
+// photos are stored flat. Best-effort throughout — returns the number of
+// files removed.
+async function pruneStaleTempFiles(rootDir, maxAgeMs = STALE_TMP_AGE_MS, now = Date.now()) {
+  let removed = 0;
+  const walk = async (dir, recurse = true) => {
+    let entries;
+    try {
+      entries = await fs.promises.readdir(dir, { withFileTypes: true });
+    } catch {
+      return;
+    }
+    for (const entry of entries) {
+      const entryPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        if (recurse) await walk(entryPath, entry.name !== 'photos');
+        continue;
+      }
+      if (!entry.isFile() || !entry.name.endsWith(TMP_SUFFIX)) continue;
+      try {
+        const { mtimeMs } = await fs.promises.stat(entryPath);
+        if (now - mtimeMs < maxAgeMs) continue;
+        await fs.promises.unlink(entryPath);
+        removed++;
+      } catch { /* best-effort */ }
+    }
+  };
+  await walk(rootDir);
+  return removed;
+}
+
+module.exports = {
+  TMP_SUFFIX,
+  STALE_TMP_AGE_MS,
+  pruneStaleTempFiles,
+  encodeJSON,
+  encodeJSONText,
+  decodeJSON,
+  readJSONFileSync,
+  writeJSONFileSync,
+  readJSONFile,
+  readJSONText,
+  writeJSONFile,
+  updateJSONFile,
+  writeFileAtomic,
+};
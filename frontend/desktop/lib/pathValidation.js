@@ -12,6 +12,13 @@ const path = require('path');
 
 const MAX_USER_PATH_LEN = 4096;
 
+// Patterns for `sanitizeFileName`, compiled once: it runs for every id that
+// reaches a storage path (each photo save / load / delete), and the
+// control-char pattern used to be rebuilt with `new RegExp` on every call.
+const SEPARATOR_RE = /[\\/]/g;
+const CONTROL_CHAR_RE = new RegExp('[\\u0000-\\u001F\\u007F]', 'g');
+const UNSAFE_CHAR_RE = /[^A-Za-z0-9._-]/g;
+
 // Strip path separators, control chars, and non-`[A-Za-z0-9._-]` content,
 // then truncate to 128. Falls back to `'file'` if every char gets stripped
 // (e.g. an all-whitespace input).
@@ -20,10 +27,10 @@ function sanitizeFileName(input) {
   // Order matters: replace separators with `-` BEFORE the strict allowlist
   // pass below so a `..\..\evil` payload becomes `..-..--evil`, not `evil`.
   const stripped = input
-    .replace(/[\\/]/g, '-')
-    .replace(new RegExp('[\\u0000-\\u001F\\u007F]', 'g'), '')
+    .replace(SEPARATOR_RE, '-')
+    .replace(CONTROL_CHAR_RE, '')
     .trim();
-  const normalized = stripped.replace(/[^A-Za-z0-9._-]/g, '-');
+  const normalized = stripped.replace(UNSAFE_CHAR_RE, '-');
   const truncated = normalized.slice(0, 128);
   return truncated.length > 0 ? truncated : 'file';
 }
@@ -56,20 +63,36 @@ function validateUserDir(input) {
   return abs;
 }
 
+// Resolved root (and its separator-terminated prefix) from the previous
+// `validateStoragePath` call. Every storage IPC call — each photo and JSON
+// read/write — validates against the same root, so it is resolved once
+// rather than per call.
+let lastRoot = null;
+let lastResolvedRoot = '';
+let lastRootPrefix = '';
+
 // Validate that a path is within the allowed storage directory (prevent path
 // traversal). Lexical containment via `path.resolve` + `startsWith(rootPath +
 // path.sep)` — the trailing-separator check prevents prefix-confusion bugs
 // like `/foo/bar` matching `/foo/barbaz`. Accepts a `rootPath` so tests can
 // inject a tmpdir without depending on Electron's `app.getPath('userData')`.
 function validateStoragePath(inputPath, rootPath) {
-  const resolvedRoot = path.resolve(rootPath);
+  if (rootPath !== lastRoot) {
+    lastResolvedRoot = path.resolve(rootPath);
+    lastRootPrefix = lastResolvedRoot + path.sep;
+    lastRoot = rootPath;
+  }
+  const resolvedRoot = lastResolvedRoot;
   const resolved = path.resolve(inputPath);
-  if (!resolved.startsWith(resolvedRoot + path.sep) && resolved !== resolvedRoot) {
+  if (!resolved.startsWith(lastRootPrefix) && resolved !== resolvedRoot) {
     throw new Error('Access denied: path outside storage directory');
   }
   return resolved;
 }
 
+// Strip-regex per extension, built on first use (three exts in practice).
+const extStripRes = new Map();
+
 // Sanitise a renderer-supplied export filename and force a known extension,
 // falling back to `fallback` when the renderer didn't supply a usable name
 // OR when sanitisation reduced the body to empty.
@@ -88,7 +111,11 @@ function coerceExportFileName(rendererName, ext, fallback) {
   if (!/^[a-z0-9]+$/i.test(ext)) {
     throw new Error('coerceExportFileName: ext must be alphanumeric');
   }
-  const extRe = new RegExp('\\.' + ext + '$', 'i');
+  let extRe = extStripRes.get(ext);
+  if (!extRe) {
+    extRe = new RegExp('\\.' + ext + '$', 'i');
+    extStripRes.set(ext, extRe);
+  }
   const body = sanitizeFileName(rendererName).replace(extRe, '');
   return body.length > 0 ? body + '.' + ext : fallback;
 }
@@ -0,0 +1,157 @@
+// Photo-file helpers shared by the Electron main process and the test suite.
+// The storage IPC handlers (`storage-save-photo`, `storage-get-photo`,
+// `storage-delete-photo`) live in main.js because they need Electron's
+// `app` paths; the byte/extension handling they share is pure and lives
+// here so it can be unit-tested directly.
+
+// Normalise the photo payload received over IPC into a Buffer.
+//
+// The renderer sends the raw bytes as a Uint8Array: Electron's structured
+// clone copies typed arrays as-is, so the photo crosses the process
+// boundary once as binary. The previous transport was a base64 string built
+// with FileReader.readAsDataURL — 33% larger, encoded in the renderer and
+// decoded again here, i.e. two extra full passes over every multi-MB photo.
+// Base64 strings are still accepted so an older renderer bundle paired with
+// a newer main process keeps working.
+//
+// `Buffer.from(arrayBuffer, offset, length)` wraps the cloned memory
+// without another copy.
+function toPhotoBuffer(data) {
+  if (typeof data === 'string') return Buffer.from(data, 'base64');
+  if (Buffer.isBuffer(data)) return data;
+  if (ArrayBuffer.isView(data)) return Buffer.from(data.buffer, data.byteOffset, data.byteLength);
+  if (data instanceof ArrayBuffer) return Buffer.from(data);
+  throw new TypeError('Unsupported photo payload');
+}
+
+// Extensions a stored photo may carry, in the order they are probed when the
+// extension is not known. '' covers files written by very old builds.
+const PHOTO_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp', ''];
+
+// File extension used when saving a photo of the given MIME type.
+function extForMimeType(mimeType) {
+  if (mimeType) {
+    if (mimeType.includes('png')) return '.png';
+    if (mimeType.includes('gif')) return '.gif';
+    if (mimeType.includes('webp')) return '.webp';
+  }
+  return '.jpg';
+}
+
+// MIME type reported back to the renderer for a stored extension.
+function mimeTypeForExt(ext) {
+  if (ext === '.png') return 'image/png';
+  if (ext === '.gif') return 'image/gif';
+  if (ext === '.webp') return 'image/webp';
+  return 'image/jpeg';
+}
+
+// Remembers which extension each stored photo was written with, keyed by
+// the extension-less path (`<photosPath>/<photoId>`).
+//
+// A photo id is immutable once saved, yet `storage-get-photo` used to probe
+// `.jpg`, `.jpeg`, `.png`, … with a failing `open` per miss on every load —
+// a PNG-heavy session paid three ENOENT round-trips per photo on each
+// competition switch. The cache is only a hint: a stale entry falls back to
+// probing, so correctness never depends on invalidation being perfect.
+//
+// It lives for the whole main-process lifetime and every competition ever
+// opened adds its photos, so it is bounded: past `maxEntries` the least
+// recently used entry is dropped (Map iteration order is insertion order,
+// and a hit re-inserts its key). An evicted photo simply probes again.
+const PHOTO_EXT_CACHE_MAX = 5000;
+
+function createPhotoExtCache(maxEntries = PHOTO_EXT_CACHE_MAX) {
+  const exts = new Map();
+  // Directories whose listing has already been folded in via `primeDir`.
+  const primedDirs = new Set();
+  const remember = (basePath, ext) => {
+    exts.delete(basePath);
+    exts.set(basePath, ext);
+    if (exts.size > maxEntries) exts.delete(exts.keys().next().value);
+  };
+  return {
+    get: (basePath) => {
+      const ext = exts.get(basePath);
+      if (ext !== undefined) remember(basePath, ext);
+      return ext;
+    },
+    set: remember,
+    delete: (basePath) => { exts.delete(basePath); },
+    // Drop every entry under `dirPath` (directory cleared or session deleted).
+    deleteUnder: (dirPath, sep) => {
+      const prefix = dirPath.endsWith(sep) ? dirPath : dirPath + sep;
+      for (const key of exts.keys()) {
+        if (key.startsWith(prefix)) exts.delete(key);
+      }
+      for (const dir of primedDirs) {
+        if (dir === dirPath || dir.startsWith(prefix)) primedDirs.delete(dir);
+      }
+    },
+    isPrimed: (dirPath) => primedDirs.has(dirPath),
+    // Record the extension of every photo in a directory listing at once.
+    // A competition load asks for each photo in turn; on a cold cache one
+    // `readdir` answers all of them, instead of each photo paying its own
+    // probe sequence. When a photo exists under two extensions (re-saved
+    // with a different type) the one earlier in PHOTO_EXTENSIONS wins, as
+    // it would when probing.
+    primeDir: (dirPath, names, sep) => {
+      primedDirs.add(dirPath);
+      const prefix = dirPath.endsWith(sep) ? dirPath : dirPath + sep;
+      for (const name of names) {
+        const dot = name.lastIndexOf('.');
+        const ext = dot > 0 ? name.slice(dot) : '';
+        if (!PHOTO_EXTENSIONS.includes(ext)) continue;
+        const basePath = prefix + (dot > 0 ? name.slice(0, dot) : name);
+        const known = exts.get(basePath);
+        if (known === undefined || PHOTO_EXTENSIONS.indexOf(ext) < PHOTO_EXTENSIONS.indexOf(known)) {
+          remember(basePath, ext);
+        }
+      }
+    },
+    get size() { return exts.size; },
+  };
+}
+
+// Probe order for a photo: the cached extension first (when known), then the
+// full list without repeating it.
+function photoExtCandidates(cachedExt) {
+  if (cachedExt === undefined) return PHOTO_EXTENSIONS;
+  return [cachedExt, ...PHOTO_EXTENSIONS.filter(ext => ext !== cachedExt)];
+}
+
+// Identify a JPEG or PNG from its leading bytes. Returns the MIME type, or
+// null when the header matches neither.
+//
+// The extension allowlist alone lets a renamed `.txt` / `.heic` through to
+// the renderer, which then decodes the base64, builds a File, persists it
+// into the session and only fails at `<img>` decode time — leaving a broken
+// slot behind. Comparing a handful of signature bytes rejects those up
+// front without decoding anything, and also reports the true type when a
+// PNG was saved with a `.jpg` name (common with phone screenshot exports).
+const JPEG_SIGNATURE = [0xff, 0xd8, 0xff];
+const PNG_SIGNATURE = [0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a];
+
+function startsWith(buf, signature) {
+  if (!buf || buf.length < signature.length) return false;
+  for (let i = 0; i < signature.length; i++) {
+    if (buf[i] !== signature[i]) return false;
+  }
+  return true;
+}
+
+function sniffImageType(buf) {
+  if (startsWith(buf, JPEG_SIGNATURE)) return 'image/jpeg';
+  if (startsWith(buf, PNG_SIGNATURE)) return 'image/png';
+  return null;
+}
+
+module.exports = {
+  toPhotoBuffer,
+  sniffImageType,
+  PHOTO_EXTENSIONS,
+  extForMimeType,
+  mimeTypeForExt,
+  createPhotoExtCache,
+  photoExtCandidates,
+};
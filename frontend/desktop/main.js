@@ -30,23 +30,33 @@ function getConfigPath() {
   return path.join(app.getPath('userData'), 'config.json');
 }
 
-// Load config from file
+// Last config read from / written to disk. The main process is the only
+// writer of config.json, so after the first read every `getConfigValue`
+// (map tokens, active competition, window state — several per navigation)
+// is answered from memory instead of a synchronous read + parse on the
+// event loop.
+let configCache = null;
+
+// Load config from file. Returns a copy, so callers can mutate it freely;
+// the cache only changes once `saveConfig` has persisted the new value.
 function loadConfig() {
-  try {
-    const configPath = getConfigPath();
-    if (fs.existsSync(configPath)) {
-      return JSON.parse(fs.readFileSync(configPath, 'utf8'));
+  if (!configCache) {
+    try {
+      configCache = readJSONFileSync(getConfigPath()) || {};
+    } catch (e) {
+      console.error('Failed to load config:', e);
+      return {};
     }
-  } catch (e) {
-    console.error('Failed to load config:', e);
   }
-  return {};
+  return { ...configCache };
 }
 
-// Save config to file
+// Save config to file. Atomic (temp file + rename): a torn config.json
+// would silently drop the user's map API tokens and active competition.
 function saveConfig(config) {
   try {
-    fs.writeFileSync(getConfigPath(), JSON.stringify(config, null, 2));
+    writeJSONFileSync(getConfigPath(), config);
+    configCache = { ...config };
     return true;
   } catch (e) {
     console.error('Failed to save config:', e);
@@ -317,8 +327,15 @@ safeHandle('set-menu-locale', (event, locale) => {
 // ============================================================================
 
 // Get the base path for photo sessions storage
+// Resolved once: every storage IPC call validates against this root, and
+// `app.getPath` is a native call into Electron. The app never calls
+// `app.setPath('userData')`, so the value cannot change after first use.
+let photoSessionsPath = null;
 function getPhotoSessionsPath() {
-  return path.join(app.getPath('userData'), 'photo-sessions');
+  if (photoSessionsPath === null) {
+    photoSessionsPath = path.join(app.getPath('userData'), 'photo-sessions');
+  }
+  return photoSessionsPath;
 }
 
 // Path validators (sanitizeFileName, validateUserDir, validateStoragePath,
@@ -333,6 +350,29 @@ const {
   validateStoragePath: validateStoragePathPure,
   coerceExportFileName,
 } = require('./lib/pathValidation');
+const {
+  readJSONFileSync,
+  writeJSONFileSync,
+  readJSONFile,
+  readJSONText,
+  writeJSONFile,
+  updateJSONFile,
+  writeFileAtomic,
+  encodeJSONText,
+  pruneStaleTempFiles,
+} = require('./lib/jsonFile');
+const {
+  toPhotoBuffer,
+  sniffImageType,
+  extForMimeType,
+  mimeTypeForExt,
+  createPhotoExtCache,
+  photoExtCandidates,
+} = require('./lib/photoFiles');
+
+// Stored extension per photo, so `storage-get-photo` opens the right file
+// first instead of probing every extension (see lib/photoFiles.js).
+const photoExtCache = createPhotoExtCache();
 
 // Convenience wrapper that pins the storage root to the photo-sessions
 // directory — every existing call site uses this root.
@@ -435,7 +475,7 @@ safeHandle('sample-read-file', async (_event, name) => {
   if (filePath !== dir && !filePath.startsWith(dir + path.sep)) {
     throw new Error('sample-read-file: traversal');
   }
-  return fs.readFileSync(filePath).toString('base64');
+  return (await fs.promises.readFile(filePath)).toString('base64');
 });
 
 function isSampleAvailable() {
@@ -497,7 +537,7 @@ function ensureSampleCompetition() {
         id: SAMPLE_COMP_ID, name, discipline: 'rally',
         createdAt: now, lastModified: now, photoCount, isActive: false,
       });
-      writeCompetitionsIndex(index);
+      writeCompetitionsIndexSync(index);
       console.log(`[sample] preloaded finalized competition copied (${photoCount} photos)`);
       return;
     }
@@ -513,13 +553,13 @@ function ensureSampleCompetition() {
       setsTrack: { set1: { title: 'SP - TPX', photos: [] }, set2: { title: 'TPX - FP', photos: [] } },
       setsTurning: { set1: { title: '', photos: [] }, set2: { title: '', photos: [] } },
     };
-    fs.writeFileSync(path.join(compDir, 'session.json'), JSON.stringify(emptySession, null, 2), 'utf8');
+    writeJSONFileSync(path.join(compDir, 'session.json'), emptySession);
     fs.writeFileSync(path.join(compDir, '.sample-pending'), '1', 'utf8');
     index.competitions.push({
       id: SAMPLE_COMP_ID, name, discipline: 'rally',
       createdAt: now, lastModified: now, photoCount: 0, isActive: false,
     });
-    writeCompetitionsIndex(index);
+    writeCompetitionsIndexSync(index);
     console.log('[sample] preloaded competition created (pending import):', SAMPLE_COMP_ID);
   } catch (e) {
     console.warn('[sample] ensureSampleCompetition failed:', e);
@@ -577,13 +617,24 @@ function ensureDir(dirPath) {
   return dirPath;
 }
 
+// Async variant for IPC handlers — `mkdir({ recursive: true })` is a no-op on
+// an existing directory, so no `existsSync` pre-check is needed.
+async function ensureDirAsync(dirPath) {
+  await fs.promises.mkdir(dirPath, { recursive: true });
+  return dirPath;
+}
+
+// Storage IPC handlers below use `fs.promises` throughout: they run on the
+// main process's event loop, which also drives window input, menus and
+// every other renderer's IPC. A multi-MB photo write or a recursive size
+// walk done synchronously here froze the whole app for its duration.
+
 // Initialize storage - create root and sessions directories
 safeHandle('storage-init', async () => {
   const rootPath = getPhotoSessionsPath();
   const sessionsPath = path.join(rootPath, 'sessions');
 
-  ensureDir(rootPath);
-  ensureDir(sessionsPath);
+  await ensureDirAsync(sessionsPath);
 
   return { rootPath, sessionsPath };
 });
@@ -594,8 +645,7 @@ safeHandle('storage-ensure-session-dirs', async (event, sessionId) => {
   const dirPath = path.join(sessionsPath, sanitizeFileName(sessionId));
   const photosPath = path.join(dirPath, 'photos');
 
-  ensureDir(dirPath);
-  ensureDir(photosPath);
+  await ensureDirAsync(photosPath);
 
   return { dirPath, photosPath };
 });
@@ -605,7 +655,17 @@ safeHandle('storage-write-json', async (event, dirPath, name, data) => {
   const safeDirPath = validateStoragePath(dirPath);
   const safeName = sanitizeFileName(name);
   const filePath = path.join(safeDirPath, safeName);
-  fs.writeFileSync(filePath, JSON.stringify(data, null, 2), 'utf8');
+  await writeJSONFile(filePath, data);
+});
+
+// Write a JSON document the renderer has already serialized. Skips the
+// object-graph rebuild + JSON.stringify that `storage-write-json` does in
+// the main process.
+safeHandle('storage-write-json-text', async (event, dirPath, name, text) => {
+  if (typeof text !== 'string') throw new Error('Invalid JSON payload');
+  const safeDirPath = validateStoragePath(dirPath);
+  const safeName = sanitizeFileName(name);
+  await writeFileAtomic(path.join(safeDirPath, safeName), encodeJSONText(text));
 });
 
 // Read JSON from a file
@@ -614,58 +674,96 @@ safeHandle('storage-read-json', async (event, dirPath, name) => {
   const safeName = sanitizeFileName(name);
   const filePath = path.join(safeDirPath, safeName);
   try {
-    if (fs.existsSync(filePath)) {
-      const content = fs.readFileSync(filePath, 'utf8');
-      return JSON.parse(content);
-    }
+    return await readJSONFile(filePath);
   } catch (e) {
     console.error('Failed to read JSON:', e);
   }
   return null;
 });
 
-// Save a photo file (receives base64 data)
-safeHandle('storage-save-photo', async (event, photosPath, photoId, base64Data, mimeType) => {
+// Read a JSON file as text for the renderer to parse. Counterpart of
+// `storage-write-json-text`: `storage-read-json` parses the session here and
+// then structured-clones the object graph back, both on the thread that
+// serves every window's IPC; a string crosses as one flat copy.
+safeHandle('storage-read-json-text', async (event, dirPath, name) => {
+  const safeDirPath = validateStoragePath(dirPath);
+  const safeName = sanitizeFileName(name);
+  try {
+    return await readJSONText(path.join(safeDirPath, safeName));
+  } catch (e) {
+    console.error('Failed to read JSON:', e);
+  }
+  return null;
+});
+
+// Save a photo file (receives raw bytes; base64 accepted for older renderers)
+safeHandle('storage-save-photo', async (event, photosPath, photoId, data, mimeType) => {
   const safePhotosPath = validateStoragePath(photosPath);
   const safeId = sanitizeFileName(photoId);
 
-  // Determine file extension from mime type
-  let ext = '.jpg';
-  if (mimeType) {
-    if (mimeType.includes('png')) ext = '.png';
-    else if (mimeType.includes('gif')) ext = '.gif';
-    else if (mimeType.includes('webp')) ext = '.webp';
-  }
+  const ext = extForMimeType(mimeType);
+  const basePath = path.join(safePhotosPath, safeId);
+  await writeFileAtomic(basePath + ext, toPhotoBuffer(data));
+  photoExtCache.set(basePath, ext);
+});
 
-  const filePath = path.join(safePhotosPath, safeId + ext);
-  const buffer = Buffer.from(base64Data, 'base64');
-  fs.writeFileSync(filePath, buffer);
+// Save a batch of photos in one round-trip. A multi-photo import used to
+// cost one IPC hop per photo, each awaited before the next was sent; here
+// the renderer submits the batch once and the writes are issued together,
+// so libuv's threadpool overlaps them. Per-photo failures are reported back
+// by id instead of failing the whole batch.
+safeHandle('storage-save-photos', async (event, photosPath, entries) => {
+  const safePhotosPath = validateStoragePath(photosPath);
+  if (!Array.isArray(entries)) throw new Error('Invalid photo batch');
+
+  const failed = [];
+  await Promise.all(entries.map(async (entry) => {
+    const photoId = entry && entry.photoId;
+    try {
+      const safeId = sanitizeFileName(photoId);
+      const ext = extForMimeType(entry.mimeType);
+      const basePath = path.join(safePhotosPath, safeId);
+      await writeFileAtomic(basePath + ext, toPhotoBuffer(entry.data));
+      photoExtCache.set(basePath, ext);
+    } catch (e) {
+      console.error(`Failed to save photo ${photoId}:`, e);
+      failed.push(String(photoId));
+    }
+  }));
+  return { failed };
 });
 
-// Get a photo as base64
+// Get a photo's raw bytes: resolves to { data: Buffer, mimeType }, or null
 safeHandle('storage-get-photo', async (event, photosPath, photoId) => {
   const safePhotosPath = validateStoragePath(photosPath);
   const safeId = sanitizeFileName(photoId);
 
-  // Try different extensions
-  const extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', ''];
+  const basePath = path.join(safePhotosPath, safeId);
 
-  for (const ext of extensions) {
-    const filePath = path.join(safePhotosPath, safeId + ext);
-    if (fs.existsSync(filePath)) {
-      const buffer = fs.readFileSync(filePath);
-      const base64 = buffer.toString('base64');
-
-      // Determine mime type from extension
-      let mimeType = 'image/jpeg';
-      if (ext === '.png') mimeType = 'image/png';
-      else if (ext === '.gif') mimeType = 'image/gif';
-      else if (ext === '.webp') mimeType = 'image/webp';
+  // Cold cache: list the photos directory once and learn every photo's
+  // extension, so the rest of this competition's load opens files directly.
+  if (photoExtCache.get(basePath) === undefined && !photoExtCache.isPrimed(safePhotosPath)) {
+    try {
+      photoExtCache.primeDir(safePhotosPath, await fs.promises.readdir(safePhotosPath), path.sep);
+    } catch { /* fall back to probing */ }
+  }
 
-      return { base64, mimeType };
+  for (const ext of photoExtCandidates(photoExtCache.get(basePath))) {
+    let buffer;
+    try {
+      buffer = await fs.promises.readFile(basePath + ext);
+    } catch (e) {
+      if (e && e.code === 'ENOENT') continue;
+      throw e;
     }
+    photoExtCache.set(basePath, ext);
+    // Raw bytes: the Buffer crosses IPC as a Uint8Array via structured clone.
+    // Base64 made every photo of every load 33% larger on the wire, plus an
+    // encode pass here and a decode pass in the renderer.
+    return { data: buffer, mimeType: mimeTypeForExt(ext) };
   }
 
+  photoExtCache.delete(basePath);
   return null;
 });
 
@@ -674,14 +772,18 @@ safeHandle('storage-delete-photo', async (event, photosPath, photoId) => {
   const safePhotosPath = validateStoragePath(photosPath);
   const safeId = sanitizeFileName(photoId);
 
-  // Try different extensions
-  const extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', ''];
+  const basePath = path.join(safePhotosPath, safeId);
+  const cachedExt = photoExtCache.get(basePath);
+  photoExtCache.delete(basePath);
 
-  for (const ext of extensions) {
-    const filePath = path.join(safePhotosPath, safeId + ext);
-    if (fs.existsSync(filePath)) {
-      fs.unlinkSync(filePath);
+  for (const ext of photoExtCandidates(cachedExt)) {
+    const filePath = basePath + ext;
+    try {
+      await fs.promises.unlink(filePath);
       return;
+    } catch (e) {
+      if (e && e.code === 'ENOENT') continue;
+      throw e;
     }
   }
 });
@@ -689,15 +791,20 @@ safeHandle('storage-delete-photo', async (event, photosPath, photoId) => {
 // Clear a directory (remove all contents)
 safeHandle('storage-clear-directory', async (event, dirPath) => {
   const safeDirPath = validateStoragePath(dirPath);
-  if (fs.existsSync(safeDirPath)) {
-    const entries = fs.readdirSync(safeDirPath, { withFileTypes: true });
-    for (const entry of entries) {
-      const entryPath = path.join(safeDirPath, entry.name);
-      if (entry.isDirectory()) {
-        fs.rmSync(entryPath, { recursive: true, force: true });
-      } else {
-        fs.unlinkSync(entryPath);
-      }
+  photoExtCache.deleteUnder(safeDirPath, path.sep);
+  let entries;
+  try {
+    entries = await fs.promises.readdir(safeDirPath, { withFileTypes: true });
+  } catch (e) {
+    if (e && e.code === 'ENOENT') return;
+    throw e;
+  }
+  for (const entry of entries) {
+    const entryPath = path.join(safeDirPath, entry.name);
+    if (entry.isDirectory()) {
+      await fs.promises.rm(entryPath, { recursive: true, force: true });
+    } else {
+      await fs.promises.unlink(entryPath);
     }
   }
 });
@@ -707,9 +814,9 @@ safeHandle('storage-delete-session', async (event, sessionId) => {
   const sessionsPath = path.join(getPhotoSessionsPath(), 'sessions');
   const sessionPath = path.join(sessionsPath, sanitizeFileName(sessionId));
 
-  if (fs.existsSync(sessionPath)) {
-    fs.rmSync(sessionPath, { recursive: true, force: true });
-  }
+  photoExtCache.deleteUnder(sessionPath, path.sep);
+  // `force: true` is a no-op on a non-existent path.
+  await fs.promises.rm(sessionPath, { recursive: true, force: true });
 });
 
 // Get a directory handle (create if needed)
@@ -719,8 +826,8 @@ safeHandle('storage-get-directory', async (event, parentPath, name, create) => {
   const dirPath = path.join(safeParentPath, safeName);
 
   if (create) {
-    ensureDir(dirPath);
-  } else if (!fs.existsSync(dirPath)) {
+    await ensureDirAsync(dirPath);
+  } else if (!(await fs.promises.stat(dirPath).then(() => true, () => false))) {
     throw new Error(`Directory not found: ${dirPath}`);
   }
 
@@ -730,11 +837,13 @@ safeHandle('storage-get-directory', async (event, parentPath, name, create) => {
 // List directory contents
 safeHandle('storage-list-directory', async (event, dirPath) => {
   const safeDirPath = validateStoragePath(dirPath);
-  if (!fs.existsSync(safeDirPath)) {
-    return [];
+  let entries;
+  try {
+    entries = await fs.promises.readdir(safeDirPath, { withFileTypes: true });
+  } catch (e) {
+    if (e && e.code === 'ENOENT') return [];
+    throw e;
   }
-
-  const entries = fs.readdirSync(safeDirPath, { withFileTypes: true });
   return entries.map(entry => ({
     name: entry.name,
     isDirectory: entry.isDirectory()
@@ -749,19 +858,22 @@ safeHandle('storage-get-stats', async () => {
     // Calculate actual usage by walking the directory
     let totalSize = 0;
 
-    function calculateDirSize(dirPath) {
-      if (!fs.existsSync(dirPath)) return 0;
+    async function calculateDirSize(dirPath) {
+      let entries;
+      try {
+        entries = await fs.promises.readdir(dirPath, { withFileTypes: true });
+      } catch {
+        return 0;
+      }
 
       let size = 0;
-      const entries = fs.readdirSync(dirPath, { withFileTypes: true });
-
       for (const entry of entries) {
         const entryPath = path.join(dirPath, entry.name);
         if (entry.isDirectory()) {
-          size += calculateDirSize(entryPath);
+          size += await calculateDirSize(entryPath);
         } else {
           try {
-            const stats = fs.statSync(entryPath);
+            const stats = await fs.promises.stat(entryPath);
             size += stats.size;
           } catch {
             // Ignore errors for individual files
@@ -772,7 +884,7 @@ safeHandle('storage-get-stats', async () => {
       return size;
     }
 
-    totalSize = calculateDirSize(rootPath);
+    totalSize = await calculateDirSize(rootPath);
 
     // For native filesystem, we don't have a strict quota
     // Return null for quota to indicate unlimited
@@ -799,20 +911,36 @@ function getCompetitionsIndexPath() {
 function readCompetitionsIndex() {
   const indexPath = getCompetitionsIndexPath();
   try {
-    if (fs.existsSync(indexPath)) {
-      return JSON.parse(fs.readFileSync(indexPath, 'utf8'));
-    }
+    const index = readJSONFileSync(indexPath);
+    if (index) return index;
   } catch (e) {
     console.error('Failed to read competitions index:', e);
   }
   return { competitions: [], activeCompetitionId: null, version: 1 };
 }
 
-function writeCompetitionsIndex(index) {
+// Startup only (`ensureSampleCompetition`, before any window exists). IPC
+// handlers use `updateCompetitionsIndex`: the renderer writes this file too,
+// through `storage-write-json-text`, and only the async writers share the
+// per-path ordering chain in lib/jsonFile.js.
+function writeCompetitionsIndexSync(index) {
   const rootPath = getPhotoSessionsPath();
   ensureDir(rootPath);
-  const indexPath = getCompetitionsIndexPath();
-  fs.writeFileSync(indexPath, JSON.stringify(index, null, 2), 'utf8');
+  writeJSONFileSync(getCompetitionsIndexPath(), index);
+}
+
+// Read-modify-write the index for an IPC handler. `mutate` gets the current
+// index once every earlier write to the file (ours or the renderer's) has
+// landed, and no later write starts before the result is written — so
+// handlers can't lose each other's updates or be overtaken by a stale
+// renderer write. A throw from `mutate` rejects without writing.
+async function updateCompetitionsIndex(mutate) {
+  await ensureDirAsync(getPhotoSessionsPath());
+  await updateJSONFile(getCompetitionsIndexPath(), () => {
+    const index = readCompetitionsIndex();
+    mutate(index);
+    return index;
+  });
 }
 
 // List all competitions
@@ -824,11 +952,13 @@ safeHandle('competition-list', async () => {
 safeHandle('competition-create', async (event, name, workingDir) => {
   const id = `comp-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`;
   const now = new Date().toISOString();
-  const index = readCompetitionsIndex();
 
-  // Create competition directory (validate path to prevent traversal)
+  // Create competition directory (validate path to prevent traversal).
+  // The directory scrub and session.json write below are async: the id is
+  // fresh, so nothing else touches this directory, and the main process
+  // keeps serving other windows' IPC while the disk catches up.
   const competitionsDir = path.join(getPhotoSessionsPath(), 'competitions');
-  ensureDir(competitionsDir);
+  await ensureDirAsync(competitionsDir);
   const compDir = validateStoragePath(path.join(competitionsDir, sanitizeFileName(id)));
   // Defensive scrub (feedback 2026-05-03): the user expects a brand-new
   // competition to start with zero photos / corridors / markers — no
@@ -837,18 +967,16 @@ safeHandle('competition-create', async (event, name, workingDir) => {
   // unlikely, but a previous crashed run could still have left files
   // behind under a colliding id, and we'd rather wipe them than serve a
   // surprising "old photos appeared in my new competition" experience.
-  // `rmSync` with `force: true` is a no-op on non-existent paths.
-  if (fs.existsSync(compDir)) {
-    fs.rmSync(compDir, { recursive: true, force: true });
-  }
-  ensureDir(compDir);
+  // `rm` with `force: true` is a no-op on non-existent paths.
+  await fs.promises.rm(compDir, { recursive: true, force: true });
+  await ensureDirAsync(compDir);
   // Empty `photos/` so photo-helper's first save lands in a clean slot
   // grid. The `corridors/` subdir is intentionally NOT pre-created — it
   // gets initialised on demand by `useCorridorSessionOPFS` the first
   // time the user opens map-corridors for this competition. If we
   // pre-created it with a stale `session.json`, the corridors session
   // would carry forward markers/discipline from whatever was there.
-  ensureDir(path.join(compDir, 'photos'));
+  await ensureDirAsync(path.join(compDir, 'photos'));
 
   // Write empty session.json for photo-helper
   const emptySession = {
@@ -871,10 +999,8 @@ safeHandle('competition-create', async (event, name, workingDir) => {
       set2: { title: '', photos: [] }
     }
   };
-  fs.writeFileSync(path.join(compDir, 'session.json'), JSON.stringify(emptySession, null, 2), 'utf8');
+  await writeJSONFile(path.join(compDir, 'session.json'), emptySession);
 
-  // Set all existing to inactive, add new entry
-  index.competitions.forEach(c => { c.isActive = false; });
   const metadata = {
     id,
     name,
@@ -904,9 +1030,12 @@ safeHandle('competition-create', async (event, name, workingDir) => {
       metadata.workingDirRejected = true;
     }
   }
-  index.competitions.push(metadata);
-  index.activeCompetitionId = id;
-  writeCompetitionsIndex(index);
+  // Set all existing to inactive, add new entry
+  await updateCompetitionsIndex((index) => {
+    index.competitions.forEach(c => { c.isActive = false; });
+    index.competitions.push(metadata);
+    index.activeCompetitionId = id;
+  });
 
   // Store in config for quick access by menu shortcuts
   setConfigValue('activeCompetitionId', id);
@@ -952,14 +1081,15 @@ safeHandle('pick-directory', async (event, defaultDir, title) => {
 
 // Set active competition
 safeHandle('competition-set-active', async (event, id) => {
-  const index = readCompetitionsIndex();
-  index.competitions.forEach(c => { c.isActive = (c.id === id); });
-  const target = index.competitions.find(c => c.id === id);
-  if (!target) {
-    throw new Error(`Competition not found: ${id}`);
-  }
-  index.activeCompetitionId = id;
-  writeCompetitionsIndex(index);
+  let target;
+  await updateCompetitionsIndex((index) => {
+    index.competitions.forEach(c => { c.isActive = (c.id === id); });
+    target = index.competitions.find(c => c.id === id);
+    if (!target) {
+      throw new Error(`Competition not found: ${id}`);
+    }
+    index.activeCompetitionId = id;
+  });
   setConfigValue('activeCompetitionId', id);
   return target;
 });
@@ -981,14 +1111,15 @@ safeHandle('competition-set-working-dir', async (event, id, workingDir) => {
   if (!abs) {
     throw new Error('Invalid working directory');
   }
-  const index = readCompetitionsIndex();
-  const target = index.competitions.find(c => c.id === id);
-  if (!target) {
-    throw new Error(`Competition not found: ${id}`);
-  }
-  target.workingDir = abs;
-  target.lastModified = new Date().toISOString();
-  writeCompetitionsIndex(index);
+  let target;
+  await updateCompetitionsIndex((index) => {
+    target = index.competitions.find(c => c.id === id);
+    if (!target) {
+      throw new Error(`Competition not found: ${id}`);
+    }
+    target.workingDir = abs;
+    target.lastModified = new Date().toISOString();
+  });
   return target;
 });
 
@@ -1010,14 +1141,15 @@ safeHandle('competition-set-discipline', async (event, id, discipline) => {
   if (discipline !== 'precision' && discipline !== 'rally') {
     throw new Error(`Invalid discipline: ${discipline}`);
   }
-  const index = readCompetitionsIndex();
-  const target = index.competitions.find(c => c.id === id);
-  if (!target) {
-    throw new Error(`Competition not found: ${id}`);
-  }
-  target.discipline = discipline;
-  target.lastModified = new Date().toISOString();
-  writeCompetitionsIndex(index);
+  let target;
+  await updateCompetitionsIndex((index) => {
+    target = index.competitions.find(c => c.id === id);
+    if (!target) {
+      throw new Error(`Competition not found: ${id}`);
+    }
+    target.discipline = discipline;
+    target.lastModified = new Date().toISOString();
+  });
   return target;
 });
 
@@ -1034,14 +1166,15 @@ safeHandle('competition-rename', async (event, id, name) => {
   const trimmed = name.trim().slice(0, 60);
   if (!trimmed) throw new Error('Competition name must not be empty');
 
-  const index = readCompetitionsIndex();
-  const target = index.competitions.find(c => c.id === id);
-  if (!target) {
-    throw new Error(`Competition not found: ${id}`);
-  }
-  target.name = trimmed;
-  target.lastModified = new Date().toISOString();
-  writeCompetitionsIndex(index);
+  let target;
+  await updateCompetitionsIndex((index) => {
+    target = index.competitions.find(c => c.id === id);
+    if (!target) {
+      throw new Error(`Competition not found: ${id}`);
+    }
+    target.name = trimmed;
+    target.lastModified = new Date().toISOString();
+  });
 
   // Keep session.json's competition_name in sync (best-effort — a missing or
   // unreadable session file must not fail the rename, since the index is the
@@ -1050,12 +1183,15 @@ safeHandle('competition-rename', async (event, id, name) => {
     const competitionsDir = path.join(getPhotoSessionsPath(), 'competitions');
     const compDir = validateStoragePath(path.join(competitionsDir, sanitizeFileName(id)));
     const sessionPath = path.join(compDir, 'session.json');
-    if (fs.existsSync(sessionPath)) {
-      const session = JSON.parse(fs.readFileSync(sessionPath, 'utf8'));
+    // Queued behind any in-flight renderer save of the same file, so the
+    // rename applies to the newest session rather than being overwritten.
+    await updateJSONFile(sessionPath, () => {
+      const session = readJSONFileSync(sessionPath);
+      if (!session) return undefined;
       session.competition_name = trimmed;
       session.updatedAt = new Date().toISOString();
-      fs.writeFileSync(sessionPath, JSON.stringify(session, null, 2), 'utf8');
-    }
+      return session;
+    });
   } catch (e) {
     console.error('competition-rename: failed to sync session.json name:', e);
   }
@@ -1065,36 +1201,40 @@ safeHandle('competition-rename', async (event, id, name) => {
 
 // Delete a competition
 safeHandle('competition-delete', async (event, id) => {
-  const index = readCompetitionsIndex();
-  const target = index.competitions.find(c => c.id === id);
+  const target = readCompetitionsIndex().competitions.find(c => c.id === id);
   if (!target) {
     throw new Error(`Competition not found: ${id}`);
   }
 
-  // Delete competition directory (validate path to prevent traversal)
+  // Delete competition directory (validate path to prevent traversal).
+  // Async: a competition holds every photo at full resolution, and a
+  // synchronous recursive delete froze the launcher (and every other IPC
+  // call) for the whole unlink walk. `force` makes a missing dir a no-op.
   const compDir = validateStoragePath(path.join(getPhotoSessionsPath(), 'competitions', sanitizeFileName(id)));
-  if (fs.existsSync(compDir)) {
-    fs.rmSync(compDir, { recursive: true, force: true });
-  }
-
-  // Update index
-  index.competitions = index.competitions.filter(c => c.id !== id);
-  if (index.activeCompetitionId === id) {
-    if (index.competitions.length > 0) {
-      index.competitions[0].isActive = true;
-      index.activeCompetitionId = index.competitions[0].id;
-    } else {
-      index.activeCompetitionId = null;
+  await fs.promises.rm(compDir, { recursive: true, force: true });
+
+  // Update index. Read inside the update, not before the delete: other index
+  // writers may have run while the delete was awaited.
+  let activeCompetitionId = null;
+  await updateCompetitionsIndex((index) => {
+    index.competitions = index.competitions.filter(c => c.id !== id);
+    if (index.activeCompetitionId === id) {
+      if (index.competitions.length > 0) {
+        index.competitions[0].isActive = true;
+        index.activeCompetitionId = index.competitions[0].id;
+      } else {
+        index.activeCompetitionId = null;
+      }
     }
-  }
-  writeCompetitionsIndex(index);
+    activeCompetitionId = index.activeCompetitionId;
+  });
 
   // Update config
   if (getConfigValue('activeCompetitionId') === id) {
-    setConfigValue('activeCompetitionId', index.activeCompetitionId);
+    setConfigValue('activeCompetitionId', activeCompetitionId);
   }
 
-  return { activeCompetitionId: index.activeCompetitionId };
+  return { activeCompetitionId };
 });
 
 // Save map print image via native save dialog. Prefers the directory the
@@ -1128,14 +1268,14 @@ safeHandle('save-map-image', async (event, base64Data, defaultDir, fileNameArg)
   });
   if (!filePath) return null;
   const buffer = Buffer.from(base64Data, 'base64');
-  fs.writeFileSync(filePath, buffer);
+  await fs.promises.writeFile(filePath, buffer);
   return filePath;
 });
 
 // Open one or more photo files via native dialog. Defaults to the
 // competition's working folder (feedback 2026-04-25 — same default for
 // every export AND import). The renderer only gets file paths back; it
-// then asks `read-photo-file` to load each one as base64 so it can
+// then asks `read-photo-file` to load each one as raw bytes so it can
 // reconstruct File objects for the existing onFilesDropped pipeline.
 //
 // Picked paths are added to `photoOpenAllowlist` and ALSO returned. The
@@ -1153,8 +1293,8 @@ safeHandle('open-photos', async (event, defaultDir, maxFiles) => {
   });
   if (result.canceled || !result.filePaths || !result.filePaths.length) return [];
   // Hard server-side ceiling stops a renderer-supplied `maxFiles` of
-  // Number.MAX_SAFE_INTEGER from causing the renderer to OOM trying to
-  // base64-decode hundreds of 30 MB files in a row. Renderer-side cap is
+  // Number.MAX_SAFE_INTEGER from causing the renderer to OOM holding the
+  // bytes of hundreds of 20 MB files at once. Renderer-side cap is
   // still applied first when valid (slot capacity).
   const requested = (typeof maxFiles === 'number' && maxFiles > 0)
     ? Math.min(maxFiles, PHOTO_OPEN_HARD_CAP)
@@ -1173,13 +1313,14 @@ safeHandle('open-photos', async (event, defaultDir, maxFiles) => {
   return picked;
 });
 
-// Read a single photo file from disk and return base64 + metadata so the
+// Read a single photo file from disk and return its bytes + metadata so the
 // renderer can construct a File object. Three layers of validation:
 // 1) The path must be in `photoOpenAllowlist` (set by a prior `open-photos`).
 // 2) `lstat` rejects symlinks so a malicious symlink under the user's
 //    Pictures folder can't redirect to ~/.ssh/id_rsa.
 // 3) Extension is whitelisted explicitly — the dialog filter is UI only;
 //    on Windows users can type `*.*` and pick anything.
+// The magic-byte check after the read is a fourth, content-level gate.
 const ALLOWED_PHOTO_EXTS = new Set(['.jpg', '.jpeg', '.png']);
 safeHandle('read-photo-file', async (event, filePath) => {
   if (typeof filePath !== 'string' || !filePath) {
@@ -1202,26 +1343,39 @@ safeHandle('read-photo-file', async (event, filePath) => {
   }
   // `lstat` does NOT follow symlinks, so a symlink targeting a sensitive
   // file outside the allowlist is rejected here even if its parent dir
-  // was legitimately picked. `readFileSync` later WOULD follow the link.
+  // was legitimately picked. `readFile` later WOULD follow the link.
   let lst;
-  try { lst = fs.lstatSync(abs); } catch { throw new Error('File not found'); }
+  try { lst = await fs.promises.lstat(abs); } catch { throw new Error('File not found'); }
   if (lst.isSymbolicLink()) throw new Error('Symlinks not allowed');
   if (!lst.isFile()) throw new Error('File not found');
-  // 30 MB cap — same order of magnitude as the 20 MB renderer-side check
-  // in `isValidImageFile`, with a little headroom for the base64 round-trip.
-  if (lst.size > 30 * 1024 * 1024) {
+  // 20 MB cap — the same limit as the renderer-side `isValidImageFile`
+  // check. The bytes cross IPC raw now, so there is no encoding overhead to
+  // leave headroom for, and a bigger file would only be read and shipped to
+  // the renderer to be rejected there.
+  if (lst.size > 20 * 1024 * 1024) {
     throw new Error('File too large');
   }
   const ext = path.extname(abs).toLowerCase();
   if (!ALLOWED_PHOTO_EXTS.has(ext)) {
     throw new Error('Unsupported image type');
   }
-  const buffer = fs.readFileSync(abs);
-  const mimeType = ext === '.png' ? 'image/png' : 'image/jpeg';
+  // Async: the renderer requests every picked photo in turn, and a
+  // synchronous multi-MB read stalled the main process once per file.
+  const buffer = await fs.promises.readFile(abs);
+  // 4) Content must actually be a JPEG/PNG (signature bytes, see
+  //    lib/photoFiles.js). The sniffed type wins over the extension.
+  const mimeType = sniffImageType(buffer);
+  if (!mimeType) {
+    throw new Error('Unsupported image type');
+  }
+  // Raw bytes: Electron's structured clone hands the Buffer to the
+  // renderer as a Uint8Array. The previous base64 string cost a full
+  // encode here, 33% more bytes over IPC and a char-by-char decode in the
+  // renderer — for every imported photo.
   return {
     name: path.basename(abs),
     mimeType,
-    base64: buffer.toString('base64'),
+    data: buffer,
   };
 });
 
@@ -1427,7 +1581,7 @@ safeHandle('save-pdf', async (event, base64Data, fileName, defaultDir) => {
   });
   if (!filePath) return null;
   const buffer = Buffer.from(base64Data, 'base64');
-  fs.writeFileSync(filePath, buffer);
+  await fs.promises.writeFile(filePath, buffer);
   return filePath;
 });
 
@@ -1467,7 +1621,7 @@ safeHandle('save-kml', async (event, kmlText, fileName, defaultDir, competitionI
     filters: [{ name: 'KML files', extensions: ['kml'] }]
   });
   if (!filePath) return null;
-  fs.writeFileSync(filePath, kmlText, 'utf8');
+  await fs.promises.writeFile(filePath, kmlText, 'utf8');
   return filePath;
 });
 
@@ -1892,6 +2046,12 @@ app.whenReady().then(async () => {
   ensureSampleCompetition();
   createMenu();
   createWindow();
+  // Reclaim temp files orphaned by interrupted atomic writes (session JSON
+  // and photo bytes). Runs in the background after the window is up;
+  // nothing waits on it.
+  pruneStaleTempFiles(getPhotoSessionsPath())
+    .then((n) => { if (n > 0) console.log(`Removed ${n} stale temp file(s)`); })
+    .catch((e) => console.warn('Temp-file cleanup failed:', e));
 
   app.on('activate', () => {
     // On macOS it's common to re-create a window when the dock icon is clicked
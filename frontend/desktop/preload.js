@@ -119,14 +119,25 @@ contextBridge.exposeInMainWorld('electronAPI', {
     // Write JSON data to a file
     writeJSON: (dirPath, name, data) => ipcRenderer.invoke('storage-write-json', dirPath, name, data),
 
+    // Write an already-serialized JSON string to a file
+    writeJSONText: (dirPath, name, text) => ipcRenderer.invoke('storage-write-json-text', dirPath, name, text),
+
     // Read JSON data from a file
     readJSON: (dirPath, name) => ipcRenderer.invoke('storage-read-json', dirPath, name),
 
-    // Save a photo file (base64 encoded)
-    savePhotoFile: (photosPath, photoId, base64Data, mimeType) =>
-      ipcRenderer.invoke('storage-save-photo', photosPath, photoId, base64Data, mimeType),
+    // Read a JSON file as text (parsed by the caller)
+    readJSONText: (dirPath, name) => ipcRenderer.invoke('storage-read-json-text', dirPath, name),
+
+    // Save a photo file (raw bytes as a Uint8Array)
+    savePhotoFile: (photosPath, photoId, data, mimeType) =>
+      ipcRenderer.invoke('storage-save-photo', photosPath, photoId, data, mimeType),
+
+    // Save several photos in one round-trip: entries are { photoId, data, mimeType }.
+    // Resolves to { failed: [photoId, ...] }.
+    savePhotoFiles: (photosPath, entries) =>
+      ipcRenderer.invoke('storage-save-photos', photosPath, entries),
 
-    // Get a photo as base64
+    // Get a photo's raw bytes as { data: Uint8Array, mimeType }, or null
     getPhotoBlob: (photosPath, photoId) => ipcRenderer.invoke('storage-get-photo', photosPath, photoId),
 
     // Delete a photo file
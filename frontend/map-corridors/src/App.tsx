@@ -523,15 +523,29 @@ function App() {
         }
       }
     } catch { /* non-fatal */ }
-    // Store original KML text for export
+    // Store original KML text for export. The write is independent of the
+    // parse + corridor build below, so it runs alongside them (the storage
+    // round-trip happens off the main thread) and is only awaited before the
+    // computed session is persisted, keeping the original write-order. The
+    // already-read text is parsed directly rather than reading the file again.
     const fileText = await file.text()
-    await saveOriginalKmlText(file.name.toLowerCase().endsWith('.kml') ? fileText : '')
-    const { parseFileToGeoJSON } = await import('./parsers/detect')
-    const parsed = await parseFileToGeoJSON(file)
+    const originalSaved = saveOriginalKmlText(file.name.toLowerCase().endsWith('.kml') ? fileText : '')
+    let parsed: GeoJSON
+    try {
+      const { parseTextToGeoJSON } = await import('./parsers/detect')
+      parsed = parseTextToGeoJSON(fileText, file.name)
+    } catch (err) {
+      // Malformed upload: settle the save before rethrowing so it can't
+      // float unhandled, and so a failed save surfaces first, as it did when
+      // the save was awaited before parsing.
+      await originalSaved
+      throw err
+    }
     // compute corridors using discipline from URL param (desktop) or session fallback (web).
     // Rally honors the `use1NmAfterSp` flag; see `effectiveConfig` for details.
     try {
       const { gates, points, exactPoints, leftSegments, rightSegments } = buildPreciseCorridorsAndGates(parsed, effectiveConfig)
+      await originalSaved
       await setComputedData({
         geojson: parsed,
         gates: gates && gates.length ? ({ type: 'FeatureCollection', features: gates } as any) : null,
@@ -544,6 +558,7 @@ function App() {
       // Never silently drop everything — users previously lost corridors and
       // TP markers with no visible hint (feedback 2026-04-23: 16-section race).
       console.error('buildPreciseCorridorsAndGates failed on upload:', err)
+      await originalSaved
       await setComputedData({ geojson: parsed, gates: null, points: null, exactPoints: null, leftSegments: null, rightSegments: null })
     }
   }, [saveOriginalKmlText, effectiveConfig, setComputedData, competitionId])
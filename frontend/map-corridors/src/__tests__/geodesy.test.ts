@@ -0,0 +1,115 @@
+import { describe, it, expect } from 'vitest'
+import { bearing as turfBearing, destination, point, getCoord, distance } from '@turf/turf'
+import { bearingDeg, destinationPoint, localOffset, segmentBearingsRad, turnAngleDeg, DEG_TO_RAD, EARTH_RADIUS_M, LOCAL_OFFSET_MAX_LAT } from '../corridors/geodesy'
+import { generateLeftRightCorridor } from '../corridors/preciseCorridor'
+
+// The corridor builder switched from turf's bearing/destination to these
+// scalar versions; pin that they still agree, so existing courses keep
+// their corridor and gate positions.
+describe('bearingDeg', () => {
+  it('reports cardinal directions', () => {
+    expect(bearingDeg(14, 50, 14, 50.1)).toBeCloseTo(0, 9)
+    expect(bearingDeg(0, 0, 1, 0)).toBeCloseTo(90, 9)
+    expect(bearingDeg(0, 0, -1, 0)).toBeCloseTo(-90, 9)
+    expect(Math.abs(bearingDeg(14, 50.1, 14, 50))).toBeCloseTo(180, 9)
+  })
+
+  it('matches turf bearing', () => {
+    const pairs: Array<[number, number, number, number]> = [
+      [14.0, 50.0, 14.3, 50.2],
+      [14.3, 50.2, 14.0, 49.9],
+      [-3.2, 55.9, -3.1, 55.95],
+    ]
+    for (const [lon1, lat1, lon2, lat2] of pairs) {
+      expect(bearingDeg(lon1, lat1, lon2, lat2)).toBeCloseTo(turfBearing(point([lon1, lat1]), point([lon2, lat2])), 9)
+    }
+  })
+})
+
+describe('turnAngleDeg', () => {
+  it('wraps across north and south in either bearing convention', () => {
+    expect(turnAngleDeg(170, -170)).toBeCloseTo(20, 9)
+    expect(turnAngleDeg(-170, 170)).toBeCloseTo(-20, 9)
+    expect(turnAngleDeg(350, 10)).toBeCloseTo(20, 9)
+    expect(turnAngleDeg(10, 350)).toBeCloseTo(-20, 9)
+    expect(turnAngleDeg(-90, 90)).toBe(-180)
+    expect(turnAngleDeg(45, 45)).toBe(0)
+  })
+})
+
+describe('segmentBearingsRad', () => {
+  it('gives bearingDeg, in radians, for every segment and nothing for a single point', () => {
+    const track: Array<[number, number, number]> = [[14.0, 50.0, 0], [14.1, 50.05, 0], [14.1, 49.9, 0], [13.8, 49.95, 0]]
+    const out = segmentBearingsRad(track)
+    expect(out).toHaveLength(3)
+    for (let i = 0; i < 3; i++) {
+      expect(out[i]).toBeCloseTo(bearingDeg(track[i][0], track[i][1], track[i + 1][0], track[i + 1][1]) * DEG_TO_RAD, 12)
+    }
+    expect(segmentBearingsRad([[14, 50, 0]])).toHaveLength(0)
+  })
+})
+
+describe('destinationPoint', () => {
+  it('moves along a meridian by distance / R', () => {
+    const [lon, lat] = destinationPoint(14, 0, 0, 1852)
+    expect(lon).toBeCloseTo(14, 12)
+    expect(lat).toBeCloseTo((1852 / EARTH_RADIUS_M) * 180 / Math.PI, 12)
+  })
+
+  it('matches turf destination and carries the altitude through', () => {
+    for (const brg of [0, 37, 90, 181, 270, 359]) {
+      const ours = destinationPoint(14.2, 50.1, brg, 300, 412)
+      const theirs = getCoord(destination(point([14.2, 50.1]), 0.3, brg, { units: 'kilometers' }))
+      expect(ours[0]).toBeCloseTo(theirs[0], 10)
+      expect(ours[1]).toBeCloseTo(theirs[1], 10)
+      expect(ours[2]).toBe(412)
+    }
+  })
+})
+
+describe('localOffset', () => {
+  it('stays within a few centimetres of the spherical offset at corridor widths', () => {
+    for (const lat of [0, 50.1, 65]) {
+      const cosLat = Math.cos(lat * DEG_TO_RAD)
+      for (const brg of [0, 45, 90, 200, 300]) {
+        const t = brg * DEG_TO_RAD
+        const flat = localOffset(14.2, lat, cosLat, 300 * Math.cos(t), 300 * Math.sin(t), 7)
+        const sphere = destinationPoint(14.2, lat, brg, 300)
+        const errM = distance(point([flat[0], flat[1]]), point([sphere[0], sphere[1]]), { units: 'kilometers' }) * 1000
+        expect(errM).toBeLessThan(0.03)
+        expect(flat[2]).toBe(7)
+      }
+    }
+  })
+})
+
+describe('corridor offsets near the poles', () => {
+  it('fall back to the spherical offset above LOCAL_OFFSET_MAX_LAT', () => {
+    const lat = 89.5
+    expect(lat).toBeGreaterThan(LOCAL_OFFSET_MAX_LAT)
+    const track: Array<[number, number, number]> = [[0, lat, 0], [10, lat, 0]]
+    const corridor = generateLeftRightCorridor(track, 300, 300)!
+    const left = corridor.left.geometry.coordinates
+    const right = corridor.right.geometry.coordinates
+    const brg = bearingDeg(0, lat, 10, lat)
+    const expectedLeft = destinationPoint(0, lat, brg - 90, 300)
+    const expectedRight = destinationPoint(0, lat, brg + 90, 300)
+    expect(left[0][0]).toBeCloseTo(expectedLeft[0], 9)
+    expect(left[0][1]).toBeCloseTo(expectedLeft[1], 9)
+    expect(right[0][0]).toBeCloseTo(expectedRight[0], 9)
+    expect(right[0][1]).toBeCloseTo(expectedRight[1], 9)
+    for (const c of [...left, ...right]) {
+      expect(Number.isFinite(c[0]) && Number.isFinite(c[1])).toBe(true)
+    }
+  })
+
+  it('would be most of a metre off with the flat step there', () => {
+    // Why the guard exists: the flat step's error grows with tan φ.
+    const lat = 89.5
+    const t = 90 * DEG_TO_RAD
+    const flat = localOffset(0, lat, Math.cos(lat * DEG_TO_RAD), 300 * Math.cos(t), 300 * Math.sin(t))
+    const sphere = destinationPoint(0, lat, 90, 300)
+    const errM = distance(point([flat[0], flat[1]]), point([sphere[0], sphere[1]]), { units: 'kilometers' }) * 1000
+    expect(errM).toBeGreaterThan(0.5)
+  })
+})
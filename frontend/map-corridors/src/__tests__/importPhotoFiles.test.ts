@@ -106,6 +106,20 @@ describe('importPhotoFiles — rejection routing', () => {
     ])
   })
 
+  it('rejects HEIC content from its header without decoding or hashing it', async () => {
+    // `ftyp` box with the `heic` brand, under a .jpg name / image/jpeg type.
+    const heic = new Uint8Array([0, 0, 0, 0x18, 0x66, 0x74, 0x79, 0x70, 0x68, 0x65, 0x69, 0x63, 0, 0, 0, 0])
+    const digestSpy = vi.spyOn(crypto.subtle, 'digest')
+    const result = await importPhotoFiles([makeFile('photo.jpg', 'image/jpeg', heic)])
+    expect(result.failed).toEqual([
+      expect.objectContaining({ filename: 'photo.jpg', reason: 'heic' }),
+    ])
+    expect(generateThumbMock).not.toHaveBeenCalled()
+    expect(extractExifMock).not.toHaveBeenCalled()
+    expect(digestSpy).not.toHaveBeenCalled()
+    digestSpy.mockRestore()
+  })
+
   it('routes corrupt files to failed with reason="corrupt"', async () => {
     generateThumbMock.mockRejectedValueOnce(new Error('decode failed'))
     const result = await importPhotoFiles([makeFile('broken.jpg')])
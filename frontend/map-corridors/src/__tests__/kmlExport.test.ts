@@ -2,6 +2,7 @@ import { describe, it, expect } from 'vitest'
 import { readFileSync } from 'fs'
 import { join } from 'path'
 import { appendFeaturesToKML } from '../utils/kmlMerge'
+import { formatKmlCoordinates } from '../utils/kmlCoordinates'
 import type { FeatureCollection } from 'geojson'
 
 function loadFixtureText(name: string): string {
@@ -179,3 +180,14 @@ describe('appendFeaturesToKML', () => {
     expect(result).not.toContain('<script>x</script>')
   })
 })
+
+describe('formatKmlCoordinates', () => {
+  it('writes lon,lat,alt tuples and defaults a missing altitude to 0', () => {
+    expect(formatKmlCoordinates([[14.5, 50.25, 312], [14.75, 50.5]])).toBe('14.5,50.25,312\n14.75,50.5,0')
+  })
+
+  it('applies the separator between tuples and the indent before each', () => {
+    expect(formatKmlCoordinates([[1, 2], [3, 4, 5]], ' ', '  ')).toBe('  1,2,0   3,4,5')
+    expect(formatKmlCoordinates([])).toBe('')
+  })
+})
@@ -0,0 +1,19 @@
+import { describe, it, expect } from 'vitest'
+import { readFileSync } from 'fs'
+import { join } from 'path'
+import type { FeatureCollection } from 'geojson'
+import { parseTextToGeoJSON } from '../parsers/detect'
+
+describe('parseTextToGeoJSON', () => {
+  it('converts a course KML', () => {
+    const kml = readFileSync(join(__dirname, 'fixtures', 'RED.kml'), 'utf-8')
+    const gj = parseTextToGeoJSON(kml, 'RED.kml') as FeatureCollection
+    expect(gj.type).toBe('FeatureCollection')
+    expect(gj.features.length).toBeGreaterThan(0)
+  })
+
+  it('reports malformed XML instead of returning an empty course', () => {
+    const broken = '<?xml version="1.0"?><kml xmlns="http://www.opengis.net/kml/2.2"><Document><Placemark></Document></kml>'
+    expect(() => parseTextToGeoJSON(broken, 'broken.kml')).toThrow(/XML parse error/)
+  })
+})
@@ -8,10 +8,11 @@ import {
   buildPreciseCorridorsAndGates,
   generateLeftRightCorridor,
   buildGateAtPoint,
+  pointAtDistanceAlongTrack,
   DISCIPLINE_CONFIGS,
 } from '../corridors/preciseCorridor'
 import type { LonLatAlt } from '../corridors/segments'
-import { isTpGatePerpendicular, extractAllSegments } from '../corridors/segments'
+import { isTpGatePerpendicular, extractAllSegments, segmentLengths, cumulativeDistances, calculateDistance, isWithinMeters } from '../corridors/segments'
 
 // ---------------------------------------------------------------------------
 // Helpers
@@ -170,6 +171,74 @@ describe('extractAllSegments with long 3-vertex legs', () => {
   })
 })
 
+describe('segmentLengths', () => {
+  it('matches calculateDistance for every segment of a track', () => {
+    const track: LonLatAlt[] = [
+      [14.0, 50.0, 0],
+      [14.01, 50.02, 0],
+      [14.05, 50.02, 0],
+      [14.05, 49.98, 0],
+    ]
+    const lengths = segmentLengths(track)
+    expect(lengths).toHaveLength(3)
+    for (let i = 0; i < 3; i++) {
+      expect(lengths[i]).toBeCloseTo(calculateDistance(track[i], track[i + 1]), 6)
+    }
+  })
+
+  it('gives half the circumference, not NaN, for an antipodal pair', () => {
+    // Rounding puts the haversine term at 1 + 2⁻⁵² for this pair.
+    const a: LonLatAlt = [44.553876857825344, -22.870325244737444, 0]
+    const b: LonLatAlt = [-135.44612314217466, 22.870325244737444, 0]
+    expect(calculateDistance(a, b)).toBeCloseTo(Math.PI * 6371000, 0)
+    expect(segmentLengths([a, b])[0]).toBeCloseTo(Math.PI * 6371000, 0)
+  })
+
+  it('is empty for tracks with fewer than two points', () => {
+    expect(segmentLengths([])).toHaveLength(0)
+    expect(segmentLengths([[14, 50, 0]])).toHaveLength(0)
+  })
+})
+
+describe('isWithinMeters', () => {
+  it('agrees with calculateDistance around the 50 m segment-join threshold', () => {
+    const a: LonLatAlt = [14.0, 50.0, 0]
+    // ~49.5 m and ~50.5 m away, diagonally (both axes contribute).
+    const near: LonLatAlt = [14.00049, 50.000315, 0]
+    const far: LonLatAlt = [14.0005, 50.000321, 0]
+    expect(calculateDistance(a, near)).toBeLessThan(50)
+    expect(calculateDistance(a, far)).toBeGreaterThan(50)
+    expect(isWithinMeters(a, near, 50)).toBe(true)
+    expect(isWithinMeters(a, far, 50)).toBe(false)
+  })
+})
+
+describe('pointAtDistanceAlongTrack', () => {
+  // Due north, one vertex every 0.01° of latitude (~1.11 km).
+  const track: LonLatAlt[] = Array.from({ length: 6 }, (_, i) => [14.0, 50.0 + i * 0.01, 0] as LonLatAlt)
+
+  it('finds the segment by cumulative distance from the start vertex', () => {
+    const cum = cumulativeDistances(track)
+    expect(cum[0]).toBe(0)
+    expect(cum[5]).toBeCloseTo(calculateDistance(track[0], track[5]), 3)
+    const along = pointAtDistanceAlongTrack(track, 1, 1852, cum)!
+    // 1852 m past vertex 1 is ~0.67 km into the segment from vertex 2.
+    expect(along.segmentIndex).toBe(2)
+    expect(calculateDistance(track[1], along.point)).toBeCloseTo(1852, 0)
+    expect(along.bearing).toBeCloseTo(0, 6)
+  })
+
+  it('computes the cumulative table itself when none is passed', () => {
+    expect(pointAtDistanceAlongTrack(track, 0, 500)).toEqual(pointAtDistanceAlongTrack(track, 0, 500, cumulativeDistances(track)))
+  })
+
+  it('clamps to the last vertex past the end of the track', () => {
+    const along = pointAtDistanceAlongTrack(track, 3, 50_000)!
+    expect(along.point).toBe(track[5])
+    expect(along.segmentIndex).toBe(4)
+  })
+})
+
 // ---------------------------------------------------------------------------
 // 2. DISCIPLINE_CONFIGS — parameter correctness
 // ---------------------------------------------------------------------------
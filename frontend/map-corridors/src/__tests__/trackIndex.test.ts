@@ -0,0 +1,45 @@
+import { describe, it, expect } from 'vitest'
+import type { LonLatAlt } from '../corridors/segments'
+import { nearestTrackIndex } from '../corridors/preciseCorridor'
+import { createNearestTrackIndex } from '../corridors/trackIndex'
+
+// Deterministic LCG so a failure reproduces.
+function rng(seed: number) {
+  let s = seed >>> 0
+  return () => {
+    s = (Math.imul(s, 1664525) + 1013904223) >>> 0
+    return s / 2 ** 32
+  }
+}
+
+describe('createNearestTrackIndex', () => {
+  it('agrees with the linear nearestTrackIndex scan on a winding track', () => {
+    const rand = rng(42)
+    const track: LonLatAlt[] = []
+    let lon = 14.0
+    let lat = 50.0
+    for (let i = 0; i < 500; i++) {
+      lon += (rand() - 0.3) * 0.01
+      lat += (rand() - 0.5) * 0.01
+      track.push([lon, lat, 0])
+    }
+    const nearest = createNearestTrackIndex(track)
+    for (let q = 0; q < 200; q++) {
+      const target: LonLatAlt = [13.9 + rand() * 1.2, 49.8 + rand() * 0.4, 0]
+      expect(nearest(target)).toBe(nearestTrackIndex(track, target))
+    }
+    // Exact vertices resolve to themselves.
+    expect(nearest(track[123])).toBe(123)
+  })
+
+  it('returns the lowest index when vertices repeat (closed loops)', () => {
+    const track: LonLatAlt[] = [[14, 50, 0], [14.1, 50, 0], [14.1, 50.1, 0], [14, 50, 0]]
+    const nearest = createNearestTrackIndex(track)
+    expect(nearest([14, 50, 0])).toBe(0)
+    expect(nearest([14.0001, 50.0001, 0])).toBe(nearestTrackIndex(track, [14.0001, 50.0001, 0]))
+  })
+
+  it('returns 0 for an empty track, like the linear scan', () => {
+    expect(createNearestTrackIndex([])([14, 50, 0])).toBe(0)
+  })
+})
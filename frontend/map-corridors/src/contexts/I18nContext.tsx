@@ -16,12 +16,15 @@ const getNestedValue = (obj: any, path: string): string => {
   return path.split('.').reduce((current, key) => current?.[key], obj) || path
 }
 
+// One precompiled pass instead of a RegExp per param on every `t()` call.
+// Placeholders without a matching param are left as-is.
+const PLACEHOLDER_RE = /\{\{([^{}]+)\}\}/g
+
 const interpolate = (text: string, params?: Record<string, string | number>): string => {
   if (!params) return text
-  return Object.keys(params).reduce((result, key) => {
-    const placeholder = `{{${key}}}`
-    return result.replace(new RegExp(placeholder, 'g'), String(params[key]))
-  }, text)
+  return text.replace(PLACEHOLDER_RE, (match, key: string) =>
+    Object.prototype.hasOwnProperty.call(params, key) ? String(params[key]) : match
+  )
 }
 
 interface I18nProviderProps { children: ReactNode }
@@ -0,0 +1,116 @@
+import type { LonLatAlt } from './segments'
+
+/**
+ * Scalar spherical-geometry helpers for the corridor hot loops.
+ *
+ * `calculateBearing` / `projectCoordinate` used to go through turf's
+ * `bearing` / `destination`, which wrap both inputs in GeoJSON Point
+ * features and return another Feature — three object allocations plus
+ * coordinate validation for every call, and corridor generation makes
+ * several calls per track vertex. These are the same formulas on plain
+ * numbers, so they stay monomorphic and allocation-free (apart from the
+ * returned coordinate), and produce the same values turf does.
+ */
+
+// turf's mean Earth radius, kept so projected points match what
+// `destination` produced before.
+export const EARTH_RADIUS_M = 6371008.8
+
+export const DEG_TO_RAD = Math.PI / 180
+const DEG = DEG_TO_RAD
+
+/**
+ * Sine and cosine of every vertex's latitude. A corridor vertex is the end
+ * of one segment, the start of the next and the origin of both side
+ * offsets, so computing these once per vertex and sharing them between
+ * `segmentBearingsRad` and `localOffset` replaces ~8 sin/cos evaluations
+ * per vertex with 2.
+ */
+export function latitudeTrig(track: LonLatAlt[]): { sinLat: Float64Array, cosLat: Float64Array } {
+  const sinLat = new Float64Array(track.length)
+  const cosLat = new Float64Array(track.length)
+  for (let i = 0; i < track.length; i++) {
+    const phi = track[i][1] * DEG
+    sinLat[i] = Math.sin(phi)
+    cosLat[i] = Math.cos(phi)
+  }
+  return { sinLat, cosLat }
+}
+
+// Initial bearing in radians (-π, π], with both latitudes given as sin/cos.
+function bearingRadFromTrig(lon1: number, sinPhi1: number, cosPhi1: number, lon2: number, sinPhi2: number, cosPhi2: number): number {
+  const dLon = (lon2 - lon1) * DEG
+  const y = Math.sin(dLon) * cosPhi2
+  const x = cosPhi1 * sinPhi2 - sinPhi1 * cosPhi2 * Math.cos(dLon)
+  return Math.atan2(y, x)
+}
+
+/**
+ * Signed turn from bearing `from` to bearing `to`, degrees in [-180, 180).
+ * Both inputs may be in (-180, 180] or [0, 360); one shifted modulo does
+ * the wrap instead of `if (d > 180) … if (d < -180) …` fix-ups. The +540
+ * keeps the dividend positive, since JS `%` takes the dividend's sign.
+ */
+export function turnAngleDeg(from: number, to: number): number {
+  return ((to - from + 540) % 360) - 180
+}
+
+/**
+ * Forward bearing (radians) of every segment of `track` in one pass:
+ * `out[i]` is the bearing from `track[i]` to `track[i + 1]`. `trig` is the
+ * track's `latitudeTrig`, which callers usually already hold. Radians
+ * because corridor offsets feed the bearing straight back into sin/cos.
+ */
+export function segmentBearingsRad(
+  track: LonLatAlt[],
+  trig: { sinLat: Float64Array, cosLat: Float64Array } = latitudeTrig(track)
+): Float64Array {
+  const { sinLat, cosLat } = trig
+  const out = new Float64Array(Math.max(0, track.length - 1))
+  for (let i = 0; i < out.length; i++) {
+    out[i] = bearingRadFromTrig(track[i][0], sinLat[i], cosLat[i], track[i + 1][0], sinLat[i + 1], cosLat[i + 1])
+  }
+  return out
+}
+
+/**
+ * Offset (lon, lat) by `northM` / `eastM` metres on the local tangent plane.
+ * `cosPhi` is cos(lat), which corridor callers already hold per vertex.
+ *
+ * Corridor sides sit 100–300 m from the track. At that range the spherical
+ * direct formula differs from this flat-earth step by about a centimetre at
+ * Czech latitudes and under 2 cm even at 65° (the second-order term grows
+ * with d²·tan φ / R), while the flat step needs no asin/atan2 at all. Not
+ * for long distances — along-track points and gates use `destinationPoint` —
+ * nor beyond `LOCAL_OFFSET_MAX_LAT`.
+ */
+// Above this |latitude| corridor offsets fall back to `destinationPoint`:
+// cos φ → 0 near the poles, so the flat step's east term (÷ cos φ) blows
+// up — already ~0.8 m off at 89.5° for a 300 m offset, non-finite at 90°.
+export const LOCAL_OFFSET_MAX_LAT = 89
+
+export function localOffset(lon: number, lat: number, cosPhi: number, northM: number, eastM: number, alt?: number): LonLatAlt {
+  return [lon + eastM / (EARTH_RADIUS_M * cosPhi * DEG), lat + northM / (EARTH_RADIUS_M * DEG), alt]
+}
+
+/** Initial great-circle bearing from (lon1, lat1) to (lon2, lat2), degrees in (-180, 180]. */
+export function bearingDeg(lon1: number, lat1: number, lon2: number, lat2: number): number {
+  const phi1 = lat1 * DEG
+  const phi2 = lat2 * DEG
+  return bearingRadFromTrig(lon1, Math.sin(phi1), Math.cos(phi1), lon2, Math.sin(phi2), Math.cos(phi2)) / DEG
+}
+
+/** Point reached from (lon, lat) after `distanceM` metres on `bearing` degrees. */
+export function destinationPoint(lon: number, lat: number, bearing: number, distanceM: number, alt?: number): LonLatAlt {
+  const phi1 = lat * DEG
+  const sinPhi1 = Math.sin(phi1)
+  const cosPhi1 = Math.cos(phi1)
+  const theta = bearing * DEG
+  const delta = distanceM / EARTH_RADIUS_M
+  const sinDelta = Math.sin(delta)
+  const cosDelta = Math.cos(delta)
+  const sinPhi2 = sinPhi1 * cosDelta + cosPhi1 * sinDelta * Math.cos(theta)
+  const phi2 = Math.asin(sinPhi2)
+  const dLambda = Math.atan2(Math.sin(theta) * sinDelta * cosPhi1, cosDelta - sinPhi1 * sinPhi2)
+  return [lon + dLambda / DEG, phi2 / DEG, alt]
+}
@@ -1,7 +1,10 @@
 import type { Feature, FeatureCollection, GeoJSON, LineString, Point, Position } from 'geojson'
-import { lineString, length as turfLength, getCoord, bearing as turfBearing, destination, point, nearestPointOnLine, lineIntersect } from '@turf/turf'
+import { lineString, getCoord, point, nearestPointOnLine, lineIntersect } from '@turf/turf'
 import type { LonLatAlt, Segment } from './segments'
-import { calculateDistance, buildContinuousTrackWithSources, isTpGatePerpendicular } from './segments'
+import { calculateDistance, cumulativeDistances, segmentLengths, buildContinuousTrackWithSources, isTpGatePerpendicular } from './segments'
+import { createNearestTrackIndex } from './trackIndex'
+import type { NearestTrackIndex } from './trackIndex'
+import { bearingDeg, destinationPoint, latitudeTrig, localOffset, segmentBearingsRad, turnAngleDeg, DEG_TO_RAD, LOCAL_OFFSET_MAX_LAT } from './geodesy'
 
 const DEBUG = (import.meta as any)?.env?.VITE_DEBUG_CORRIDORS === 'true' || (import.meta as any)?.env?.VITE_DEBUG_CORRIDORS === '1'
 const log = (...args: any[]) => { if (DEBUG) console.log(...args) }
@@ -30,13 +33,11 @@ export const DISCIPLINE_CONFIGS: Record<Discipline, DisciplineConfig> = {
 }
 
 function calculateBearing(a: LonLatAlt, b: LonLatAlt): number {
-  return turfBearing(point([a[0], a[1]]), point([b[0], b[1]]))
+  return bearingDeg(a[0], a[1], b[0], b[1])
 }
 
-function projectCoordinate(origin: LonLatAlt, bearingDeg: number, distanceMeters: number): LonLatAlt {
-  const dest = destination(point([origin[0], origin[1]]), distanceMeters / 1000, bearingDeg, { units: 'kilometers' })
-  const [lon, lat] = getCoord(dest)
-  return [lon, lat, origin[2]]
+function projectCoordinate(origin: LonLatAlt, bearing: number, distanceMeters: number): LonLatAlt {
+  return destinationPoint(origin[0], origin[1], bearing, distanceMeters, origin[2])
 }
 
 // moved: isDashedConnectorLine/extract/buildContinuousTrack* to segments.ts
@@ -46,47 +47,60 @@ export function generateLeftRightCorridor(track: LonLatAlt[], leftDistanceM = 30
 
   // Simple segment-by-segment approach: no averaging, no complex bearing calculations
   // Each segment gets processed independently with start→end bearing
-  const left: LonLatAlt[] = []
-  const right: LonLatAlt[] = []
-  const bearings: number[] = []
-  const segLengths: number[] = []
+  // One offset point per track vertex on each side, so both outputs are
+  // sized up front and filled by index.
+  const n = track.length
+  const left = new Array<LonLatAlt>(n)
+  const right = new Array<LonLatAlt>(n)
+  // Every vertex's latitude is converted to radians once here; its trig is
+  // shared by two bearings and its offsets.
+  const trig = latitudeTrig(track)
+  const { cosLat } = trig
+  // All segment bearings up front, in one pass over the slice. Kept in
+  // radians: they only feed sin/cos below, so degrees would be converted
+  // straight back for every vertex.
+  const bearings = segmentBearingsRad(track, trig)
+  // Offset vertex i perpendicular to `bearing` on both sides. Left is
+  // bearing − 90° (north = d·sin b, east = −d·cos b), right is bearing + 90°
+  // (north = −d·sin b, east = d·cos b): one sin/cos pair serves both, and
+  // at corridor widths the flat-earth step matches the spherical one to
+  // about a centimetre (see `localOffset`). Near the poles it doesn't, so
+  // those vertices take the spherical path.
+  const setOffsets = (i: number, theta: number) => {
+    const [lon, lat, alt] = track[i]
+    if (Math.abs(lat) > LOCAL_OFFSET_MAX_LAT) {
+      const bearing = theta / DEG_TO_RAD
+      left[i] = destinationPoint(lon, lat, bearing - 90, leftDistanceM, alt)
+      right[i] = rightDistanceM > 0 ? destinationPoint(lon, lat, bearing + 90, rightDistanceM, alt) : [...track[i]] as LonLatAlt
+      return
+    }
+    const sinB = Math.sin(theta)
+    const cosB = Math.cos(theta)
+    left[i] = localOffset(lon, lat, cosLat[i], leftDistanceM * sinB, -leftDistanceM * cosB, alt)
+    right[i] = rightDistanceM > 0 ? localOffset(lon, lat, cosLat[i], -rightDistanceM * sinB, rightDistanceM * cosB, alt) : [...track[i]] as LonLatAlt
+  }
 
   // Process each segment independently
-  for (let i = 0; i < track.length - 1; i++) {
-    const segmentStart = track[i]
-    const segmentEnd = track[i + 1]
-
-    // Calculate single bearing for this entire segment
-    const segmentBearing = calculateBearing(segmentStart, segmentEnd)
-    bearings.push(segmentBearing)
-    // compute length for last-leg heuristics
-    const segLenM = turfLength(lineString([[segmentStart[0], segmentStart[1]], [segmentEnd[0], segmentEnd[1]]]), { units: 'kilometers' }) * 1000
-    segLengths.push(segLenM)
-    const leftBearing = (segmentBearing - 90 + 360) % 360
-    const rightBearing = (segmentBearing + 90) % 360
+  for (let i = 0; i < n - 1; i++) {
+    // Single bearing for this entire segment
+    const segmentBearing = bearings[i]
 
     // Offset start point of segment
-    if (i === 0) {
-      left.push(projectCoordinate(segmentStart, leftBearing, leftDistanceM))
-      right.push(rightDistanceM > 0 ? projectCoordinate(segmentStart, rightBearing, rightDistanceM) : [...segmentStart] as LonLatAlt)
-    }
+    if (i === 0) setOffsets(i, segmentBearing)
 
     // Offset end point of segment (always add, creates clean segment boundaries)
     // For the very last segment, consider freezing bearing if last leg is tiny or sharply turns
-    if (i === track.length - 2 && bearings.length >= 2) {
-      const lastLen = segLengths[segLengths.length - 1]
-      const prevBearing = bearings[bearings.length - 2]
-      const angleDiff = Math.abs(((segmentBearing - prevBearing + 540) % 360) - 180)
+    if (i === n - 2 && i >= 1) {
+      // Only the last leg's length is ever needed — measure just that one.
+      const lastLen = calculateDistance(track[i], track[i + 1])
+      const prevBearing = bearings[i - 1]
+      const angleDiff = Math.abs(turnAngleDeg(prevBearing / DEG_TO_RAD, segmentBearing / DEG_TO_RAD))
       const isTiny = lastLen < 40 // meters threshold
       const isSharp = angleDiff > 50 // degrees threshold
       const finalBearing = (isTiny || isSharp) ? prevBearing : segmentBearing
-      const finalLeftBearing = (finalBearing - 90 + 360) % 360
-      const finalRightBearing = (finalBearing + 90) % 360
-      left.push(projectCoordinate(segmentEnd, finalLeftBearing, leftDistanceM))
-      right.push(rightDistanceM > 0 ? projectCoordinate(segmentEnd, finalRightBearing, rightDistanceM) : [...segmentEnd] as LonLatAlt)
+      setOffsets(i + 1, finalBearing)
     } else {
-      left.push(projectCoordinate(segmentEnd, leftBearing, leftDistanceM))
-      right.push(rightDistanceM > 0 ? projectCoordinate(segmentEnd, rightBearing, rightDistanceM) : [...segmentEnd] as LonLatAlt)
+      setOffsets(i + 1, segmentBearing)
     }
   }
   
@@ -96,40 +110,91 @@ export function generateLeftRightCorridor(track: LonLatAlt[], leftDistanceM = 30
   }
 }
 
-export function findNamedPoints(input: GeoJSON): { sp?: LonLatAlt, tps: Array<{ name: string, coord: LonLatAlt }>, fp?: LonLatAlt } {
-  const out: { sp?: LonLatAlt, tps: Array<{ name: string, coord: LonLatAlt }>, fp?: LonLatAlt } = { tps: [] }
+type NamedPoints = { sp?: LonLatAlt, tps: Array<{ name: string, coord: LonLatAlt }>, fp?: LonLatAlt }
+type GateCandidate = { center: LonLatAlt, line: Feature<LineString> }
+
+// Record `f` in `out` when it is a named SP / TP / FP point.
+function collectNamedPoint(out: NamedPoints, f: Feature) {
+  const geom = f.geometry
+  const nameRaw = (f.properties?.name || f.properties?.Name || f.properties?.title) as string | undefined
+  const name = nameRaw?.trim()
+  if (geom?.type === 'Point' && name) {
+    const p = geom as Point
+    const c = p.coordinates as LonLatAlt
+    if (name === 'SP') out.sp = c
+    else if (name === 'FP') out.fp = c
+    // Rally/Precision source KMLs name turning points as `TP n` or
+    // `CP n` (Control Point) depending on the authoring tool.
+    // Accept either prefix, optional space, one or more digits
+    // (e.g. `TP1`, `TP 1`, `TP10`, `CP 15`) — feedback 2026-04-23.
+    else if (/^(TP|CP)\s?\d+\b/i.test(name)) out.tps.push({ name, coord: c })
+  }
+}
+
+function sortTpsByNumber(tps: Array<{ name: string, coord: LonLatAlt }>) {
+  tps.sort((a, b) => {
+    const na = parseInt(a.name.replace(/\D/g, '') || '0', 10)
+    const nb = parseInt(b.name.replace(/\D/g, '') || '0', 10)
+    return na - nb
+  })
+}
+
+export function findNamedPoints(input: GeoJSON): NamedPoints {
+  const out: NamedPoints = { tps: [] }
   function scan(g: any) {
     if (!g) return
     if (g.type === 'FeatureCollection') {
       for (const f of (g as FeatureCollection).features) scan(f)
     } else if (g.type === 'Feature') {
-      const f = g as Feature
-      const geom = f.geometry
-      const nameRaw = (f.properties?.name || f.properties?.Name || f.properties?.title) as string | undefined
-      const name = nameRaw?.trim()
-      if (geom?.type === 'Point' && name) {
-        const p = geom as Point
-        const c = p.coordinates as LonLatAlt
-        if (name === 'SP') out.sp = c
-        else if (name === 'FP') out.fp = c
-        // Rally/Precision source KMLs name turning points as `TP n` or
-        // `CP n` (Control Point) depending on the authoring tool.
-        // Accept either prefix, optional space, one or more digits
-        // (e.g. `TP1`, `TP 1`, `TP10`, `CP 15`) — feedback 2026-04-23.
-        else if (/^(TP|CP)\s?\d+\b/i.test(name)) out.tps.push({ name, coord: c })
-      }
+      collectNamedPoint(out, g as Feature)
     }
   }
   scan(input)
   // sort TPs by number if present
-  out.tps.sort((a, b) => {
-    const na = parseInt(a.name.replace(/\D/g, '') || '0', 10)
-    const nb = parseInt(b.name.replace(/\D/g, '') || '0', 10)
-    return na - nb
-  })
+  sortTpsByNumber(out.tps)
   return out
 }
 
+/**
+ * Everything corridor generation reads from the input, collected in one
+ * walk: the named SP/TP/FP points, the track segments, and the TP gate
+ * perpendiculars (3-coord lines) used to pin exact waypoints.
+ *
+ * These used to come from four separate traversals — `findNamedPoints`
+ * twice, `extractAllSegments` and `extractGateCenterCandidates` — with the
+ * gate-perpendicular test run twice for every 3-coord line. Each line is
+ * now classified once: a gate perpendicular becomes a candidate, anything
+ * else a segment, exactly as the separate passes split them.
+ */
+function scanCourse(input: GeoJSON): { named: NamedPoints, segments: Segment[], gateCandidates: GateCandidate[] } {
+  const named: NamedPoints = { tps: [] }
+  const segments: Segment[] = []
+  const gateCandidates: GateCandidate[] = []
+  let index = 0
+  function addLine(coords: LonLatAlt[]) {
+    if (isTpGatePerpendicular(coords)) {
+      gateCandidates.push({ center: coords[1], line: lineString(coords as Position[]) })
+    } else {
+      segments.push({ index: index++, coordinates: coords })
+    }
+  }
+  function scan(g: any) {
+    if (!g) return
+    if (g.type === 'FeatureCollection') {
+      for (const f of (g as FeatureCollection).features) scan(f)
+    } else if (g.type === 'Feature') {
+      const f = g as Feature
+      if (f.geometry?.type === 'LineString') addLine((f.geometry as LineString).coordinates as LonLatAlt[])
+      else collectNamedPoint(named, f)
+    } else if (g.type === 'LineString') {
+      addLine((g as LineString).coordinates as LonLatAlt[])
+    }
+  }
+  scan(input)
+  sortTpsByNumber(named.tps)
+  return { named, segments, gateCandidates }
+}
+
 // Removed redundant dashed-pair heuristics; rely on continuity and main-track-only build
 
 export function nearestTrackIndex(track: LonLatAlt[], target: LonLatAlt): number {
@@ -145,20 +210,36 @@ export function nearestTrackIndex(track: LonLatAlt[], target: LonLatAlt): number
   return bestIdx
 }
 
-export function pointAtDistanceAlongTrack(track: LonLatAlt[], startIdx: number, distanceMeters: number): { point: LonLatAlt, bearing: number, segmentIndex: number } | null {
-  // walk segments from startIdx and interpolate
-  let remaining = distanceMeters
-  for (let i = startIdx; i < track.length - 1; i++) {
+/**
+ * Point `distanceMeters` along the track after vertex `startIdx`.
+ *
+ * `cum` is `cumulativeDistances(track)`. Callers resolving several markers
+ * on the same track (SP and every TP) compute it once and pass it in, so
+ * each query is a binary search over the track instead of a walk that
+ * re-measured every segment from `startIdx`.
+ */
+export function pointAtDistanceAlongTrack(
+  track: LonLatAlt[],
+  startIdx: number,
+  distanceMeters: number,
+  cum: Float64Array = cumulativeDistances(track)
+): { point: LonLatAlt, bearing: number, segmentIndex: number } | null {
+  // First vertex k > startIdx whose distance reaches the target; the point
+  // lies on segment k - 1.
+  const target = cum[startIdx] + distanceMeters
+  let lo = startIdx + 1
+  let hi = track.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (cum[mid] < target) lo = mid + 1
+    else hi = mid
+  }
+  if (lo < track.length) {
+    const i = lo - 1
     const a = track[i]
-    const b = track[i + 1]
-    // use turf distance
-    const segLenM = turfLength(lineString([ [a[0], a[1]], [b[0], b[1]] ]), { units: 'kilometers' }) * 1000
-    if (remaining <= segLenM) {
-      const brg = calculateBearing(a, b)
-      const p = projectCoordinate(a, brg, remaining)
-      return { point: p, bearing: brg, segmentIndex: i }
-    }
-    remaining -= segLenM
+    const brg = calculateBearing(a, track[i + 1])
+    const p = projectCoordinate(a, brg, target - cum[i])
+    return { point: p, bearing: brg, segmentIndex: i }
   }
   const lastBrg = calculateBearing(track[track.length - 2], track[track.length - 1])
   return { point: track[track.length - 1], bearing: lastBrg, segmentIndex: track.length - 2 }
@@ -188,17 +269,47 @@ function isSpanOnMain(fromIdx: number, toIdx: number, sourceSegIdx: number[], ga
   return true
 }
 
+type AlongTrackPoint = ReturnType<typeof pointAtDistanceAlongTrack>
+
+/**
+ * Per-track lookups shared by everything that resolves markers on one
+ * continuous track: the nearest-vertex index, and a memo of along-track
+ * points keyed by (start vertex, distance) over one `cumulativeDistances`.
+ *
+ * `buildPreciseCorridorsAndGates` builds one and hands it to
+ * `generateSegmentedCorridors`, so the track is measured and indexed once
+ * per run, and the gate after SP / each TP and the corridor starting there
+ * come from the same resolved point instead of two searches.
+ */
+type TrackLookup = {
+  nearestIdx: NearestTrackIndex
+  alongFrom: (startIdx: number, distanceMeters: number) => AlongTrackPoint
+}
+
+function createTrackLookup(track: LonLatAlt[]): TrackLookup {
+  const cum = cumulativeDistances(track)
+  const alongCache = new Map<string, AlongTrackPoint>()
+  const alongFrom = (startIdx: number, distanceMeters: number) => {
+    const key = `${startIdx}:${distanceMeters}`
+    let along = alongCache.get(key)
+    if (along === undefined) {
+      along = pointAtDistanceAlongTrack(track, startIdx, distanceMeters, cum)
+      alongCache.set(key, along)
+    }
+    return along
+  }
+  return { nearestIdx: createNearestTrackIndex(track), alongFrom }
+}
+
 function maybeBuildGateFromStartIdxDistance(
-  track: LonLatAlt[],
   startIdx: number,
-  distanceMeters: number,
+  along: AlongTrackPoint,
   leftDistanceM: number,
   rightDistanceM: number,
   sourceSegIdx: number[],
   gapAfterIndex: boolean[],
   mainSegmentIndexSet: Set<number>
 ): Feature<LineString> | null {
-  const along = pointAtDistanceAlongTrack(track, startIdx, distanceMeters)
   if (!along) return null
   const fromIdx = Math.min(startIdx, along.segmentIndex)
   const toIdx = Math.max(startIdx, along.segmentIndex)
@@ -257,7 +368,8 @@ export function generateSegmentedCorridors(
   mainSegmentIndexSet: Set<number>,
   _segments: Segment[],
   spAfterNm: number = 5,
-  tpAfterNm: number = 1
+  tpAfterNm: number = 1,
+  lookup: TrackLookup = createTrackLookup(track)
 ): { leftSegments: Feature<LineString>[], rightSegments: Feature<LineString>[], endGates: Feature<LineString>[] } {
   log('\n=== GENERATING SEGMENTED CORRIDORS ===')
   
@@ -274,14 +386,19 @@ export function generateSegmentedCorridors(
   
   log(`✅ Found: SP + ${waypoints.tps.length} TPs + ${waypoints.fp ? 'FP' : 'no FP'}`)
   
+  // SP and every TP are resolved twice below — once for the gate position,
+  // again for the corridor start — with the same start vertex and distance;
+  // `alongFrom` memoizes them (see `TrackLookup`).
+  const { nearestIdx, alongFrom } = lookup
+
   // Step 2: Calculate all gate positions (where corridors START)
   const gatePositions: Array<{ trackIdx: number, name: string, distanceNM: number }> = []
   
   // Gate 1: X NM after SP (default 5NM)
-  const spIdx = nearestTrackIndex(track, waypoints.sp)
-  const spNmResult = pointAtDistanceAlongTrack(track, spIdx, spAfterNm * NM)
+  const spIdx = nearestIdx(waypoints.sp)
+  const spNmResult = alongFrom(spIdx, spAfterNm * NM)
   if (spNmResult) {
-    const spNmIdx = nearestTrackIndex(track, spNmResult.point)
+    const spNmIdx = nearestIdx(spNmResult.point)
     gatePositions.push({ trackIdx: spNmIdx, name: `${spAfterNm}NM-after-SP`, distanceNM: spAfterNm })
     log(`📍 Gate 1: ${spAfterNm}NM after SP at track index ${spNmIdx}`)
   }
@@ -289,10 +406,10 @@ export function generateSegmentedCorridors(
   // Gates 2+: tpAfterNm after each TP
   for (let i = 0; i < waypoints.tps.length; i++) {
     const tp = waypoints.tps[i]
-    const tpIdx = nearestTrackIndex(track, tp.coord)
-    const tpNmResult = pointAtDistanceAlongTrack(track, tpIdx, tpAfterNm * NM)
+    const tpIdx = nearestIdx(tp.coord)
+    const tpNmResult = alongFrom(tpIdx, tpAfterNm * NM)
     if (tpNmResult) {
-      const tpNmIdx = nearestTrackIndex(track, tpNmResult.point)
+      const tpNmIdx = nearestIdx(tpNmResult.point)
       gatePositions.push({ trackIdx: tpNmIdx, name: `${tpAfterNm}NM-after-${tp.name}`, distanceNM: tpAfterNm })
       log(`📍 Gate ${i + 2}: ${tpAfterNm}NM after ${tp.name} at track index ${tpNmIdx}`)
     }
@@ -307,7 +424,7 @@ export function generateSegmentedCorridors(
   
   // Segment 1: XNM-after-SP → TP1
   if (gatePositions.length > 0 && waypoints.tps.length > 0) {
-    const startGateAlong = pointAtDistanceAlongTrack(track, spIdx, spAfterNm * NM)
+    const startGateAlong = alongFrom(spIdx, spAfterNm * NM)
     // FIXED: Use exact gate position and bearing, don't re-snap
     const start = startGateAlong ? 
       { point: startGateAlong.point, segmentIndex: startGateAlong.segmentIndex, bearing: startGateAlong.bearing } :
@@ -324,8 +441,10 @@ export function generateSegmentedCorridors(
         leftSegments.push(lineString(lr.left.geometry.coordinates as Position[], { segment: `${spAfterNm}NM-after-SP→TP1` }))
         rightSegments.push(lineString(lr.right.geometry.coordinates as Position[], { segment: `${spAfterNm}NM-after-SP→TP1` }))
       }
-      const sliceLength = preciseSlice.reduce((acc, c, i) => i === 0 ? 0 : acc + calculateDistance(preciseSlice[i - 1], c), 0)
-      log(`🟢 Corridor 1: ${gatePositions[0].name} → TP1 (${start.segmentIndex}→${end.segmentIndex}), ${(sliceLength/1000).toFixed(2)} km`)
+      if (DEBUG) {
+        const sliceLength = segmentLengths(preciseSlice).reduce((acc, len) => acc + len, 0)
+        log(`🟢 Corridor 1: ${gatePositions[0].name} → TP1 (${start.segmentIndex}→${end.segmentIndex}), ${(sliceLength/1000).toFixed(2)} km`)
+      }
     } else {
       log(`❌ Skipping ${spAfterNm}NM-after-SP→TP1: slice too short`)
     }
@@ -334,7 +453,7 @@ export function generateSegmentedCorridors(
   // Segments 2+: 1NM-after-TPn → TP(n+1)
   for (let i = 1; i < gatePositions.length; i++) {
     const gateAlong = i - 1 < waypoints.tps.length
-      ? pointAtDistanceAlongTrack(track, nearestTrackIndex(track, waypoints.tps[i - 1].coord), tpAfterNm * NM)
+      ? alongFrom(nearestIdx(waypoints.tps[i - 1].coord), tpAfterNm * NM)
       : null
     // FIXED: Use exact gate position and bearing, don't re-snap
     const start = gateAlong ? 
@@ -397,39 +516,7 @@ export function generateSegmentedCorridors(
   return { leftSegments, rightSegments, endGates }
 }
 
-function extractGateCenterCandidates(input: GeoJSON): Array<{ center: LonLatAlt, line: Feature<LineString> } > {
-  const out: Array<{ center: LonLatAlt, line: Feature<LineString> }> = []
-  function scan(g: any) {
-    if (!g) return
-    if (g.type === 'FeatureCollection') {
-      for (const f of (g as FeatureCollection).features) scan(f)
-    } else if (g.type === 'Feature') {
-      const f = g as Feature
-      const geom = f.geometry
-      if (geom?.type === 'LineString') {
-        const ls = geom as LineString
-        const coords = ls.coordinates as LonLatAlt[]
-        if (isTpGatePerpendicular(coords)) {
-          const center = coords[1]
-          out.push({ center, line: lineString(coords as Position[]) })
-        }
-      }
-    } else if (g.type === 'LineString') {
-      const ls = g as LineString
-      const coords = ls.coordinates as LonLatAlt[]
-      if (isTpGatePerpendicular(coords)) {
-        const center = coords[1]
-        out.push({ center, line: lineString(coords as Position[]) })
-      }
-    }
-  }
-  scan(input)
-  return out
-}
-
-function computeExactWaypoints(input: GeoJSON, track: LonLatAlt[]): { sp?: LonLatAlt, tps: Array<{ name: string, coord: LonLatAlt }>, fp?: LonLatAlt, exactPointFeatures: Feature<Point>[] } {
-  const named = findNamedPoints(input)
-  const candidates = extractGateCenterCandidates(input)
+function computeExactWaypoints(named: NamedPoints, candidates: GateCandidate[], track: LonLatAlt[]): { sp?: LonLatAlt, tps: Array<{ name: string, coord: LonLatAlt }>, fp?: LonLatAlt, exactPointFeatures: Feature<Point>[] } {
   const exactPointFeatures: Feature<Point>[] = []
   const result: { sp?: LonLatAlt, tps: Array<{ name: string, coord: LonLatAlt }>, fp?: LonLatAlt } = { tps: [] }
 
@@ -485,34 +572,33 @@ function computeExactWaypoints(input: GeoJSON, track: LonLatAlt[]): { sp?: LonLa
   }
 
   // keep TP order
-  result.tps.sort((a, b) => {
-    const na = parseInt(a.name.replace(/\D/g, '') || '0', 10)
-    const nb = parseInt(b.name.replace(/\D/g, '') || '0', 10)
-    return na - nb
-  })
+  sortTpsByNumber(result.tps)
 
   return { ...result, exactPointFeatures }
 }
 
 export function buildPreciseCorridorsAndGates(input: GeoJSON, config: DisciplineConfig = DISCIPLINE_CONFIGS.rally): { gates: Feature<LineString>[], points: Feature<Point>[], exactPoints: Feature<Point>[], leftSegments: Feature<LineString>[], rightSegments: Feature<LineString>[] } {
   const { spAfterNm, tpAfterNm, leftDistanceM, rightDistanceM } = config
-  const { track, sourceSegIdx, gapAfterIndex, segments, mainSegmentIndexSet } = buildContinuousTrackWithSources(input)
+  const course = scanCourse(input)
+  const { track, sourceSegIdx, gapAfterIndex, segments, mainSegmentIndexSet } = buildContinuousTrackWithSources(input, course.segments)
   const gates: Feature<LineString>[] = []
   const points: Feature<Point>[] = []
   const exactPoints: Feature<Point>[] = []
   const leftSegments: Feature<LineString>[] = []
   const rightSegments: Feature<LineString>[] = []
   
-  const named = findNamedPoints(input)
-  const { sp, tps, fp, exactPointFeatures } = computeExactWaypoints(input, track)
+  const named = course.named
+  const { sp, tps, fp, exactPointFeatures } = computeExactWaypoints(named, course.gateCandidates, track)
   exactPoints.push(...exactPointFeatures)
+  const lookup = createTrackLookup(track)
+  const { nearestIdx, alongFrom } = lookup
   const NM = 1852
   
   // Add SP point label
   if (named.sp) points.push(point([named.sp[0], named.sp[1]], { name: 'SP', role: 'waypoint' }) as Feature<Point>)
   if (sp) {
-    const idx = nearestTrackIndex(track, sp)
-    const gate = maybeBuildGateFromStartIdxDistance(track, idx, spAfterNm * NM, leftDistanceM, rightDistanceM, sourceSegIdx, gapAfterIndex, mainSegmentIndexSet)
+    const idx = nearestIdx(sp)
+    const gate = maybeBuildGateFromStartIdxDistance(idx, alongFrom(idx, spAfterNm * NM), leftDistanceM, rightDistanceM, sourceSegIdx, gapAfterIndex, mainSegmentIndexSet)
     if (gate) gates.push(gate)
   }
   
@@ -524,8 +610,8 @@ export function buildPreciseCorridorsAndGates(input: GeoJSON, config: Discipline
     if (labelTp) {
       points.push(point([labelTp.coord[0], labelTp.coord[1]], { name: labelTp.name, role: 'waypoint' }) as Feature<Point>)
     }
-    const idx = nearestTrackIndex(track, tp.coord)
-    const gate = maybeBuildGateFromStartIdxDistance(track, idx, tpAfterNm * NM, leftDistanceM, rightDistanceM, sourceSegIdx, gapAfterIndex, mainSegmentIndexSet)
+    const idx = nearestIdx(tp.coord)
+    const gate = maybeBuildGateFromStartIdxDistance(idx, alongFrom(idx, tpAfterNm * NM), leftDistanceM, rightDistanceM, sourceSegIdx, gapAfterIndex, mainSegmentIndexSet)
     if (gate) gates.push(gate)
   }
   
@@ -534,7 +620,7 @@ export function buildPreciseCorridorsAndGates(input: GeoJSON, config: Discipline
   
   // Generate segmented corridors with forbidden zones using exact waypoints
   if (track.length >= 2) {
-    const corridorSegments = generateSegmentedCorridors(track, { sp, tps, fp }, leftDistanceM, rightDistanceM, input, sourceSegIdx, gapAfterIndex, mainSegmentIndexSet, segments, spAfterNm, tpAfterNm)
+    const corridorSegments = generateSegmentedCorridors(track, { sp, tps, fp }, leftDistanceM, rightDistanceM, input, sourceSegIdx, gapAfterIndex, mainSegmentIndexSet, segments, spAfterNm, tpAfterNm, lookup)
     leftSegments.push(...corridorSegments.leftSegments)
     rightSegments.push(...corridorSegments.rightSegments)
     // Note: endGates are available in corridorSegments.endGates if needed
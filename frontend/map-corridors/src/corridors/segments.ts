@@ -7,17 +7,94 @@ export type Segment = {
   coordinates: LonLatAlt[]
 }
 
+// Radius (metres) for every haversine length in this module.
+const HAVERSINE_RADIUS_M = 6371000
+
+/**
+ * Great-circle distance for a haversine term `a` (sin²(Δφ/2) + …), in
+ * metres. The atan2(√a, √(1−a)) form stays accurate near antipodes where
+ * asin(√a) loses precision — but rounding can push `a` a hair above 1 for
+ * (near-)antipodal pairs, and √(1−a) then turned the whole distance into
+ * NaN; clamping keeps it at half the circumference.
+ */
+function haversineDistance(a: number): number {
+  return HAVERSINE_RADIUS_M * 2 * Math.atan2(Math.sqrt(a), Math.sqrt(Math.max(0, 1 - a)))
+}
+
 export function calculateDistance(coord1: LonLatAlt, coord2: LonLatAlt): number {
   const [lon1, lat1] = coord1
   const [lon2, lat2] = coord2
-  const R = 6371000
   const lat1Rad = lat1 * Math.PI / 180
   const lat2Rad = lat2 * Math.PI / 180
   const deltaLat = (lat2 - lat1) * Math.PI / 180
   const deltaLon = (lon2 - lon1) * Math.PI / 180
   const a = Math.sin(deltaLat/2) ** 2 + Math.cos(lat1Rad) * Math.cos(lat2Rad) * Math.sin(deltaLon/2) ** 2
-  const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a))
-  return R * c
+  return haversineDistance(a)
+}
+
+/**
+ * Haversine length (metres) of every segment of `track` in one pass:
+ * `out[i]` is the distance from `track[i]` to `track[i + 1]`, with the same
+ * formula and radius as `calculateDistance`.
+ *
+ * Corridor generation needs the length of every segment of a track, and
+ * calling `calculateDistance` (or building a turf `lineString` per pair for
+ * `turfLength`) in a loop allocated per segment and evaluated cos(lat) twice
+ * for every vertex. Here each vertex's latitude is converted and its cosine
+ * taken once, then reused for both segments that share it.
+ */
+export function segmentLengths(track: LonLatAlt[]): Float64Array {
+  const n = Math.max(0, track.length - 1)
+  const out = new Float64Array(n)
+  if (n === 0) return out
+  const toRad = Math.PI / 180
+  let prevLat = track[0][1] * toRad
+  let prevLon = track[0][0] * toRad
+  let prevCos = Math.cos(prevLat)
+  for (let i = 0; i < n; i++) {
+    const next = track[i + 1]
+    const lat = next[1] * toRad
+    const lon = next[0] * toRad
+    const cosLat = Math.cos(lat)
+    const sinDLat = Math.sin((lat - prevLat) / 2)
+    const sinDLon = Math.sin((lon - prevLon) / 2)
+    const a = sinDLat * sinDLat + prevCos * cosLat * sinDLon * sinDLon
+    out[i] = haversineDistance(a)
+    prevLat = lat
+    prevLon = lon
+    prevCos = cosLat
+  }
+  return out
+}
+
+/**
+ * Distance along `track` from its first vertex to each vertex (metres):
+ * `out[0] = 0`, `out[i] = out[i - 1] + length of segment i - 1`. Lets
+ * "how far is it from vertex a to vertex b" be answered as `out[b] - out[a]`
+ * and "where is the point d metres after vertex a" by binary search,
+ * instead of re-walking and re-measuring segments for every query.
+ */
+export function cumulativeDistances(track: LonLatAlt[]): Float64Array {
+  const out = new Float64Array(track.length)
+  const lengths = segmentLengths(track)
+  for (let i = 0; i < lengths.length; i++) out[i + 1] = out[i] + lengths[i]
+  return out
+}
+
+/**
+ * Whether `a` and `b` are less than `meters` apart, for short thresholds.
+ *
+ * Uses the equirectangular approximation (longitude scaled by cos of `a`'s
+ * latitude) and compares squared lengths, so there is one cosine and no
+ * sqrt/atan2. For the tens-of-metres checks it serves, it agrees with
+ * `calculateDistance` to well under a millimetre; do not use it for
+ * kilometre-scale distances.
+ */
+export function isWithinMeters(a: LonLatAlt, b: LonLatAlt, meters: number): boolean {
+  const toRad = Math.PI / 180
+  const dy = (b[1] - a[1]) * toRad * HAVERSINE_RADIUS_M
+  const dx = (b[0] - a[0]) * toRad * HAVERSINE_RADIUS_M * Math.cos(a[1] * toRad)
+  return dx * dx + dy * dy < meters * meters
 }
 
 export function isDashedConnectorLine(coords: LonLatAlt[]): boolean {
@@ -70,8 +147,9 @@ export function extractAllSegments(input: GeoJSON): Segment[] {
   return segments
 }
 
-export function buildContinuousTrackWithSources(input: GeoJSON): { track: LonLatAlt[], sourceSegIdx: number[], gapAfterIndex: boolean[], segments: Segment[], mainSegmentIndexSet: Set<number> } {
-  const allSegments = extractAllSegments(input)
+// `allSegments` lets a caller that already walked the input (see
+// `scanCourse` in preciseCorridor.ts) skip a second traversal.
+export function buildContinuousTrackWithSources(input: GeoJSON, allSegments: Segment[] = extractAllSegments(input)): { track: LonLatAlt[], sourceSegIdx: number[], gapAfterIndex: boolean[], segments: Segment[], mainSegmentIndexSet: Set<number> } {
   const mainTrackSegments = allSegments.filter(seg => !isDashedConnectorLine(seg.coordinates))
   const sortedSegments = mainTrackSegments.sort((a, b) => a.index - b.index)
 
@@ -91,8 +169,8 @@ export function buildContinuousTrackWithSources(input: GeoJSON): { track: LonLat
     } else {
       const lastPoint = detailedTrack[detailedTrack.length - 1]
       const firstPoint = coords[0]
-      const distance = calculateDistance(lastPoint, firstPoint)
-      if (distance < 50) {
+      // Segments that continue within 50 m join without a gap.
+      if (isWithinMeters(lastPoint, firstPoint, 50)) {
         for (let k = 1; k < coords.length; k++) {
           detailedTrack.push(coords[k])
           sourceSegIdx.push(segment.index)
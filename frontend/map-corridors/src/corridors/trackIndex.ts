@@ -0,0 +1,81 @@
+import type { LonLatAlt } from './segments'
+
+export type NearestTrackIndex = (target: LonLatAlt) => number
+
+/**
+ * Build a nearest-vertex lookup for a fixed track. The returned function
+ * gives exactly what `nearestTrackIndex(track, target)` gives (same planar
+ * lon/lat metric, lowest index on ties), without scanning every vertex.
+ *
+ * Corridor generation asks for the nearest vertex of the same track for
+ * SP, every TP (twice) and every gate point — each call used to be a full
+ * O(N) scan, so a multi-thousand-vertex course paid N work per marker.
+ * Vertices are sorted by longitude once (O(N log N)); a query binary-searches
+ * the target's longitude and sweeps outwards on both sides, stopping a side
+ * as soon as the longitude gap alone exceeds the best distance found.
+ *
+ * The sorted vertices are copied into parallel typed arrays (longitude,
+ * latitude, original index) rather than read back through `track[i]`: a
+ * sweep then walks three contiguous runs of numbers instead of chasing a
+ * pointer to a separate boxed tuple for every vertex it inspects.
+ */
+export function createNearestTrackIndex(track: LonLatAlt[]): NearestTrackIndex {
+  const n = track.length
+  const order = new Uint32Array(n)
+  for (let i = 0; i < n; i++) order[i] = i
+  order.sort((a, b) => (track[a][0] - track[b][0]) || (a - b))
+  const xs = new Float64Array(n)
+  const ys = new Float64Array(n)
+  for (let k = 0; k < n; k++) {
+    const c = track[order[k]]
+    xs[k] = c[0]
+    ys[k] = c[1]
+  }
+
+  return (target: LonLatAlt): number => {
+    const tx = target[0]
+    const ty = target[1]
+    let lo = 0
+    let hi = n
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1
+      if (xs[mid] < tx) lo = mid + 1
+      else hi = mid
+    }
+    let bestIdx = 0
+    let bestDist = Infinity
+    let right = lo
+    let left = lo - 1
+    let rightOpen = right < n
+    let leftOpen = left >= 0
+    while (rightOpen || leftOpen) {
+      if (rightOpen) {
+        const dx = xs[right] - tx
+        // `>` rather than `>=` so an equally distant vertex with a lower
+        // index is still visited and wins the tie, as in the linear scan.
+        if (dx * dx > bestDist) {
+          rightOpen = false
+        } else {
+          const idx = order[right]
+          const dy = ys[right] - ty
+          const d = dx * dx + dy * dy
+          if (d < bestDist || (d === bestDist && idx < bestIdx)) { bestDist = d; bestIdx = idx }
+          rightOpen = ++right < n
+        }
+      }
+      if (leftOpen) {
+        const dx = xs[left] - tx
+        if (dx * dx > bestDist) {
+          leftOpen = false
+        } else {
+          const idx = order[left]
+          const dy = ys[left] - ty
+          const d = dx * dx + dy * dy
+          if (d < bestDist || (d === bestDist && idx < bestIdx)) { bestDist = d; bestIdx = idx }
+          leftOpen = --left >= 0
+        }
+      }
+    }
+    return bestIdx
+  }
+}
@@ -4,6 +4,7 @@ import type { Discipline } from '../corridors/preciseCorridor'
 import type { NoGpsPhoto, PhotoMarker, GroundMarker, PhotoFlag } from '../types/markers'
 import { sanitizeGroundMarkers, sanitizeNoGpsPhotos, sanitizePhotoMarkers } from '../types/markers'
 import {
+  createCoalescedWriter,
   deletePhotoThumb,
   initStorage,
   isStorageAvailable,
@@ -221,6 +222,16 @@ export function useCorridorSessionOPFS(competitionId?: string | null) {
 
   const storageRef = useRef<StorageInterface | null>(null)
   const sessionDirRef = useRef<DirectoryHandle | null>(null)
+  // Every marker drag / relabel persists the whole session. Unserialized,
+  // a fast drag queued one full session.json rewrite per event, and since
+  // overlapping writes can finish in any order an older snapshot could land
+  // last. The coalescing writer keeps one write in flight and folds
+  // everything submitted meanwhile into a single write of the newest state.
+  const [sessionWriter] = useState(() => createCoalescedWriter<{
+    storage: StorageInterface
+    dir: DirectoryHandle
+    session: CorridorsSession
+  }>(({ storage, dir, session }) => storage.writeJSON(dir, 'session.json', session)))
   // Mirror of `session` for stable setters. Closure-over-`session` would
   // freeze the value seen by `setMarkers` etc. at the render where the
   // setter was created, so a stale setter captured by a long-lived effect
@@ -355,13 +366,13 @@ export function useCorridorSessionOPFS(competitionId?: string | null) {
     const dir = sessionDirRef.current
     if (storage && dir) {
       try {
-        await storage.writeJSON(dir, 'session.json', next)
+        await sessionWriter({ storage, dir, session: next })
       } catch (e) {
         console.error('Failed to persist corridors session', e)
         setError('Failed to persist session')
       }
     }
-  }, [])
+  }, [sessionWriter])
 
   // All setters below read the live session from `sessionRef` rather than
   // closing over `session`. This makes them stable across renders, which
@@ -6,11 +6,30 @@ export async function parseFileToGeoJSON(file: File): Promise<GeoJSON> {
   return parseTextToGeoJSON(text, file.name)
 }
 
+/**
+ * The `<parsererror>` element a DOMParser reports a malformed document with.
+ * Gecko (and jsdom) make it the document element; Blink/WebKit insert it as
+ * the first child of the partially parsed root. Only those two places are
+ * checked: a document-wide `getElementsByTagName` / `querySelector` on a
+ * *valid* file found nothing and so walked the whole tree — twice, once per
+ * lookup — before togeojson walked it again to convert it, which for a
+ * long track KML meant two extra passes over every node.
+ */
+function findParseError(xml: Document): Element | null {
+  const root = xml.documentElement
+  if (!root) return null
+  if (root.nodeName === 'parsererror') return root
+  for (let el = root.firstElementChild; el; el = el.nextElementSibling) {
+    if (el.nodeName === 'parsererror') return el
+  }
+  return null
+}
+
 export function parseTextToGeoJSON(text: string, fileNameHint?: string): GeoJSON {
   const parser = new DOMParser()
   const xml = parser.parseFromString(text, 'application/xml')
   // Detect XML parse errors
-  const parseError = xml.getElementsByTagName('parsererror')[0] || (xml as any).querySelector?.('parsererror')
+  const parseError = findParseError(xml)
   if (parseError) {
     const msg = parseError.textContent || 'Invalid XML'
     throw new Error(`XML parse error: ${msg}`)
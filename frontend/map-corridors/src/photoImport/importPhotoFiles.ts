@@ -3,6 +3,7 @@
 
 import { extractExif } from './extractExif'
 import { generateThumb } from './generateThumb'
+import { isHeicContent } from './isHeicContent'
 import type {
   ImportedPhoto,
   ImportFailure,
@@ -97,6 +98,11 @@ export async function importPhotoFiles(
       if (idx >= queue.length) return
       const file = queue[idx]
       try {
+        // Mislabelled HEIC (Apple Photos writes `.jpg` over HEIC bytes) is
+        // rejected by extractExif anyway — sniff the header first so the
+        // full decode and SHA-1 over a multi-MB file don't run for a photo
+        // that is about to fail.
+        if (await isHeicContent(file)) throw new HeicNotSupportedError(file.name)
         const [exif, thumbnail, contentHash] = await Promise.all([
           extractExif(file),
           generateThumb(file),
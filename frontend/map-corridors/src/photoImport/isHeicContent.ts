@@ -0,0 +1,25 @@
+// Content sniff for HEIC/HEIF. Split out of extractExif so the import
+// pipeline can reject HEIC from a 12-byte read before starting any of the
+// full-file work (decode, hash, EXIF parse).
+
+// ISO base-media-file-format brands that exifr/photo-helper cannot decode.
+// Apple HEIC and its HEVC-derived codec brands all share the `ftyp` box
+// layout. We deliberately do NOT include the generic `mif1`/`msf1` MIAF
+// brands here — many JPEG-encoded HEIF files use those brands and exifr
+// CAN parse them. Treating mif1 as HEIC produced false "HEIC not
+// supported" rejections on otherwise-valid images.
+const HEIC_FTYP_BRANDS: ReadonlySet<string> = new Set([
+  'heic', 'heix', 'heim', 'heis', 'hevc', 'hevx',
+])
+
+// HEIC/HEIF detection by content (ADR-006). Filename extension is not
+// trusted — Apple Photos export sometimes writes `.jpg` over HEIC bytes.
+// Layout: bytes 0..3 = box size, 4..7 = "ftyp", 8..11 = brand.
+export async function isHeicContent(file: File | Blob): Promise<boolean> {
+  if (file.size < 12) return false
+  const head = await file.slice(0, 12).arrayBuffer()
+  const b = new Uint8Array(head)
+  if (b[4] !== 0x66 || b[5] !== 0x74 || b[6] !== 0x79 || b[7] !== 0x70) return false
+  const brand = String.fromCharCode(b[8], b[9], b[10], b[11]).toLowerCase()
+  return HEIC_FTYP_BRANDS.has(brand)
+}
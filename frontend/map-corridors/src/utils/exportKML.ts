@@ -1,4 +1,5 @@
 import type { Feature, FeatureCollection, GeoJSON, LineString, Point } from 'geojson'
+import { formatKmlCoordinates } from './kmlCoordinates'
 
 function xmlEscape(s: string): string {
   return s
@@ -62,12 +63,9 @@ export function geoJSONToKML(geojson: GeoJSON, filename: string = 'corridors'):
       kml += '    <LineString>\n'
       kml += '      <coordinates>\n'
       
-      lineString.coordinates.forEach(coord => {
-        const lon = coord[0]
-        const lat = coord[1]
-        const alt = coord[2] || 0
-        kml += `        ${lon},${lat},${alt}\n`
-      })
+      if (lineString.coordinates.length > 0) {
+        kml += formatKmlCoordinates(lineString.coordinates, '\n', '        ') + '\n'
+      }
       
       kml += '      </coordinates>\n'
       kml += '    </LineString>\n'
@@ -0,0 +1,20 @@
+/**
+ * Serialize a coordinate list into the text of a KML `<coordinates>`
+ * element: `lon,lat,alt` tuples (missing altitude → 0), each preceded by
+ * `indent` and joined by `separator`.
+ *
+ * Corridor and track LineStrings run to thousands of vertices and both KML
+ * writers (`geoJSONToKML`, `appendFeaturesToKML`) emit them. Building the
+ * text in one accumulating loop skips the per-vertex template string and
+ * the intermediate array that `map(...).join(...)` materialises before
+ * concatenating, and gives both writers one definition of the tuple format.
+ */
+export function formatKmlCoordinates(coords: ArrayLike<ArrayLike<number>>, separator = '\n', indent = ''): string {
+  let out = ''
+  for (let i = 0; i < coords.length; i++) {
+    const c = coords[i]
+    if (i > 0) out += separator
+    out += indent + c[0] + ',' + c[1] + ',' + (c[2] || 0)
+  }
+  return out
+}
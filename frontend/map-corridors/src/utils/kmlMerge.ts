@@ -1,24 +1,37 @@
 import type { Feature, FeatureCollection, GeoJSON, LineString, Point } from 'geojson'
 import { KML_GROUND_MARKER_ICON_SCALE, KML_PHOTO_MARKER_ICON_SCALE } from './markerSizes'
+import { formatKmlCoordinates } from './kmlCoordinates'
 
 const KML_NS = 'http://www.opengis.net/kml/2.2'
 
-function ensureStyle(doc: Document, id: string, innerXml: string) {
-  const styles = Array.from(doc.getElementsByTagName('Style'))
-  const exists = styles.some(s => s.getAttribute('id') === id)
-  if (exists) return
-  const style = doc.createElementNS(KML_NS, 'Style')
-  style.setAttribute('id', id)
+// Everything the append loop writes into, resolved once per export. The
+// helpers below used to look these up per call — `getElementsByTagName`
+// for the Document on every placemark, a walk over every Style on every
+// `ensureStyle`, and a walk over every Folder for every photo marker — so
+// a course with hundreds of markers re-scanned the growing tree each time.
+type KmlTarget = {
+  doc: Document
+  documentEl: Element
+  // ids of every <Style> already in the document
+  styleIds: Set<string>
+  // `track_photos` folder, found or created on first use
+  photoFolder?: Element
+}
+
+function ensureStyle(target: KmlTarget, id: string, innerXml: string) {
+  if (target.styleIds.has(id)) return
+  const { doc, documentEl } = target
   // naive innerXML injection (safe for our simple styles)
   const container = doc.createElement('div')
   container.innerHTML = `<Style xmlns=\"${KML_NS}\" id=\"${id}\">${innerXml}</Style>`
   const created = container.firstChild as Element
-  const documentEl = doc.getElementsByTagName('Document')[0] || doc.documentElement
-  if (created && documentEl) documentEl.appendChild(created)
+  if (created) {
+    documentEl.appendChild(created)
+    target.styleIds.add(id)
+  }
 }
 
-function ensureFolder(doc: Document, folderName: string): Element {
-  const documentEl = doc.getElementsByTagName('Document')[0] || doc.documentElement
+function ensureFolder(doc: Document, documentEl: Element, folderName: string): Element {
   const folders = Array.from(doc.getElementsByTagName('Folder'))
   for (const f of folders) {
     const nameEl = f.getElementsByTagName('name')[0]
@@ -32,8 +45,8 @@ function ensureFolder(doc: Document, folderName: string): Element {
   return folder
 }
 
-function addLinePlacemark(doc: Document, name: string, coords: number[][], styleId: string, role?: string) {
-  const documentEl = doc.getElementsByTagName('Document')[0] || doc.documentElement
+function addLinePlacemark(target: KmlTarget, name: string, coords: number[][], styleId: string, role?: string) {
+  const { doc, documentEl } = target
   const pm = doc.createElementNS(KML_NS, 'Placemark')
   const nm = doc.createElementNS(KML_NS, 'name')
   nm.textContent = name
@@ -51,7 +64,7 @@ function addLinePlacemark(doc: Document, name: string, coords: number[][], style
   styleUrl.textContent = `#${styleId}`
   const line = doc.createElementNS(KML_NS, 'LineString')
   const coordsEl = doc.createElementNS(KML_NS, 'coordinates')
-  coordsEl.textContent = coords.map(c => `${c[0]},${c[1]},${c[2] || 0}`).join('\n')
+  coordsEl.textContent = formatKmlCoordinates(coords)
   line.appendChild(coordsEl)
   pm.appendChild(nm)
   pm.appendChild(styleUrl)
@@ -59,10 +72,13 @@ function addLinePlacemark(doc: Document, name: string, coords: number[][], style
   documentEl.appendChild(pm)
 }
 
-function addPointPlacemark(doc: Document, name: string, coord: number[], role?: string, styleId?: string, markerType?: string) {
-  const parentEl = role === 'track_photos'
-    ? ensureFolder(doc, 'track_photos')
-    : (doc.getElementsByTagName('Document')[0] || doc.documentElement)
+function addPointPlacemark(target: KmlTarget, name: string, coord: number[], role?: string, styleId?: string, markerType?: string) {
+  const { doc } = target
+  let parentEl = target.documentEl
+  if (role === 'track_photos') {
+    target.photoFolder ??= ensureFolder(doc, target.documentEl, 'track_photos')
+    parentEl = target.photoFolder
+  }
   const pm = doc.createElementNS(KML_NS, 'Placemark')
   const nm = doc.createElementNS(KML_NS, 'name')
   nm.textContent = name
@@ -102,7 +118,7 @@ function escapeXmlAttr(s: string): string {
   return s.replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
 }
 
-function ensureGroundMarkerStyle(doc: Document, type: string, iconHref: string) {
+function ensureGroundMarkerStyle(target: KmlTarget, type: string, iconHref: string) {
   const id = `groundMarker_${type}`
   // LabelStyle scale=0 hides the visible `<name>` text (feedback 2026-04-18:
   // labels cluttered the map; users want the icon only).
@@ -115,7 +131,7 @@ function ensureGroundMarkerStyle(doc: Document, type: string, iconHref: string)
   // `markerSizes.ts` and was bumped +50% (feedback 2026-05-10) so markers
   // read clearly at the zoom levels users actually browse to.
   ensureStyle(
-    doc,
+    target,
     id,
     `<IconStyle><scale>${KML_GROUND_MARKER_ICON_SCALE}</scale><Icon><href>${escapeXmlAttr(iconHref)}</href></Icon><hotSpot x="0.5" y="0" xunits="fraction" yunits="fraction"/></IconStyle><LabelStyle><scale>0</scale></LabelStyle>`,
   )
@@ -155,16 +171,23 @@ export function appendFeaturesToKML(originalKml: string, extra: GeoJSON, docName
     if (!nameEl.parentElement) documentEl.insertBefore(nameEl, documentEl.firstChild)
   }
 
+  const styleIds = new Set<string>()
+  for (const s of Array.from(xml.getElementsByTagName('Style'))) {
+    const id = s.getAttribute('id')
+    if (id) styleIds.add(id)
+  }
+  const target: KmlTarget = { doc: xml, documentEl, styleIds }
+
   // Ensure styles for appended content
-  ensureStyle(xml, 'greenLine', '<LineStyle><color>ff00ff00</color><width>2</width></LineStyle>')
-  ensureStyle(xml, 'labelPoint', '<IconStyle><color>ff00ffff</color><scale>0.8</scale></IconStyle><LabelStyle><scale>1</scale></LabelStyle>')
+  ensureStyle(target, 'greenLine', '<LineStyle><color>ff00ff00</color><width>2</width></LineStyle>')
+  ensureStyle(target, 'labelPoint', '<IconStyle><color>ff00ffff</color><scale>0.8</scale></IconStyle><LabelStyle><scale>1</scale></LabelStyle>')
   // Dedicated style for photo markers — explicit yellow-pushpin href so every
   // KML viewer (Google Earth, Maps, mobile) shows the same pin the app and
   // PNG export render. The default `labelPoint` style drops to a grey
   // placeholder in some viewers because it lacks an `<Icon>` (feedback
   // 2026-04-23: yellow pin missing from KML, but present in PNG).
   ensureStyle(
-    xml,
+    target,
     'photoMarker',
     `<IconStyle><color>ff00ffff</color><scale>${KML_PHOTO_MARKER_ICON_SCALE}</scale><Icon><href>https://maps.google.com/mapfiles/kml/pushpin/ylw-pushpin.png</href></Icon><hotSpot x="20" y="2" xunits="pixels" yunits="pixels"/></IconStyle><LabelStyle><scale>0.9</scale></LabelStyle>`,
   )
@@ -175,7 +198,7 @@ export function appendFeaturesToKML(originalKml: string, extra: GeoJSON, docName
   const groundMarkerStyleIds = new Map<string, string>()
   for (const [type, href] of Object.entries(iconMap)) {
     if (!type || !href) continue
-    groundMarkerStyleIds.set(type, ensureGroundMarkerStyle(xml, type, href))
+    groundMarkerStyleIds.set(type, ensureGroundMarkerStyle(target, type, href))
   }
 
   const features = extra.type === 'FeatureCollection' ? (extra as FeatureCollection).features : [extra as Feature]
@@ -188,7 +211,7 @@ export function appendFeaturesToKML(originalKml: string, extra: GeoJSON, docName
       const name = (props as any).segment || (props as any).role || 'corridor'
       const style = 'greenLine'
       const role = (props as any).role || ((props as any).segment ? 'corridor' : undefined)
-      addLinePlacemark(xml, name, ls.coordinates as any, style, role)
+      addLinePlacemark(target, name, ls.coordinates as any, style, role)
     } else if (feature.geometry.type === 'Point') {
       const pt = feature.geometry as Point
       // Treat an explicit empty `name` as intentional (feedback 2026-04-18:
@@ -203,7 +226,7 @@ export function appendFeaturesToKML(originalKml: string, extra: GeoJSON, docName
         : role === 'track_photos'
           ? 'photoMarker'
           : undefined
-      addPointPlacemark(xml, name, pt.coordinates as any, role, customStyleId, markerType)
+      addPointPlacemark(target, name, pt.coordinates as any, role, customStyleId, markerType)
     }
   }
 
@@ -4,6 +4,7 @@ import {
   demoteSlotToCandidate,
   setCandidateFlag,
   removeCandidate,
+  removeCandidates,
   clearAllCandidates,
   updateCandidateCanvasState,
   routeImportedPickIntoSets,
@@ -203,6 +204,12 @@ describe('setCandidateFlag', () => {
     const next = setCandidateFlag(session, 'missing', 'reject');
     expect(next).toBe(session);
   });
+
+  it('no-op when the flag is already set', () => {
+    const c1 = makePhoto('c1', { flag: 'reject' as CandidateFlag });
+    const session = makeSession([], [], [c1]);
+    expect(setCandidateFlag(session, 'c1', 'reject')).toBe(session);
+  });
 });
 
 describe('removeCandidate', () => {
@@ -219,6 +226,27 @@ describe('removeCandidate', () => {
   });
 });
 
+describe('removeCandidates', () => {
+  it('drops every listed id in one pass with a single version bump', () => {
+    const session = makeSession([], [], [makePhoto('c1'), makePhoto('c2'), makePhoto('c3'), makePhoto('c4')]);
+    const next = removeCandidates(session, new Set(['c1', 'c3']));
+    expect(next.candidates?.photos.map(p => p.id)).toEqual(['c2', 'c4']);
+    expect(next.version).toBe(session.version + 1);
+  });
+
+  it('ignores ids that are not in the pool (slot photos stay put)', () => {
+    const session = makeSession([makePhoto('s1')], [], [makePhoto('c1')]);
+    const next = removeCandidates(session, new Set(['s1', 'c1']));
+    expect(next.candidates?.photos).toHaveLength(0);
+    expect(next.sets.set1.photos.map(p => p.id)).toEqual(['s1']);
+  });
+
+  it('no-op when nothing matches', () => {
+    const session = makeSession([], [], [makePhoto('c1')]);
+    expect(removeCandidates(session, new Set(['missing']))).toBe(session);
+  });
+});
+
 describe('clearAllCandidates', () => {
   it('empties the pool and bumps version', () => {
     const session = makeSession([], [], [makePhoto('c1'), makePhoto('c2')]);
@@ -251,6 +279,13 @@ describe('updateCandidateCanvasState', () => {
     const next = updateCandidateCanvasState(session, 'missing', { brightness: 1 });
     expect(next).toBe(session);
   });
+
+  it('returns the same session when the patch changes nothing', () => {
+    const c1 = makePhoto('c1');
+    const session = makeSession([], [], [c1]);
+    const patch = { position: { ...c1.canvasState.position }, scale: c1.canvasState.scale };
+    expect(updateCandidateCanvasState(session, 'c1', patch)).toBe(session);
+  });
 });
 
 describe('flow: drop → promote → demote → flag → cleanup', () => {
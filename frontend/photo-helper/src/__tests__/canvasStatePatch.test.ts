@@ -6,6 +6,9 @@ import {
   applyLabelPositionToAllPhotos,
   applyLabelPositionToAllInSession,
   DEFAULT_CANVAS_STATE,
+  createDefaultCanvasState,
+  isCanvasPatchNoop,
+  patchPhotoCanvasState,
 } from '../utils/canvasStatePatch';
 import type { CanvasState, LabelPosition, PhotoSessionShape } from '../utils/canvasStatePatch';
 
@@ -16,9 +19,78 @@ function makePhoto(id: string, overrides: Partial<CanvasState> = {}) {
   };
 }
 
+describe('patchPhotoCanvasState', () => {
+  it('replaces only the targeted photo and keeps the others by reference', () => {
+    const photos = [makePhoto('a'), makePhoto('b'), makePhoto('c')];
+    const result = patchPhotoCanvasState(photos, 'b', { scale: 2 });
+    expect(result).not.toBe(photos);
+    expect(result[1].canvasState.scale).toBe(2);
+    expect(result[1].canvasState.brightness).toBe(DEFAULT_CANVAS_STATE.brightness);
+    expect(result[0]).toBe(photos[0]);
+    expect(result[2]).toBe(photos[2]);
+    // Input left untouched.
+    expect(photos[1].canvasState.scale).toBe(DEFAULT_CANVAS_STATE.scale);
+  });
+
+  it('returns the same array for an unknown id or a no-op patch', () => {
+    const photos = [makePhoto('a', { scale: 1.5 })];
+    expect(patchPhotoCanvasState(photos, 'missing', { scale: 2 })).toBe(photos);
+    expect(patchPhotoCanvasState(photos, 'a', { scale: 1.5 })).toBe(photos);
+  });
+});
+
 // ---------------------------------------------------------------------------
 // applySettingPatch — single canvasState
 // ---------------------------------------------------------------------------
+describe('createDefaultCanvasState', () => {
+  it('matches DEFAULT_CANVAS_STATE with the same key order', () => {
+    const s = createDefaultCanvasState();
+    expect(s).toEqual(DEFAULT_CANVAS_STATE);
+    expect(Object.keys(s)).toEqual(Object.keys(DEFAULT_CANVAS_STATE));
+  });
+
+  it('returns independent, mutable objects on every call', () => {
+    const a = createDefaultCanvasState();
+    const b = createDefaultCanvasState();
+    expect(a).not.toBe(b);
+    expect(a.position).not.toBe(b.position);
+    expect(a.whiteBalance).not.toBe(b.whiteBalance);
+    a.position.x = 5;
+    expect(b.position.x).toBe(0);
+    expect(Object.isFrozen(a)).toBe(false);
+  });
+});
+
+describe('isCanvasPatchNoop', () => {
+  it('is true when every patched value already matches', () => {
+    const s = createDefaultCanvasState();
+    expect(isCanvasPatchNoop(s, {})).toBe(true);
+    expect(isCanvasPatchNoop(s, { scale: 1, brightness: 0 })).toBe(true);
+    // Fresh nested objects with equal fields — the shape drag handlers send.
+    expect(isCanvasPatchNoop(s, { position: { x: 0, y: 0 } })).toBe(true);
+    expect(isCanvasPatchNoop(s, { whiteBalance: { temperature: 0, tint: 0, auto: false } })).toBe(true);
+  });
+
+  it('is false when any value differs', () => {
+    const s = createDefaultCanvasState();
+    expect(isCanvasPatchNoop(s, { scale: 1.01 })).toBe(false);
+    expect(isCanvasPatchNoop(s, { position: { x: 0, y: 1 } })).toBe(false);
+    expect(isCanvasPatchNoop(s, { labelPosition: 'top-right' })).toBe(false);
+  });
+
+  it('handles circle being added, removed or unchanged', () => {
+    const circle = { x: 10, y: 20, radius: 5, color: 'red' as const, visible: true };
+    const withCircle = { ...createDefaultCanvasState(), circle };
+    expect(isCanvasPatchNoop(createDefaultCanvasState(), { circle })).toBe(false);
+    expect(isCanvasPatchNoop(withCircle, { circle: null })).toBe(false);
+    expect(isCanvasPatchNoop(withCircle, { circle: { ...circle } })).toBe(true);
+  });
+
+  it('never treats a missing state as a no-op', () => {
+    expect(isCanvasPatchNoop(undefined, {})).toBe(false);
+  });
+});
+
 describe('applySettingPatch', () => {
   it('applies brightness', () => {
     const result = applySettingPatch(DEFAULT_CANVAS_STATE, 'brightness', 50);
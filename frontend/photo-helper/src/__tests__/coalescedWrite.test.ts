@@ -0,0 +1,170 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { createCoalescedWriter } from '@airq/shared-storage';
+
+// Latest-wins coalescing for session persistence. Pins: first write starts
+// immediately, overlapping submissions collapse into ONE follow-up write of
+// the merged value, every caller's promise settles with the write that
+// carried its state, and a failed write rejects only its own batch.
+
+function deferred() {
+  let resolve!: () => void;
+  let reject!: (err: unknown) => void;
+  const promise = new Promise<void>((res, rej) => { resolve = res; reject = rej; });
+  return { promise, resolve, reject };
+}
+
+describe('createCoalescedWriter', () => {
+  it('writes immediately when idle', async () => {
+    const written: number[] = [];
+    const write = createCoalescedWriter<number>(async v => { written.push(v); });
+    const p = write(1);
+    // Synchronous start — no debounce delay on the idle path.
+    expect(written).toEqual([1]);
+    await p;
+  });
+
+  it('collapses submissions made during an in-flight write into one', async () => {
+    const gates = [deferred(), deferred()];
+    const written: number[] = [];
+    let call = 0;
+    const write = createCoalescedWriter<number>(v => {
+      written.push(v);
+      return gates[call++].promise;
+    });
+
+    const p1 = write(1);
+    const p2 = write(2);
+    const p3 = write(3);
+    const p4 = write(4);
+    expect(written).toEqual([1]);
+
+    gates[0].resolve();
+    await p1;
+    // Only the newest pending value is written; 2 and 3 were superseded.
+    await Promise.resolve();
+    expect(written).toEqual([1, 4]);
+
+    gates[1].resolve();
+    await Promise.all([p2, p3, p4]);
+    expect(written).toEqual([1, 4]);
+  });
+
+  it('folds pending submissions through merge', async () => {
+    const gate = deferred();
+    const written: Array<{ v: number; photos: boolean }> = [];
+    let first = true;
+    const write = createCoalescedWriter<{ v: number; photos: boolean }>(
+      async value => {
+        written.push(value);
+        if (first) { first = false; await gate.promise; }
+      },
+      (pending, next) => ({ v: next.v, photos: pending.photos || next.photos }),
+    );
+
+    const p1 = write({ v: 1, photos: false });
+    const p2 = write({ v: 2, photos: true });
+    const p3 = write({ v: 3, photos: false });
+    gate.resolve();
+    await Promise.all([p1, p2, p3]);
+    expect(written).toEqual([
+      { v: 1, photos: false },
+      { v: 3, photos: true },
+    ]);
+  });
+
+  it('rejects only the callers whose batch failed', async () => {
+    const gate = deferred();
+    let call = 0;
+    const write = createCoalescedWriter<number>(async () => {
+      call++;
+      if (call === 1) {
+        await gate.promise;
+        throw new Error('disk full');
+      }
+    });
+
+    const p1 = write(1);
+    const p2 = write(2);
+    gate.resolve();
+    await expect(p1).rejects.toThrow('disk full');
+    await expect(p2).resolves.toBeUndefined();
+    expect(call).toBe(2);
+  });
+
+  it('accepts new writes after the queue has drained', async () => {
+    const written: number[] = [];
+    const write = createCoalescedWriter<number>(async v => { written.push(v); });
+    await write(1);
+    await write(2);
+    expect(written).toEqual([1, 2]);
+  });
+});
+
+describe('createCoalescedWriter — minIntervalMs', () => {
+  afterEach(() => { vi.useRealTimers(); });
+
+  it('holds a burst for the interval after a write, then writes the newest value once', async () => {
+    vi.useFakeTimers();
+    const written: number[] = [];
+    const write = createCoalescedWriter<number>(async v => { written.push(v); }, undefined, { minIntervalMs: 200 });
+
+    const p1 = write(1, { coalesce: true });
+    expect(written).toEqual([1]);
+    await p1;
+    const p2 = write(2, { coalesce: true });
+    const p3 = write(3, { coalesce: true });
+    await vi.advanceTimersByTimeAsync(199);
+    expect(written).toEqual([1]);
+    await vi.advanceTimersByTimeAsync(1);
+    await Promise.all([p2, p3]);
+    expect(written).toEqual([1, 3]);
+  });
+
+  it('flush writes the pending value without waiting out the interval', async () => {
+    vi.useFakeTimers();
+    const written: number[] = [];
+    const write = createCoalescedWriter<number>(async v => { written.push(v); }, undefined, { minIntervalMs: 200 });
+
+    await write(1, { coalesce: true });
+    const p2 = write(2, { coalesce: true });
+    await write.flush();
+    await p2;
+    expect(written).toEqual([1, 2]);
+    // Idle again — the next write starts immediately.
+    const p3 = write(3);
+    expect(written).toEqual([1, 2, 3]);
+    await p3;
+  });
+
+  it('writes plain submissions without waiting for the interval', async () => {
+    // Structural edits are awaited one after another (a map-picks handoff
+    // awaits one update per pick); each must not sit out the interval.
+    vi.useFakeTimers();
+    const written: number[] = [];
+    const write = createCoalescedWriter<number>(async v => { written.push(v); }, undefined, { minIntervalMs: 200 });
+
+    await write(1);
+    await write(2);
+    await write(3);
+    expect(written).toEqual([1, 2, 3]);
+  });
+
+  it('ends a running interval when a plain submission arrives', async () => {
+    vi.useFakeTimers();
+    const written: number[] = [];
+    const write = createCoalescedWriter<number>(async v => { written.push(v); }, undefined, { minIntervalMs: 200 });
+
+    await write(1, { coalesce: true });
+    const p2 = write(2, { coalesce: true });
+    await vi.advanceTimersByTimeAsync(50);
+    expect(written).toEqual([1]);
+    // The plain submission merges with the waiting tick and writes now.
+    await Promise.all([p2, write(3)]);
+    expect(written).toEqual([1, 3]);
+  });
+
+  it('flush is a no-op when idle', async () => {
+    const write = createCoalescedWriter<number>(async () => {});
+    await expect(write.flush()).resolves.toBeUndefined();
+  });
+});
@@ -333,6 +333,124 @@ describe('competitionService — candidate pool roundtrip', () => {
     expect(reloaded!.session.candidates?.photos[0].flag).toBe('reject');
   });
 
+  it('skips the index rewrite for metadata-neutral updates but not for photo-count changes', async () => {
+    const { competitionService } = await import('../services/competitionService');
+    const created = await competitionService.createCompetition('IndexTouch', makeSession({ set1: [makePhoto('a')] }));
+    const writeSpy = vi.spyOn(storageMock, 'writeJSON');
+    const indexWrites = () =>
+      writeSpy.mock.calls.filter(([, name]) => name === 'competitions-index.json').length;
+
+    // Canvas-state-style update: same name, same photo count, just created.
+    const tweaked = {
+      ...created.session,
+      sets: {
+        ...created.session.sets,
+        set1: { ...created.session.sets.set1, photos: [{ ...created.session.sets.set1.photos[0], label: 'x' }] },
+      },
+    };
+    await competitionService.updateCompetition({ ...created, session: tweaked });
+    expect(writeSpy.mock.calls.some(([, name]) => name === 'session.json')).toBe(true);
+    expect(indexWrites()).toBe(0);
+
+    // Adding a photo changes the summary → the index must be rewritten.
+    const grown = {
+      ...tweaked,
+      sets: { ...tweaked.sets, set2: { ...tweaked.sets.set2, photos: [makePhoto('b')] } },
+    };
+    await competitionService.updateCompetition({ ...created, session: grown }, { updatePhotos: true });
+    expect(indexWrites()).toBe(1);
+    const index = await competitionService.getCompetitionsIndex();
+    expect(index.competitions.find(c => c.id === created.id)!.photoCount).toBe(2);
+  });
+
+  it('does not re-read the index for back-to-back metadata-neutral updates', async () => {
+    const { competitionService } = await import('../services/competitionService');
+    const created = await competitionService.createCompetition('IndexMemo', makeSession({ set1: [makePhoto('a')] }));
+    const readSpy = vi.spyOn(storageMock, 'readJSON');
+    const indexReads = () =>
+      readSpy.mock.calls.filter(([, name]) => name === 'competitions-index.json').length;
+
+    const relabel = (label: string) => ({
+      ...created.session,
+      sets: {
+        ...created.session.sets,
+        set1: { ...created.session.sets.set1, photos: [{ ...created.session.sets.set1.photos[0], label }] },
+      },
+    });
+    await competitionService.updateCompetition({ ...created, session: relabel('x') });
+    const afterFirst = indexReads();
+    await competitionService.updateCompetition({ ...created, session: relabel('y') });
+    await competitionService.updateCompetition({ ...created, session: relabel('z') });
+    expect(indexReads()).toBe(afterFirst);
+
+    // A rename still reaches the index.
+    const writeSpy = vi.spyOn(storageMock, 'writeJSON');
+    await competitionService.updateCompetition({ ...created, name: 'IndexMemo 2', session: relabel('w') });
+    expect(writeSpy.mock.calls.some(([, name]) => name === 'competitions-index.json')).toBe(true);
+  });
+
+  it('shares one initialization between concurrent callers', async () => {
+    const { competitionService } = await import('../services/competitionService');
+    const { initStorage } = await import('@airq/shared-storage');
+    const initSpy = vi.spyOn(storageMock, 'init');
+    vi.mocked(initStorage).mockClear();
+
+    await Promise.all([
+      competitionService.getCompetitionsIndex(),
+      competitionService.getStorageStats(),
+      competitionService.ensureInitialized(),
+    ]);
+
+    expect(initStorage).toHaveBeenCalledTimes(1);
+    expect(initSpy).toHaveBeenCalledTimes(1);
+  });
+
+  it('reuses stripped copies of untouched photos but persists edited ones', async () => {
+    const { competitionService } = await import('../services/competitionService');
+    const created = await competitionService.createCompetition(
+      'StripMemo',
+      makeSession({ set1: [makePhoto('a'), makePhoto('b')], set2: [makePhoto('c')] }),
+    );
+    const writeSpy = vi.spyOn(storageMock, 'writeJSON');
+    const lastSession = () =>
+      writeSpy.mock.calls.filter(([, name]) => name === 'session.json').at(-1)![2] as ApiPhotoSession;
+
+    const [a, b] = created.session.sets.set1.photos;
+    const first = { ...created.session, sets: { ...created.session.sets, set1: { ...created.session.sets.set1, photos: [a, { ...b, label: 'B1' }] } } };
+    await competitionService.updateCompetition({ ...created, session: first });
+    const firstSaved = lastSession();
+
+    const second = { ...first, sets: { ...first.sets, set1: { ...first.sets.set1, photos: [a, { ...first.sets.set1.photos[1], label: 'B2' }] } } };
+    await competitionService.updateCompetition({ ...created, session: second });
+    const secondSaved = lastSession();
+
+    // Untouched photo and untouched set reuse the same stripped objects…
+    expect(secondSaved.sets.set1.photos[0]).toBe(firstSaved.sets.set1.photos[0]);
+    expect(secondSaved.sets.set2.photos).toBe(firstSaved.sets.set2.photos);
+    // …while the edited photo carries the new value, URLs stripped throughout.
+    expect(secondSaved.sets.set1.photos[1].label).toBe('B2');
+    expect([...secondSaved.sets.set1.photos, ...secondSaved.sets.set2.photos].every(p => p.url === '')).toBe(true);
+    // The live session keeps its blob URLs.
+    expect(second.sets.set1.photos[0].url.startsWith('blob:')).toBe(true);
+  });
+
+  it('skips rewriting session.json when the same session object is saved again', async () => {
+    const { competitionService } = await import('../services/competitionService');
+    const created = await competitionService.createCompetition('SameSession', makeSession({ set1: [makePhoto('a')] }));
+    const writeSpy = vi.spyOn(storageMock, 'writeJSON');
+    const sessionWrites = () =>
+      writeSpy.mock.calls.filter(([, name]) => name === 'session.json').length;
+
+    // Same object as the one createCompetition persisted → nothing to write.
+    await competitionService.updateCompetition({ ...created, lastModified: new Date().toISOString() });
+    expect(sessionWrites()).toBe(0);
+
+    const edited = { ...created.session, version: created.session.version + 1 };
+    await competitionService.updateCompetition({ ...created, session: edited });
+    await competitionService.updateCompetition({ ...created, session: edited }, { updatePhotos: true });
+    expect(sessionWrites()).toBe(1);
+  });
+
   // PR #62 review G11: a session that has both mode buckets populated AND a
   // candidate pool must round-trip cleanly — deduplication preserves the
   // blob URL across containers, and each container loads back independently.
@@ -382,6 +500,26 @@ describe('competitionService — candidate pool roundtrip', () => {
     expect(reloaded!.session.candidates?.photos[0].flag).toBe('pick');
   });
 
+  it('reads a photo shared by several containers only once per load', async () => {
+    const { competitionService } = await import('../services/competitionService');
+    const shared = makePhoto('shared-1');
+    const session: ApiPhotoSession = {
+      ...makeSession({ set1: [shared] }),
+      setsTrack: { set1: { title: 'S1', photos: [shared] }, set2: { title: 'S2', photos: [] } },
+    };
+    const created = await competitionService.createCompetition('SharedRead', session);
+    const readSpy = vi.spyOn(storageMock, 'getPhotoBlob');
+
+    const reloaded = await competitionService.getCompetition(created.id);
+
+    expect(readSpy.mock.calls.filter(([, id]) => id === 'shared-1')).toHaveLength(1);
+    const inActive = reloaded!.session.sets.set1.photos[0].url;
+    const inTrack = reloaded!.session.setsTrack!.set1.photos[0].url;
+    expect(inActive.startsWith('blob:')).toBe(true);
+    expect(inTrack.startsWith('blob:')).toBe(true);
+    expect(inActive).not.toBe(inTrack);
+  });
+
   // PR #62 review G12: an OPFS blob that was evicted (cross-device sync,
   // user wiping the photos/ subdir) must not crash the entire load —
   // a single missing blob should not block opening the competition.
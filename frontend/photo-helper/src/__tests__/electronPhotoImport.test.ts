@@ -176,6 +176,21 @@ describe('openPhotosViaElectron', () => {
     expect(readPhotoFile).toHaveBeenCalledTimes(2);
   });
 
+  it('uses raw bytes from the main process without a base64 round-trip', async () => {
+    const bytes = new Uint8Array([0xff, 0xd8, 0xff, 0xe0]);
+    setElectronAPI({
+      openPhotos: vi.fn(async () => ['/photos/a.jpg']),
+      readPhotoFile: vi.fn(async () => ({ name: 'a.jpg', mimeType: 'image/jpeg', data: bytes })),
+      competitions: { setWorkingDir: vi.fn(async () => undefined) },
+    });
+
+    const result = await openPhotosViaElectron(9);
+
+    expect(result.failures).toEqual([]);
+    expect(result.files).toHaveLength(1);
+    expect(new Uint8Array(await result.files[0].arrayBuffer())).toEqual(bytes);
+  });
+
   it('captures per-file failures without losing successes (partial import)', async () => {
     const setWorkingDir = vi.fn(async () => undefined);
     setElectronAPI({
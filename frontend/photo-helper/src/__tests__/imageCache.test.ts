@@ -0,0 +1,55 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { getImageCache } from '../utils/imageCache';
+
+// The decoded-image cache backs every thumbnail and the PDF generator. It is
+// bounded at 50 entries; eviction must drop the least-recently *used* image
+// (not the least-recently loaded one), otherwise the photos on screen get
+// evicted and re-decoded while a PDF export walks the rest of the session.
+
+const cache = getImageCache();
+
+beforeEach(() => {
+  cache.clear();
+  vi.spyOn(console, 'log').mockImplementation(() => {});
+  // jsdom never fires `onload` for blob URLs — stand in for the decode.
+  vi.spyOn(cache as any, 'loadImage').mockImplementation(
+    async (url: unknown) => ({ src: url }) as unknown as HTMLImageElement,
+  );
+});
+
+describe('image cache — LRU eviction', () => {
+  it('keeps a recently hit entry when the cache overflows', async () => {
+    const max = cache.getStats().maxSize;
+    const first = await cache.getImageByUrl('blob:0');
+    for (let i = 1; i < max; i++) await cache.getImageByUrl(`blob:${i}`);
+
+    // Touch the oldest entry, then overflow by one.
+    expect(await cache.getImageByUrl('blob:0')).toBe(first);
+    await cache.getImageByUrl(`blob:${max}`);
+
+    const keys = cache.getStats().entries;
+    expect(keys).toHaveLength(max);
+    expect(keys).toContain('url:blob:0');
+    expect(keys).not.toContain('url:blob:1');
+  });
+
+  it('counts hits and misses', async () => {
+    await cache.getImageByUrl('blob:a');
+    await cache.getImageByUrl('blob:a');
+    await cache.getImageByUrl('blob:b');
+    expect(cache.getStats()).toMatchObject({ hits: 1, misses: 2, size: 2 });
+  });
+
+  it('reloads an entry once it has expired', async () => {
+    vi.useFakeTimers();
+    try {
+      vi.setSystemTime(new Date('2026-06-01T10:00:00Z'));
+      await cache.getImageByUrl('blob:a');
+      vi.setSystemTime(new Date('2026-06-01T10:06:00Z'));
+      await cache.getImageByUrl('blob:a');
+      expect(cache.getStats()).toMatchObject({ hits: 0, misses: 2, size: 1 });
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+});
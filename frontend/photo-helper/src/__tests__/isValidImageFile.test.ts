@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest';
+import { isValidImageFile } from '../utils/imageProcessing';
+
+// Every drop zone and the import button filter through `isValidImageFile`.
+// Pins the accepted MIME types, the extension fallback for pickers that
+// report an empty type, and the 20 MB ceiling.
+
+function fakeFile(name: string, type: string, size = 1024): File {
+  return { name, type, size } as File;
+}
+
+describe('isValidImageFile', () => {
+  it('accepts JPEG and PNG MIME types regardless of name', () => {
+    for (const type of ['image/jpeg', 'image/jpg', 'image/pjpeg', 'image/png']) {
+      expect(isValidImageFile(fakeFile('upload', type))).toBe(true);
+    }
+  });
+
+  it('falls back to a case-insensitive extension when the type is missing', () => {
+    expect(isValidImageFile(fakeFile('IMG_0001.JPG', ''))).toBe(true);
+    expect(isValidImageFile(fakeFile('tp1.Jpeg', ''))).toBe(true);
+    expect(isValidImageFile(fakeFile('map.png', 'application/octet-stream'))).toBe(true);
+  });
+
+  it('rejects other types and extensions', () => {
+    expect(isValidImageFile(fakeFile('photo.heic', 'image/heic'))).toBe(false);
+    expect(isValidImageFile(fakeFile('notes.jpg.txt', ''))).toBe(false);
+    expect(isValidImageFile(fakeFile('jpg', ''))).toBe(false);
+    expect(isValidImageFile(fakeFile('archive.', ''))).toBe(false);
+  });
+
+  it('enforces the 20 MB limit', () => {
+    expect(isValidImageFile(fakeFile('big.jpg', 'image/jpeg', 20 * 1024 * 1024))).toBe(true);
+    expect(isValidImageFile(fakeFile('big.jpg', 'image/jpeg', 20 * 1024 * 1024 + 1))).toBe(false);
+  });
+});
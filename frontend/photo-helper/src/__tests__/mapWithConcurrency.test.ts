@@ -0,0 +1,44 @@
+import { describe, it, expect } from 'vitest';
+import { mapWithConcurrency } from '../utils/mapWithConcurrency';
+
+// Bounded pool used for per-photo saves/loads. Pins: results keep input
+// order even when calls finish out of order, the in-flight count never
+// exceeds the limit, and a rejection propagates.
+
+const tick = (ms: number) => new Promise(r => setTimeout(r, ms));
+
+describe('mapWithConcurrency', () => {
+  it('keeps input order when calls finish out of order', async () => {
+    const out = await mapWithConcurrency([30, 10, 20, 0], 4, async (ms, i) => {
+      await tick(ms);
+      return i;
+    });
+    expect(out).toEqual([0, 1, 2, 3]);
+  });
+
+  it('never runs more than `limit` calls at once', async () => {
+    let active = 0;
+    let peak = 0;
+    await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      active++;
+      peak = Math.max(peak, active);
+      await tick(1);
+      active--;
+    });
+    expect(peak).toBe(3);
+  });
+
+  it('handles empty input and a limit larger than the input', async () => {
+    expect(await mapWithConcurrency([], 4, async x => x)).toEqual([]);
+    expect(await mapWithConcurrency([1, 2], 8, async x => x * 2)).toEqual([2, 4]);
+  });
+
+  it('propagates a rejection', async () => {
+    await expect(
+      mapWithConcurrency([1, 2, 3], 2, async x => {
+        if (x === 2) throw new Error('boom');
+        return x;
+      }),
+    ).rejects.toThrow('boom');
+  });
+});
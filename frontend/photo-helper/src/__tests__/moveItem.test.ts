@@ -0,0 +1,31 @@
+import { describe, it, expect } from 'vitest';
+import { moveItem } from '../utils/moveItem';
+
+// In-grid reorder primitive. Pins: every (from, to) pair matches the
+// remove-then-insert splice it replaced, and the input is never mutated.
+
+function spliceMove<T>(items: T[], from: number, to: number): T[] {
+  const copy = [...items];
+  const [moving] = copy.splice(from, 1);
+  copy.splice(to, 0, moving);
+  return copy;
+}
+
+describe('moveItem', () => {
+  it('matches splice remove + insert for every index pair', () => {
+    const items = ['a', 'b', 'c', 'd', 'e'];
+    for (let from = 0; from < items.length; from++) {
+      for (let to = 0; to < items.length; to++) {
+        expect(moveItem(items, from, to)).toEqual(spliceMove(items, from, to));
+      }
+    }
+  });
+
+  it('returns a new array and leaves the input untouched', () => {
+    const items = [1, 2, 3];
+    const out = moveItem(items, 0, 2);
+    expect(out).toEqual([2, 3, 1]);
+    expect(out).not.toBe(items);
+    expect(items).toEqual([1, 2, 3]);
+  });
+});
@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { isPhotoReferencedInSession } from '../utils/sessionRefs';
+import { collectReferencedPhotoIds, isPhotoReferencedInSession, samePhotoIds } from '../utils/sessionRefs';
 import type { ApiPhoto, ApiPhotoSession } from '../types/api';
 
 // PR #62 review IMP-2: the shared cross-bucket reference check used by every
@@ -135,3 +135,57 @@ describe('isPhotoReferencedInSession', () => {
     expect(isPhotoReferencedInSession(s, 'x')).toBe(true);
   });
 });
+
+describe('collectReferencedPhotoIds', () => {
+  it('collects ids from active sets, both mode buckets and the candidate pool', () => {
+    const s = makeSession({
+      set1: [p('a')],
+      set2: [p('b')],
+      setsTrack: { set1: [p('c')], set2: [p('a')] },
+      setsTurning: { set2: [p('d')] },
+      candidates: [p('e')],
+    });
+    expect([...collectReferencedPhotoIds(s)].sort()).toEqual(['a', 'b', 'c', 'd', 'e']);
+  });
+
+  it('agrees with isPhotoReferencedInSession for every id', () => {
+    const s = makeSession({
+      set1: [p('a')],
+      setsTurning: { set1: [p('t')] },
+      candidates: [p('c')],
+    });
+    const ids = collectReferencedPhotoIds(s);
+    for (const id of ['a', 't', 'c', 'missing']) {
+      expect(ids.has(id)).toBe(isPhotoReferencedInSession(s, id));
+    }
+  });
+
+  it('tolerates missing buckets', () => {
+    const s = makeSession({});
+    expect(collectReferencedPhotoIds(s).size).toBe(0);
+  });
+});
+
+describe('samePhotoIds', () => {
+  it('short-circuits on the same array reference', () => {
+    const photos = [p('a'), p('b')];
+    expect(samePhotoIds(photos, photos)).toBe(true);
+  });
+
+  it('compares ids, not photo objects (canvas edits keep ids)', () => {
+    const before = [p('a'), p('b')];
+    const after = before.map(x => ({ ...x, canvasState: { scale: 2 } as any }));
+    expect(samePhotoIds(before, after)).toBe(true);
+  });
+
+  it('detects reorder, add and remove', () => {
+    expect(samePhotoIds([p('a'), p('b')], [p('b'), p('a')])).toBe(false);
+    expect(samePhotoIds([p('a')], [p('a'), p('b')])).toBe(false);
+    expect(samePhotoIds([p('a'), p('b')], [p('a')])).toBe(false);
+  });
+
+  it('treats a missing list as empty', () => {
+    expect(samePhotoIds(undefined, [])).toBe(true);
+    expect(samePhotoIds(undefined, [p('a')])).toBe(false);
+  });
+});
@@ -17,14 +17,17 @@ const getNestedValue = (obj: any, path: string): string => {
   return path.split('.').reduce((current, key) => current?.[key], obj) || path;
 };
 
-// Helper function to replace placeholders in strings
+// Helper function to replace placeholders in strings. One precompiled pass
+// over the text instead of building a RegExp per param on every `t()` call;
+// placeholders without a matching param are left as-is.
+const PLACEHOLDER_RE = /\{\{([^{}]+)\}\}/g;
+
 const interpolate = (text: string, params?: Record<string, string | number>): string => {
   if (!params) return text;
-  
-  return Object.keys(params).reduce((result, key) => {
-    const placeholder = `{{${key}}}`;
-    return result.replace(new RegExp(placeholder, 'g'), String(params[key]));
-  }, text);
+
+  return text.replace(PLACEHOLDER_RE, (match, key: string) =>
+    Object.prototype.hasOwnProperty.call(params, key) ? String(params[key]) : match
+  );
 };
 
 interface I18nProviderProps {
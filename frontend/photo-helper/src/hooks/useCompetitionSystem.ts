@@ -14,17 +14,19 @@ import type { ApiPhotoSession, ApiPhoto, CandidateFlag, AddPhotosResult } from '
 import { competitionService } from '../services/competitionService';
 import { migrationService } from '../services/migrationService';
 import { useI18n } from '../contexts/I18nContext';
-import { applyLabelPositionToAllInSession, applySettingToAllInSession, type CanvasSetting, type LabelPosition } from '../utils/canvasStatePatch';
+import { applyLabelPositionToAllInSession, createDefaultCanvasState, patchPhotoCanvasState, applySettingToAllInSession, type CanvasSetting, type LabelPosition } from '../utils/canvasStatePatch';
+import { moveItem } from '../utils/moveItem';
 import { distributeRallyDrop } from '../utils/distributeRallyDrop';
 import { getGridCapacity } from '../utils/getGridCapacity';
 import { parseDiscipline } from '../utils/parseDiscipline';
 import { routeDrop } from '../utils/smartDropRoute';
-import { isPhotoReferencedInSession } from '../utils/sessionRefs';
+import { collectReferencedPhotoIds, isPhotoReferencedInSession, samePhotoIds } from '../utils/sessionRefs';
 import {
   promoteCandidateToSlot as promoteCandidateToSlotPure,
   demoteSlotToCandidate as demoteSlotToCandidatePure,
   setCandidateFlag as setCandidateFlagPure,
   removeCandidate as removeCandidatePure,
+  removeCandidates as removeCandidatesPure,
   clearAllCandidates as clearAllCandidatesPure,
   updateCandidateCanvasState as updateCandidateCanvasStatePure,
   routeImportedPickIntoSets,
@@ -329,6 +331,17 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
     initialize();
   }, [initialize]);
 
+  // Canvas-state writes are spaced SESSION_WRITE_INTERVAL_MS apart during
+  // bursts (see competitionService.updateCompetition). Kick the pending
+  // snapshot out on pagehide — fire-and-forget, same as the map-picks flush
+  // in map-corridors: async storage may not settle before unload, but
+  // writing now beats dropping the last slider position.
+  useEffect(() => {
+    const onPageHide = () => { void competitionService.flushPendingWrites(); };
+    window.addEventListener('pagehide', onPageHide);
+    return () => window.removeEventListener('pagehide', onPageHide);
+  }, []);
+
   // Load competitions list
   const refreshCompetitions = useCallback(async () => {
     try {
@@ -340,13 +353,21 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
     }
   }, []);
 
-  // Load storage stats after initialization
+  // Load storage stats after initialization, then again whenever another
+  // competition opens or photos are added/removed. Keyed on that footprint
+  // rather than the whole competition object: every slider tick and label
+  // edit produces a new object, and in Electron `storage-get-stats` walks
+  // and stats every file under photo-sessions/ — a full-tree recount for a
+  // few changed bytes of session.json.
+  const storageFootprintKey = currentCompetition
+    ? `${currentCompetition.id}:${currentCompetition.photoCount}:${currentCompetition.session.candidates?.photos?.length ?? 0}`
+    : null;
   useEffect(() => {
-    if (!loading && currentCompetition !== null) {
+    if (!loading && storageFootprintKey !== null) {
       // DRY: reuse updateStorageStats helper
       updateStorageStats();
     }
-  }, [loading, currentCompetition]);
+  }, [loading, storageFootprintKey]);
 
   // Competition Management Functions
   const createNewCompetition = useCallback(async (name?: string) => {
@@ -529,7 +550,7 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
   // the persist has settled.
   const updateCurrentCompetition = useCallback(async (
     updater: (session: ApiPhotoSession) => ApiPhotoSession,
-    options?: { updatePhotos?: boolean; rethrow?: boolean }
+    options?: { updatePhotos?: boolean; rethrow?: boolean; coalesce?: boolean }
   ) => {
     const current = currentCompetitionRef.current;
     if (!current) return;
@@ -538,6 +559,11 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
       const originalSession = current.session;
       const updatedSession = updater(originalSession);
 
+      // Updaters return the input session when there is nothing to change
+      // (unknown id, no-op canvas patch, invalid reorder indices). Nothing
+      // to persist — skip the session.json rewrite and the re-render.
+      if (updatedSession === originalSession && !options?.updatePhotos) return;
+
       // Check if competition name changed in session and sync it
       const nameChanged = updatedSession.competition_name !== originalSession.competition_name;
       const newCompetitionName = nameChanged && updatedSession.competition_name.trim()
@@ -548,15 +574,10 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
       // the candidate pool so promoting/demoting/adding to the tray triggers
       // a write — `competitionService.saveSessionPhotos` walks candidates
       // alongside slots, so the persistence path is symmetric.
-      const origCandIds = (originalSession.candidates?.photos ?? []).map(p => p.id);
-      const nextCandIds = (updatedSession.candidates?.photos ?? []).map(p => p.id);
       const photosChanged = options?.updatePhotos ||
-        originalSession.sets.set1.photos.length !== updatedSession.sets.set1.photos.length ||
-        originalSession.sets.set2.photos.length !== updatedSession.sets.set2.photos.length ||
-        JSON.stringify(originalSession.sets.set1.photos.map(p => p.id)) !== JSON.stringify(updatedSession.sets.set1.photos.map(p => p.id)) ||
-        JSON.stringify(originalSession.sets.set2.photos.map(p => p.id)) !== JSON.stringify(updatedSession.sets.set2.photos.map(p => p.id)) ||
-        origCandIds.length !== nextCandIds.length ||
-        JSON.stringify(origCandIds) !== JSON.stringify(nextCandIds);
+        !samePhotoIds(originalSession.sets.set1.photos, updatedSession.sets.set1.photos) ||
+        !samePhotoIds(originalSession.sets.set2.photos, updatedSession.sets.set2.photos) ||
+        !samePhotoIds(originalSession.candidates?.photos, updatedSession.candidates?.photos);
 
       const updatedCompetition: Competition = {
         ...current,
@@ -574,7 +595,7 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
       currentCompetitionRef.current = updatedCompetition;
 
       try {
-        await competitionService.updateCompetition(updatedCompetition, { updatePhotos: photosChanged });
+        await competitionService.updateCompetition(updatedCompetition, { updatePhotos: photosChanged, coalesce: options?.coalesce });
       } catch (err) {
         // Persist failed — roll back the ref so the next caller doesn't
         // build on top of unsaved phantom state.
@@ -613,27 +634,30 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
    * Build a fresh ApiPhoto from a File. Shared by slot-add and candidate-add
    * paths so the canvasState/blob-URL/id construction stays in one place.
    * `flag` is only set on the candidate path.
+   *
+   * Bulk imports run this for every dropped file, so it's a plain loop into
+   * a pre-sized array: no conditional `...spread` temp object per photo, and
+   * the id generator is resolved once per batch rather than per file.
    */
   const filesToPhotos = useCallback((files: File[], sessionIdLocal: string, flag?: CandidateFlag): ApiPhoto[] => {
-    return files.map((file) => ({
-      id: (typeof crypto !== 'undefined' && 'randomUUID' in crypto)
-        ? (crypto as any).randomUUID()
-        : `photo-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`,
-      sessionId: sessionIdLocal,
-      url: URL.createObjectURL(file),
-      filename: file.name,
-      canvasState: {
-        position: { x: 0, y: 0 },
-        scale: 1,
-        brightness: 0,
-        contrast: 1,
-        sharpness: 0,
-        whiteBalance: { temperature: 0, tint: 0, auto: false },
-        labelPosition: 'bottom-left' as const,
-      },
-      label: '',
-      ...(flag !== undefined ? { flag } : {}),
-    }));
+    const newId = (typeof crypto !== 'undefined' && 'randomUUID' in crypto)
+      ? () => (crypto as any).randomUUID() as string
+      : () => `photo-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`;
+    const photos = new Array<ApiPhoto>(files.length);
+    for (let i = 0; i < files.length; i++) {
+      const file = files[i];
+      const photo: ApiPhoto = {
+        id: newId(),
+        sessionId: sessionIdLocal,
+        url: URL.createObjectURL(file),
+        filename: file.name,
+        canvasState: createDefaultCanvasState(),
+        label: '',
+      };
+      if (flag !== undefined) photo.flag = flag;
+      photos[i] = photo;
+    }
+    return photos;
   }, []);
 
   /**
@@ -856,7 +880,14 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
         set1: session.sets?.set1 || { title: '', photos: [] },
         set2: session.sets?.set2 || { title: '', photos: [] }
       };
-      const photoToRemove = (ensuredSets as any)[setKey]?.photos?.find((p: any) => p.id === photoId);
+      // One lookup finds the photo to revoke and the slot to drop (ids are
+      // unique within a set — placement is idempotent by id).
+      const photos = ensuredSets[setKey].photos || [];
+      const removeIdx = photos.findIndex(p => p.id === photoId);
+      const photoToRemove = removeIdx === -1 ? undefined : photos[removeIdx];
+      const remaining = removeIdx === -1
+        ? photos
+        : [...photos.slice(0, removeIdx), ...photos.slice(removeIdx + 1)];
       if (photoToRemove && typeof photoToRemove.url === 'string' && photoToRemove.url.startsWith('blob:')) {
         try { URL.revokeObjectURL(photoToRemove.url); } catch (err) {
           console.warn(`removePhoto: revoke failed for ${photoId}:`, err);
@@ -867,7 +898,7 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
         ...ensuredSets,
         [setKey]: {
           ...ensuredSets[setKey],
-          photos: (ensuredSets[setKey].photos || []).filter(p => p.id !== photoId)
+          photos: remaining
         }
       };
       const next: ApiPhotoSession = {
@@ -1051,7 +1082,8 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
   }, [updateCurrentCompetition]);
 
   const updateCandidatePhotoState = useCallback(async (photoId: string, canvasState: Partial<ApiPhoto['canvasState']>) => {
-    await updateCurrentCompetition(session => updateCandidateCanvasStatePure(session, photoId, canvasState));
+    // Slider ticks — let the write interval thin them out.
+    await updateCurrentCompetition(session => updateCandidateCanvasStatePure(session, photoId, canvasState), { coalesce: true });
   }, [updateCurrentCompetition]);
 
   /**
@@ -1081,16 +1113,18 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
     if (presentIds.length === 0) return { deleted: 0, skipped: photoIds.length };
     let safeIds: string[] = [];
     await updateCurrentCompetition(session => {
-      let next = session;
-      for (const id of presentIds) {
-        const target = next.candidates?.photos?.find(p => p.id === id);
-        if (typeof target?.url === 'string' && target.url.startsWith('blob:')) {
+      // One pass over the pool with a hash-set membership test, instead of a
+      // `find` + `removeCandidate` filter per id (O(k·n) for a k-photo batch).
+      const presentSet = new Set(presentIds);
+      for (const target of session.candidates?.photos ?? []) {
+        if (!presentSet.has(target.id)) continue;
+        if (typeof target.url === 'string' && target.url.startsWith('blob:')) {
           try { URL.revokeObjectURL(target.url); } catch (err) {
-            console.warn(`deleteCandidates: revoke failed for ${id}:`, err);
+            console.warn(`deleteCandidates: revoke failed for ${target.id}:`, err);
           }
         }
-        next = removeCandidatePure(next, id);
       }
+      const next = removeCandidatesPure(session, presentSet);
       // Only delete the OPFS files that no other container references —
       // protects against a promotion racing the delete (PR #62 review IMP-2).
       // Also exclude `pm-` prefixed photos: those are owned by map-corridors
@@ -1098,8 +1132,9 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
       // the map marker and silently breaks the next `useMapPicksSync` pass
       // (`getPhotoBlob` → NotFoundError → entry skipped). See removeCandidate
       // for the symmetric guard and user feedback 2026-05-17 rationale.
+      const stillReferenced = collectReferencedPhotoIds(next);
       safeIds = presentIds.filter(id =>
-        !isPhotoReferencedInSession(next, id) && !id.startsWith('pm-')
+        !stillReferenced.has(id) && !id.startsWith('pm-')
       );
       return next;
     }, { updatePhotos: true });
@@ -1130,14 +1165,15 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
         set2: session.sets?.set2 || { title: '', photos: [] }
       };
 
-      const photos = [...(ensuredSets[setKey].photos || [])];
-      if (fromIndex < 0 || fromIndex >= photos.length || toIndex < 0 || toIndex >= photos.length) {
+      const current = ensuredSets[setKey].photos || [];
+      if (fromIndex < 0 || fromIndex >= current.length || toIndex < 0 || toIndex >= current.length) {
         return session; // Invalid indices, no change
       }
+      // Dropped back onto its own slot — keep the session, skip the write.
+      if (fromIndex === toIndex) return session;
 
       // Remove photo from original position and insert at new position
-      const [movedPhoto] = photos.splice(fromIndex, 1);
-      photos.splice(toIndex, 0, movedPhoto);
+      const photos = moveItem(current, fromIndex, toIndex);
 
       return {
         ...session,
@@ -1240,39 +1276,51 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
         set1: session.sets?.set1 || { title: '', photos: [] },
         set2: session.sets?.set2 || { title: '', photos: [] }
       };
-      
+
+      // Repeated values (drag ending where it began, slider at its clamp)
+      // keep the same session so updateCurrentCompetition skips the write.
+      const current = ensuredSets[setKey].photos || [];
+      const photos = patchPhotoCanvasState(current, photoId, canvasState);
+      if (photos === current) {
+        return session;
+      }
+
       return {
         ...session,
         version: session.version + 1,
         updatedAt: new Date().toISOString(),
         sets: {
           ...ensuredSets,
-          [setKey]: {
-            ...ensuredSets[setKey],
-            photos: (ensuredSets[setKey].photos || []).map(p => 
-              p.id === photoId ? { ...p, canvasState: { ...p.canvasState, ...canvasState } } : p
-            )
-          }
+          [setKey]: { ...ensuredSets[setKey], photos }
         }
       };
-    });
+    }, { coalesce: true });
   }, [updateCurrentCompetition]);
 
   const updateSetTitle = useCallback(async (setKey: 'set1' | 'set2', title: string) => {
     await updateCurrentCompetition(session => {
+      // Auto-update Set 2 title when Set 1 matches the `SP - TP<N>` pattern
+      // (track mode only). See `deriveSet2FromSet1` for the regex and the
+      // `SP - TPX` placeholder exclusion.
+      const derivedSet2 = session.mode === 'track' && setKey === 'set1'
+        ? deriveSet2FromSet1(title)
+        : null;
+
+      // Same title again (blur without an edit, a re-applied prefill) —
+      // keep the session so updateCurrentCompetition skips the write.
+      if (
+        session.sets[setKey].title === title &&
+        (derivedSet2 === null || session.sets.set2.title === derivedSet2)
+      ) {
+        return session;
+      }
+
       let updatedSets = {
         ...session.sets,
         [setKey]: { ...session.sets[setKey], title }
       };
-
-      // Auto-update Set 2 title when Set 1 matches the `SP - TP<N>` pattern
-      // (track mode only). See `deriveSet2FromSet1` for the regex and the
-      // `SP - TPX` placeholder exclusion.
-      if (session.mode === 'track' && setKey === 'set1') {
-        const derivedSet2 = deriveSet2FromSet1(title);
-        if (derivedSet2 !== null) {
-          updatedSets.set2 = { ...updatedSets.set2, title: derivedSet2 };
-        }
+      if (derivedSet2 !== null) {
+        updatedSets.set2 = { ...updatedSets.set2, title: derivedSet2 };
       }
 
       return {
@@ -1285,16 +1333,21 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
   }, [updateCurrentCompetition]);
 
   const updateSetTitles = useCallback(async (titles: { set1?: string; set2?: string }) => {
-    await updateCurrentCompetition(session => ({
-      ...session,
-      version: session.version + 1,
-      updatedAt: new Date().toISOString(),
-      sets: {
-        ...session.sets,
-        set1: titles.set1 !== undefined ? { ...session.sets.set1, title: titles.set1 } : session.sets.set1,
-        set2: titles.set2 !== undefined ? { ...session.sets.set2, title: titles.set2 } : session.sets.set2
-      }
-    }));
+    await updateCurrentCompetition(session => {
+      const set1Changed = titles.set1 !== undefined && titles.set1 !== session.sets.set1.title;
+      const set2Changed = titles.set2 !== undefined && titles.set2 !== session.sets.set2.title;
+      if (!set1Changed && !set2Changed) return session;
+      return {
+        ...session,
+        version: session.version + 1,
+        updatedAt: new Date().toISOString(),
+        sets: {
+          ...session.sets,
+          set1: set1Changed ? { ...session.sets.set1, title: titles.set1! } : session.sets.set1,
+          set2: set2Changed ? { ...session.sets.set2, title: titles.set2! } : session.sets.set2
+        }
+      };
+    });
   }, [updateCurrentCompetition]);
 
   const updateSessionMode = useCallback(async (mode: 'track' | 'turningpoint') => {
@@ -1411,7 +1464,7 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
   }, [currentCompetition]);
 
   const updateLayoutMode = useCallback(async (layoutMode: 'landscape' | 'portrait') => {
-    await updateCurrentCompetition(session => ({
+    await updateCurrentCompetition(session => (session as unknown as { layoutMode?: string }).layoutMode === layoutMode ? session : ({
       ...session,
       version: session.version + 1,
       updatedAt: new Date().toISOString(),
@@ -1420,7 +1473,7 @@ export function useCompetitionSystem(): UseCompetitionSystemResult {
   }, [updateCurrentCompetition]);
 
   const updateSessionCompetitionName = useCallback(async (competitionName: string) => {
-    await updateCurrentCompetition(session => ({
+    await updateCurrentCompetition(session => session.competition_name === competitionName ? session : ({
       ...session,
       competition_name: competitionName,
       version: session.version + 1,
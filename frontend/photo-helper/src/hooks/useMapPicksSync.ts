@@ -22,7 +22,7 @@ import {
   type MapPickEntry,
 } from '@airq/shared-handoff';
 import type { ApiPhoto, CandidateFlag } from '../types/api';
-import { createDefaultCanvasState } from './usePhotoSessionOPFS';
+import { createDefaultCanvasState } from '../utils/canvasStatePatch';
 
 // Re-export so existing call sites that imported MapPickEntry from
 // this module keep compiling. Single source of truth is shared-handoff.
@@ -1,7 +1,7 @@
 import { useCallback, useEffect, useRef, useState } from 'react';
 import type { Photo } from '../types';
 import type { ApiPhoto, ApiPhotoSession, CandidateFlag } from '../types/api';
-import { applyLabelPositionToAllInSession, applySettingToAllInSession, type CanvasSetting, type LabelPosition } from '../utils/canvasStatePatch';
+import { applyLabelPositionToAllInSession, createDefaultCanvasState, patchPhotoCanvasState, applySettingToAllInSession, type CanvasSetting, type LabelPosition } from '../utils/canvasStatePatch';
 import { deriveSet1FromSet2, deriveSet2FromSet1 } from '../utils/autoPrefillSetTitle';
 import { getGridCapacity, TURNING_POINT_PER_SET } from '../utils/getGridCapacity';
 import { routeDrop } from '../utils/smartDropRoute';
@@ -23,24 +23,9 @@ import {
 
 type LayoutMode = 'landscape' | 'portrait';
 
-/**
- * Default canvas state for a newly-imported photo. Extracted from
- * `buildPhotoFromFile` so that `useMapPicksSync` (Phase 8b of
- * photo-map-culling) can build identical ApiPhoto records when it
- * projects map-originated picks into the candidate pool — keeps the
- * two code paths from drifting on the editor's initial appearance.
- */
-export function createDefaultCanvasState(): ApiPhoto['canvasState'] {
-  return {
-    position: { x: 0, y: 0 },
-    scale: 1,
-    brightness: 0,
-    contrast: 1,
-    sharpness: 0,
-    whiteBalance: { temperature: 0, tint: 0, auto: false },
-    labelPosition: 'bottom-left',
-  };
-}
+// Re-exported for existing importers; the factory lives with the other
+// canvasState helpers in `utils/canvasStatePatch.ts`.
+export { createDefaultCanvasState };
 
 const defaultSession = (id: string): ApiPhotoSession => ({
   id,
@@ -327,15 +312,7 @@ export function usePhotoSessionOPFS() {
             sessionId: session.id,
             url,
             filename: file.name,
-            canvasState: {
-              position: { x: 0, y: 0 },
-              scale: 1,
-              brightness: 0,
-              contrast: 1,
-              sharpness: 0,
-              whiteBalance: { temperature: 0, tint: 0, auto: false },
-              labelPosition: 'bottom-left',
-            },
+            canvasState: createDefaultCanvasState(),
             label: '',
           });
         } else {
@@ -346,15 +323,7 @@ export function usePhotoSessionOPFS() {
             sessionId: session.id,
             url,
             filename: file.name,
-            canvasState: {
-              position: { x: 0, y: 0 },
-              scale: 1,
-              brightness: 0,
-              contrast: 1,
-              sharpness: 0,
-              whiteBalance: { temperature: 0, tint: 0, auto: false },
-              labelPosition: 'bottom-left',
-            },
+            canvasState: createDefaultCanvasState(),
             label: '',
           });
         }
@@ -499,16 +468,15 @@ export function usePhotoSessionOPFS() {
     canvasState: Partial<Photo['canvasState']>
   ) => {
     if (!session) return;
+    const photos = patchPhotoCanvasState(session.sets[setKey].photos, photoId, canvasState);
+    if (photos === session.sets[setKey].photos) return;
     const next: ApiPhotoSession = {
       ...session,
       version: session.version + 1,
       updatedAt: new Date().toISOString(),
       sets: {
         ...session.sets,
-        [setKey]: {
-          ...session.sets[setKey],
-          photos: session.sets[setKey].photos.map(p => p.id === photoId ? { ...p, canvasState: { ...p.canvasState, ...canvasState } } : p),
-        },
+        [setKey]: { ...session.sets[setKey], photos },
       },
     };
     (next as any)[session.mode === 'track' ? 'setsTrack' : 'setsTurning'] = next.sets;
@@ -596,19 +564,20 @@ export function usePhotoSessionOPFS() {
     if (!session) return;
     const gridCapacity = getGridCapacity(session as any);
     if (fromIndex === toIndex || fromIndex < 0 || toIndex < 0 || fromIndex >= gridCapacity || toIndex >= gridCapacity) return;
-    const current = [...session.sets[setKey].photos];
-    const slots: (ApiPhoto | null)[] = Array(gridCapacity).fill(null);
-    current.forEach((p, i) => { if (i < gridCapacity) slots[i] = p; });
-    const moving = slots[fromIndex];
+    const moving = session.sets[setKey].photos[fromIndex];
     if (!moving) return;
-    const compact = slots.filter((p, i) => p && i !== fromIndex) as ApiPhoto[];
-    const insertIdx = fromIndex < toIndex ? Math.max(0, Math.min(compact.length, toIndex - 1)) : Math.max(0, Math.min(compact.length, toIndex));
-    compact.splice(insertIdx, 0, moving);
+    // Photos are stored densely, so a move is one remove + one insert on a
+    // copy of the visible slice — no capacity-sized slot array to fill and
+    // filter back down.
+    const photos = session.sets[setKey].photos.slice(0, gridCapacity);
+    photos.splice(fromIndex, 1);
+    const insertIdx = fromIndex < toIndex ? Math.max(0, Math.min(photos.length, toIndex - 1)) : Math.max(0, Math.min(photos.length, toIndex));
+    photos.splice(insertIdx, 0, moving);
     const next: ApiPhotoSession = {
       ...session,
       version: session.version + 1,
       updatedAt: new Date().toISOString(),
-      sets: { ...session.sets, [setKey]: { ...session.sets[setKey], photos: compact.slice(0, gridCapacity) } },
+      sets: { ...session.sets, [setKey]: { ...session.sets[setKey], photos } },
     };
     (next as any)[session.mode === 'track' ? 'setsTrack' : 'setsTurning'] = next.sets;
     await persistSession(next);
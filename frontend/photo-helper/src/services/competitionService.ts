@@ -19,15 +19,60 @@ import {
   type DirectoryHandle,
   type StorageHandles,
 } from '@airq/shared-storage';
+import { createCoalescedWriter, type CoalescedWriter } from '@airq/shared-storage';
+import { mapWithConcurrency } from '../utils/mapWithConcurrency';
 
 const COMPETITIONS_INDEX_FILE = 'competitions-index.json';
 const MAX_COMPETITIONS = 10;
 const MAX_AGE_DAYS = 30;
+// How stale the index's `lastModified` may get before a metadata-only session
+// write refreshes it. Only used for newest-first sorting and the 30-day
+// cleanup heuristic, so minute granularity is plenty.
+const INDEX_TOUCH_INTERVAL_MS = 60 * 1000;
+// Photo files saved concurrently per batch — enough to overlap OPFS / IPC
+// latency without holding a whole import's blobs in memory at once.
+const PHOTO_IO_CONCURRENCY = 4;
+// Minimum gap between two canvas-state writes of the same competition. A
+// slider drag fires onChange on every pointer move and each tick used to
+// become its own session.json + index write as soon as the previous one
+// landed; with the gap a 2-second drag persists roughly ten snapshots
+// instead of dozens. The editor preview updates optimistically, so only the
+// grid thumbnail trails by up to this much. Only updates passed with
+// `coalesce: true` wait for it — structural edits are awaited one after
+// another (a map-picks handoff awaits one per pick) and must not pay it.
+// `flushPendingWrites` cuts it short on pagehide.
+const SESSION_WRITE_INTERVAL_MS = 200;
+
+interface CompetitionWrite {
+  competition: Competition;
+  updatePhotos: boolean;
+}
 
 export class CompetitionService {
   private storage: StorageInterface | null = null;
   private handles: StorageHandles | null = null;
   private competitionsDir: DirectoryHandle | null = null;
+  // One coalesced writer per competition id — see shared-storage `coalescedWrite.ts`.
+  private competitionWriters = new Map<string, CoalescedWriter<CompetitionWrite>>();
+  // URL-stripped copies produced by `sanitizeSessionForStorage`, keyed by the
+  // source object. Session updates are immutable, so an unchanged photo (or
+  // photo list) keeps its identity across writes and its stripped copy can
+  // be reused; GC drops entries along with the session that owned them.
+  private strippedPhotos = new WeakMap<object, any>();
+  private strippedPhotoLists = new WeakMap<object, any[]>();
+  // Session object last written to each competition's session.json. Session
+  // updates are immutable (every mutation builds a new object and bumps
+  // `version`), so a write whose session is this same object would
+  // serialize identical bytes — e.g. a photo-only flush, or a metadata
+  // update that leaves the session alone. Cleared on delete and never set
+  // when the write fails, so it can only ever skip a redundant write.
+  private persistedSessions = new Map<string, ApiPhotoSession>();
+  // Index summary this service last saw on disk for each competition, with
+  // `lastModified` kept as epoch ms. Lets `writeCompetition` decide that the
+  // index needs no touch without reading and parsing competitions-index.json
+  // (and re-parsing an ISO timestamp) on every session write.
+  private indexSummaries = new Map<string, { name: string; photoCount: number; touchedAt: number }>();
+  private initializing: Promise<void> | null = null;
 
   async initialize(): Promise<void> {
     this.storage = await initStorage();
@@ -39,10 +84,22 @@ export class CompetitionService {
     );
   }
 
+  /**
+   * Initialize once, single-flight. On launch the hook fires the index read,
+   * the active-competition load and the storage-stats refresh together; each
+   * used to see `storage === null` and run its own `initialize()` — three
+   * `initStorage()` + `init()` + directory lookups racing to assign the same
+   * fields. Concurrent callers now share the one in-flight promise; a failed
+   * attempt clears it so the next call retries.
+   */
   async ensureInitialized(): Promise<void> {
-    if (!this.storage || !this.handles || !this.competitionsDir) {
-      await this.initialize();
+    if (this.storage && this.handles && this.competitionsDir) return;
+    if (!this.initializing) {
+      this.initializing = this.initialize().finally(() => {
+        this.initializing = null;
+      });
     }
+    await this.initializing;
   }
 
   // Competition Index Management
@@ -172,6 +229,7 @@ export class CompetitionService {
     );
 
     await this.storage!.writeJSON(competitionDir, 'session.json', competition.session);
+    this.persistedSessions.set(id, competition.session);
 
     // Save photos to competition directory
     await this.saveSessionPhotos(session, photosDir);
@@ -241,7 +299,41 @@ export class CompetitionService {
     }
   }
 
-  async updateCompetition(competition: Competition, options?: { updatePhotos?: boolean }): Promise<void> {
+  /**
+   * Persist a competition. Bursts of updates for the same competition (slider
+   * drags, rapid relabels) are coalesced: while one write is in flight, later
+   * calls merge into a single follow-up write of the newest snapshot. Calls
+   * with `coalesce: true` (canvas-state ticks) also keep merging for
+   * SESSION_WRITE_INTERVAL_MS after a write lands; any other call writes as
+   * soon as the in-flight write settles. The `updatePhotos` flags of merged
+   * calls are OR-ed so a photo added by an intermediate snapshot is still
+   * saved — it's present in the newest one too.
+   */
+  updateCompetition(competition: Competition, options?: { updatePhotos?: boolean; coalesce?: boolean }): Promise<void> {
+    let writer = this.competitionWriters.get(competition.id);
+    if (!writer) {
+      writer = createCoalescedWriter<CompetitionWrite>(
+        ({ competition: c, updatePhotos }) => this.writeCompetition(c, updatePhotos),
+        (pending, next) => ({
+          competition: next.competition,
+          updatePhotos: pending.updatePhotos || next.updatePhotos,
+        }),
+        { minIntervalMs: SESSION_WRITE_INTERVAL_MS },
+      );
+      this.competitionWriters.set(competition.id, writer);
+    }
+    return writer(
+      { competition, updatePhotos: options?.updatePhotos === true },
+      { coalesce: options?.coalesce === true },
+    );
+  }
+
+  /** Write every competition's pending snapshot now, skipping the write interval. */
+  async flushPendingWrites(): Promise<void> {
+    await Promise.all([...this.competitionWriters.values()].map(writer => writer.flush()));
+  }
+
+  private async writeCompetition(competition: Competition, updatePhotos: boolean): Promise<void> {
     await this.ensureInitialized();
 
     const competitionDir = await this.storage!.getDirectoryHandle(
@@ -256,27 +348,59 @@ export class CompetitionService {
     );
 
     // Update session data
-    const sanitizedSession = this.sanitizeSessionForStorage(competition.session);
-    await this.storage!.writeJSON(competitionDir, 'session.json', sanitizedSession);
+    if (this.persistedSessions.get(competition.id) !== competition.session) {
+      const sanitizedSession = this.sanitizeSessionForStorage(competition.session);
+      await this.storage!.writeJSON(competitionDir, 'session.json', sanitizedSession);
+      this.persistedSessions.set(competition.id, competition.session);
+    }
 
     // Only update photos if explicitly requested (e.g., when photos actually changed)
-    if (options?.updatePhotos) {
+    if (updatePhotos) {
       await this.saveSessionPhotos(competition.session, photosDir);
     }
 
-    // Update metadata in index
+    // Update metadata in index. session.json is the per-mutation record;
+    // the index only carries summary fields, so skip rewriting it (a second
+    // full-file write on every slider tick) unless one of them actually
+    // changed or `lastModified` has drifted past INDEX_TOUCH_INTERVAL_MS.
+    const photoCount = this.calculatePhotoCount(competition.session);
+    const now = Date.now();
+    const known = this.indexSummaries.get(competition.id);
+    if (
+      known &&
+      known.name === competition.name &&
+      known.photoCount === photoCount &&
+      now - known.touchedAt < INDEX_TOUCH_INTERVAL_MS
+    ) {
+      return;
+    }
+
     const index = await this.getCompetitionsIndex();
     const metadataIndex = index.competitions.findIndex(c => c.id === competition.id);
 
     if (metadataIndex >= 0) {
-      index.competitions[metadataIndex] = {
-        ...index.competitions[metadataIndex],
+      const existing = index.competitions[metadataIndex];
+      const lastTouched = new Date(existing.lastModified).getTime();
+      const needsWrite =
+        existing.name !== competition.name ||
+        existing.photoCount !== photoCount ||
+        !(now - lastTouched < INDEX_TOUCH_INTERVAL_MS);
+
+      if (needsWrite) {
+        index.competitions[metadataIndex] = {
+          ...existing,
+          name: competition.name,
+          lastModified: new Date(now).toISOString(),
+          photoCount
+        };
+
+        await this.saveCompetitionsIndex(index);
+      }
+      this.indexSummaries.set(competition.id, {
         name: competition.name,
-        lastModified: new Date().toISOString(),
-        photoCount: this.calculatePhotoCount(competition.session)
-      };
-
-      await this.saveCompetitionsIndex(index);
+        photoCount,
+        touchedAt: needsWrite ? now : lastTouched,
+      });
     }
   }
 
@@ -334,6 +458,9 @@ export class CompetitionService {
 
   async deleteCompetition(id: string): Promise<void> {
     await this.ensureInitialized();
+    this.competitionWriters.delete(id);
+    this.persistedSessions.delete(id);
+    this.indexSummaries.delete(id);
 
     try {
       // Delete competition directory by clearing it and then removing
@@ -544,17 +671,40 @@ export class CompetitionService {
     return session.sets.set1.photos.length + session.sets.set2.photos.length;
   }
 
+  // Blob URLs are per-page-load, so they're blanked before persisting. This
+  // runs on every coalesced write (each slider tick that lands), yet a
+  // typical mutation touches one photo: the other set, the inactive mode
+  // buckets and the candidate pool keep their array identity, and untouched
+  // photos keep theirs. Memoising by identity turns the per-write cost from
+  // "copy every photo" into "copy the photos that changed".
+  private stripPhotoUrls(photos: any[] | undefined): any[] {
+    if (!photos) return [];
+    const cachedList = this.strippedPhotoLists.get(photos);
+    if (cachedList) return cachedList;
+    const stripped = photos.map((p: any) => {
+      if (!p || typeof p !== 'object') return p;
+      let copy = this.strippedPhotos.get(p);
+      if (!copy) {
+        copy = { ...p, url: '' };
+        this.strippedPhotos.set(p, copy);
+      }
+      return copy;
+    });
+    this.strippedPhotoLists.set(photos, stripped);
+    return stripped;
+  }
+
   private sanitizeSessionForStorage(session: ApiPhotoSession): ApiPhotoSession {
     const clearUrls = (sets?: { set1: any; set2: any }) => {
       if (!sets) return undefined;
       return {
         set1: {
           ...sets.set1,
-          photos: (sets.set1?.photos || []).map((p: any) => ({ ...p, url: '' }))
+          photos: this.stripPhotoUrls(sets.set1?.photos)
         },
         set2: {
           ...sets.set2,
-          photos: (sets.set2?.photos || []).map((p: any) => ({ ...p, url: '' }))
+          photos: this.stripPhotoUrls(sets.set2?.photos)
         }
       };
     };
@@ -563,7 +713,7 @@ export class CompetitionService {
     // `{ photos: [] }` shape so it's not symmetric with `{ set1, set2 }` and
     // can't share the helper above.
     const clearCandidateUrls = (pool?: { photos: any[] }) =>
-      pool ? { photos: (pool.photos || []).map((p: any) => ({ ...p, url: '' })) } : undefined;
+      pool ? { photos: this.stripPhotoUrls(pool.photos) } : undefined;
 
     return {
       ...session,
@@ -606,28 +756,73 @@ export class CompetitionService {
 
     [...activePhotos, ...trackPhotos, ...turningPhotos, ...candidatePhotos].forEach(pushPhoto);
 
-    for (const photo of idToPhoto.values()) {
-      if (photo.url && photo.url.startsWith('blob:')) {
+    const toSave = [...idToPhoto.values()].filter(photo => photo.url && photo.url.startsWith('blob:'));
+    const toFile = async (photo: any): Promise<File> => {
+      const response = await fetch(photo.url);
+      const blob = await response.blob();
+      return new File([blob], photo.filename, { type: blob.type });
+    };
+
+    // Backends with a batch save (Electron) get one submission per chunk
+    // instead of one round-trip per photo; chunks of PHOTO_IO_CONCURRENCY
+    // keep the bytes in flight bounded.
+    const storage = this.storage!;
+    if (storage.savePhotoFiles) {
+      for (let i = 0; i < toSave.length; i += PHOTO_IO_CONCURRENCY) {
+        const chunk = toSave.slice(i, i + PHOTO_IO_CONCURRENCY);
+        const entries: Array<{ photoId: string; file: File }> = [];
+        await Promise.all(chunk.map(async (photo) => {
+          try {
+            entries.push({ photoId: photo.id, file: await toFile(photo) });
+          } catch (error) {
+            console.warn(`Failed to save photo ${photo.id}:`, error);
+          }
+        }));
         try {
-          const response = await fetch(photo.url);
-          const blob = await response.blob();
-          const file = new File([blob], photo.filename, { type: blob.type });
-          await this.storage!.savePhotoFile(photosDir, photo.id, file);
+          const { failed } = await storage.savePhotoFiles(photosDir, entries);
+          for (const id of failed) console.warn(`Failed to save photo ${id}`);
         } catch (error) {
-          console.warn(`Failed to save photo ${photo.id}:`, error);
+          console.warn('Failed to save photo batch:', error);
         }
       }
+      return;
     }
+
+    // Otherwise each photo is an independent file, so saves run through a
+    // small pool rather than one after another.
+    await mapWithConcurrency(toSave, PHOTO_IO_CONCURRENCY, async (photo) => {
+      try {
+        await storage.savePhotoFile(photosDir, photo.id, await toFile(photo));
+      } catch (error) {
+        console.warn(`Failed to save photo ${photo.id}:`, error);
+      }
+    });
   }
 
   private async loadSessionPhotos(session: ApiPhotoSession, photosDir: DirectoryHandle): Promise<ApiPhotoSession> {
     await this.ensureInitialized();
 
+    // One read per photo id. The active sets mirror the current mode
+    // bucket, so nearly every slot photo appears twice (and a candidate
+    // promoted into a set can appear again) — each used to pay its own
+    // IPC round-trip + file open/read. Photo files are immutable per id,
+    // so the Blob is shared; every container still gets its own object
+    // URL (see `collectModeSwitchRevokeUrls`).
+    const blobReads = new Map<string, Promise<Blob>>();
+    const readBlob = (photoId: string): Promise<Blob> => {
+      let read = blobReads.get(photoId);
+      if (!read) {
+        read = this.storage!.getPhotoBlob(photosDir, photoId);
+        blobReads.set(photoId, read);
+      }
+      return read;
+    };
+
     const loadPhotoUrls = async (photos: typeof session.sets.set1.photos) => {
       const updatedPhotos = [];
       for (const photo of photos) {
         try {
-          const blob = await this.storage!.getPhotoBlob(photosDir, photo.id);
+          const blob = await readBlob(photo.id);
           const url = URL.createObjectURL(blob);
           updatedPhotos.push({ ...photo, url });
         } catch {
@@ -16,6 +16,7 @@
 
 import type { ApiPhoto, ApiPhotoSession, ApiPhotoSet, CandidateFlag } from '../types/api';
 import { getGridCapacity } from './getGridCapacity';
+import { patchPhotoCanvasState } from './canvasStatePatch';
 
 type SetKey = 'set1' | 'set2';
 
@@ -142,7 +143,9 @@ export function setCandidateFlag(
 ): ApiPhotoSession {
   const photos = getCandidatePhotos(session);
   const idx = photos.findIndex((p) => p.id === photoId);
-  if (idx === -1) return session;
+  // Re-applying the current flag (a map-picks re-sync, a double click) keeps
+  // the session so the hook skips the session.json rewrite.
+  if (idx === -1 || photos[idx].flag === flag) return session;
   const next = [...photos];
   next[idx] = { ...next[idx], flag };
   return bumpVersion({ ...session, candidates: { photos: next } });
@@ -160,6 +163,21 @@ export function removeCandidate(
   });
 }
 
+/**
+ * Bulk variant of `removeCandidate`: drops every id in `photoIds` from the
+ * pool in a single pass with one version bump, instead of k filter passes
+ * (and k bumps) when the cleanup dialog deletes a batch.
+ */
+export function removeCandidates(
+  session: ApiPhotoSession,
+  photoIds: ReadonlySet<string>,
+): ApiPhotoSession {
+  const photos = getCandidatePhotos(session);
+  const next = photos.filter((p) => !photoIds.has(p.id));
+  if (next.length === photos.length) return session;
+  return bumpVersion({ ...session, candidates: { photos: next } });
+}
+
 export function clearAllCandidates(session: ApiPhotoSession): ApiPhotoSession {
   if (!session.candidates || session.candidates.photos.length === 0) return session;
   return bumpVersion({ ...session, candidates: { photos: [] } });
@@ -171,13 +189,8 @@ export function updateCandidateCanvasState(
   canvasState: Partial<ApiPhoto['canvasState']>,
 ): ApiPhotoSession {
   const photos = getCandidatePhotos(session);
-  const idx = photos.findIndex((p) => p.id === photoId);
-  if (idx === -1) return session;
-  const next = [...photos];
-  next[idx] = {
-    ...next[idx],
-    canvasState: { ...next[idx].canvasState, ...canvasState },
-  };
+  const next = patchPhotoCanvasState(photos, photoId, canvasState);
+  if (next === photos) return session;
   return bumpVersion({ ...session, candidates: { photos: next } });
 }
 
@@ -372,13 +385,15 @@ export function reconcilePlacedToDesiredSet(
 
   const set1 = session.sets.set1.photos;
   const set2 = session.sets.set2.photos;
-  const inSet1 = set1.some((p) => p.id === photoId);
-  const inSet2 = set2.some((p) => p.id === photoId);
-  const currentSet: SetKey | null = inSet1 ? 'set1' : inSet2 ? 'set2' : null;
+  // One lookup per sheet yields both the membership and the photo itself.
+  // Runs for every placed pick on every map-picks sync pass.
+  const idx1 = set1.findIndex((p) => p.id === photoId);
+  const idx2 = idx1 === -1 ? set2.findIndex((p) => p.id === photoId) : -1;
+  const currentSet: SetKey | null = idx1 !== -1 ? 'set1' : idx2 !== -1 ? 'set2' : null;
   if (!currentSet) return { session, moved: false }; // not in the active sets
   if (currentSet === desiredSet) return { session, moved: false }; // already right
 
-  const photo = (currentSet === 'set1' ? set1 : set2).find((p) => p.id === photoId)!;
+  const photo = currentSet === 'set1' ? set1[idx1] : set2[idx2];
 
   // Remove from the current sheet, preserving the other photos' order.
   let newSet1 = currentSet === 'set1' ? set1.filter((p) => p.id !== photoId) : [...set1];
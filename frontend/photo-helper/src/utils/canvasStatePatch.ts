@@ -14,7 +14,15 @@ export type CanvasSetting =
   | 'whiteBalance.temperature'
   | 'whiteBalance.tint';
 
-const makeDefaultCanvasState = (): CanvasState => ({
+/**
+ * Canvas state for a newly-imported photo. Every photo factory (file import,
+ * candidate add, map-pick projection, placeholders) builds its state here,
+ * so the editor's initial appearance can't drift between paths and every
+ * canvasState object is created with the same property order — V8 then
+ * shares one hidden class across all of them, keeping property access on
+ * the render/PDF hot paths monomorphic and the per-photo objects compact.
+ */
+export const createDefaultCanvasState = (): CanvasState => ({
   position: { x: 0, y: 0 },
   scale: 1,
   brightness: 0,
@@ -27,7 +35,7 @@ const makeDefaultCanvasState = (): CanvasState => ({
 // Frozen at top level and nested so accidental in-place mutation throws
 // (modules run in strict mode). Consumers still spread it to get a mutable copy.
 export const DEFAULT_CANVAS_STATE: CanvasState = (() => {
-  const s = makeDefaultCanvasState();
+  const s = createDefaultCanvasState();
   Object.freeze(s.position);
   Object.freeze(s.whiteBalance);
   Object.freeze(s);
@@ -46,7 +54,7 @@ export function applySettingPatch(
 ): CanvasState {
   const base = canvasState ?? undefined;
   const next: CanvasState = {
-    ...makeDefaultCanvasState(),
+    ...createDefaultCanvasState(),
     ...base,
     position: base?.position ? { ...base.position } : { x: 0, y: 0 },
     whiteBalance: base?.whiteBalance
@@ -77,6 +85,59 @@ export function applySettingPatch(
   return next;
 }
 
+/**
+ * True when merging `patch` into `current` would leave every value as it is.
+ * Nested objects (`position`, `whiteBalance`, `circle`) are compared one
+ * level deep — the shape every editor callback sends.
+ *
+ * The editor fires canvas updates on pointer moves and slider input, and a
+ * good share of them repeat the current value (a drag that ends where it
+ * started, a slider pinned at its clamp). Each one used to bump the session
+ * version and rewrite the whole session.json for nothing.
+ */
+export function isCanvasPatchNoop(
+  current: CanvasState | undefined | null,
+  patch: Partial<CanvasState>,
+): boolean {
+  if (!current) return false;
+  for (const key of Object.keys(patch) as (keyof CanvasState)[]) {
+    const next = patch[key] as unknown;
+    const prev = current[key] as unknown;
+    if (next === prev) continue;
+    if (!next || !prev || typeof next !== 'object' || typeof prev !== 'object') return false;
+    const nextObj = next as Record<string, unknown>;
+    const prevObj = prev as Record<string, unknown>;
+    const nextKeys = Object.keys(nextObj);
+    if (nextKeys.length !== Object.keys(prevObj).length) return false;
+    for (const k of nextKeys) {
+      if (nextObj[k] !== prevObj[k]) return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * Merge `patch` into the canvasState of the photo with `photoId`. Returns the
+ * SAME array when the id is unknown or the patch changes nothing, so callers
+ * can return their session untouched and skip the write; otherwise a copy
+ * with only that one photo replaced.
+ *
+ * This is the per-tick path of every editor drag and slider. The id is
+ * looked up once — callers used to `find` the photo for the no-op check and
+ * then `map` the whole list comparing every id again to rebuild it.
+ */
+export function patchPhotoCanvasState<T extends { id: string; canvasState: CanvasState }>(
+  photos: T[],
+  photoId: string,
+  patch: Partial<CanvasState>,
+): T[] {
+  const idx = photos.findIndex(p => p.id === photoId);
+  if (idx === -1 || isCanvasPatchNoop(photos[idx].canvasState, patch)) return photos;
+  const next = photos.slice();
+  next[idx] = { ...photos[idx], canvasState: { ...photos[idx].canvasState, ...patch } };
+  return next;
+}
+
 /**
  * Apply a setting to all photos in an array, optionally excluding one photo by ID.
  */
@@ -18,12 +18,12 @@
  * case — handled there, not duplicated here.
  */
 
-import { base64ToUint8Array } from './electronPhotoImport';
+import { base64ToUint8Array, photoPayloadBytes, type PhotoFilePayload } from './electronPhotoImport';
 
 declare global {
   interface Window {
     electronAPI?: {
-      readPhotoFile?: (filePath: string) => Promise<{ name: string; mimeType: string; base64: string } | null>;
+      readPhotoFile?: (filePath: string) => Promise<PhotoFilePayload | null>;
       readClipboardPhotos?: (maxFiles?: number) => Promise<
         | { kind: 'paths'; paths: string[]; rejected: Array<{ path: string; reason: string }> }
         | { kind: 'image'; name: string; mimeType: string; base64: string }
@@ -106,10 +106,10 @@ export async function readPhotosFromClipboard(maxFiles?: number): Promise<Clipbo
     payload.paths.map(async (p): Promise<{ ok: true; file: File } | { ok: false; path: string; error: unknown }> => {
       try {
         const data = await api.readPhotoFile!(p);
-        if (!data || !data.base64) {
+        const bytes = data ? photoPayloadBytes(data) : null;
+        if (!data || !bytes) {
           return { ok: false, path: p, error: new Error('Empty response from readPhotoFile') };
         }
-        const bytes = base64ToUint8Array(data.base64);
         return { ok: true, file: new File([bytes], data.name, { type: data.mimeType }) };
       } catch (err) {
         return { ok: false, path: p, error: err };
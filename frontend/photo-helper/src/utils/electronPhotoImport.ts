@@ -23,7 +23,7 @@ declare global {
   interface Window {
     electronAPI?: {
       openPhotos?: (defaultDir?: string, maxFiles?: number) => Promise<string[]>;
-      readPhotoFile?: (filePath: string) => Promise<{ name: string; mimeType: string; base64: string } | null>;
+      readPhotoFile?: (filePath: string) => Promise<PhotoFilePayload | null>;
       competitions?: {
         getWorkingDir?: (id: string) => Promise<string | null>;
         setWorkingDir?: (id: string, dir: string) => Promise<unknown>;
@@ -32,6 +32,17 @@ declare global {
   }
 }
 
+/**
+ * Response of `read-photo-file`. Current main processes send the raw bytes
+ * (`data`); `base64` is what older builds sent and is still accepted.
+ */
+export interface PhotoFilePayload {
+  name: string;
+  mimeType: string;
+  data?: Uint8Array;
+  base64?: string;
+}
+
 export interface PhotoImportFailure {
   path: string;
   error: unknown;
@@ -63,6 +74,17 @@ export function base64ToUint8Array(base64: string): Uint8Array {
   return bytes;
 }
 
+/**
+ * File bytes of a `read-photo-file` payload, or null when it carries none.
+ * The binary form is used as-is — no base64 string to build in main, ship
+ * at 4/3 size over IPC and decode char-by-char here.
+ */
+export function photoPayloadBytes(payload: PhotoFilePayload): Uint8Array | null {
+  if (payload.data && payload.data.byteLength > 0) return payload.data;
+  if (payload.base64) return base64ToUint8Array(payload.base64);
+  return null;
+}
+
 export function isElectronPhotoImportAvailable(): boolean {
   const api = window.electronAPI;
   return !!(api && typeof api.openPhotos === 'function' && typeof api.readPhotoFile === 'function');
@@ -106,20 +128,19 @@ export async function openPhotosViaElectron(maxFiles?: number): Promise<PhotoImp
   const paths = await api.openPhotos(workingDir, maxFiles);
   if (!paths || !paths.length) return EMPTY;
 
-  // Parallelize the per-file reads. Each round-trip is fs.readFileSync
-  // + Buffer.toString('base64') (~40 MB string for a 30 MB image) +
-  // IPC + renderer atob, all CPU-bound on different stages — running
-  // them concurrently overlaps the renderer-side decode with main-side
-  // reads and shaves seconds off a 9-photo import. Failures are
-  // captured per-path so a partial batch still surfaces what worked.
+  // Parallelize the per-file reads. Each round-trip is an async read in
+  // main + the IPC copy of the bytes — running them concurrently overlaps
+  // disk reads with the transfers and shaves seconds off a 9-photo
+  // import. Failures are captured per-path so a partial batch still
+  // surfaces what worked.
   const settled = await Promise.all(
     paths.map(async (p): Promise<{ ok: true; file: File } | { ok: false; path: string; error: unknown }> => {
       try {
         const data = await api.readPhotoFile!(p);
-        if (!data || !data.base64) {
+        const bytes = data ? photoPayloadBytes(data) : null;
+        if (!data || !bytes) {
           return { ok: false, path: p, error: new Error('Empty response from readPhotoFile') };
         }
-        const bytes = base64ToUint8Array(data.base64);
         return { ok: true, file: new File([bytes], data.name, { type: data.mimeType }) };
       } catch (err) {
         return { ok: false, path: p, error: err };
@@ -12,6 +12,25 @@ class ImageCacheManager {
   private cache = new Map<string, CachedImage>();
   private maxAge = 5 * 60 * 1000; // 5 minutes cache lifetime
   private maxSize = 50; // Maximum number of cached images
+  private hits = 0;
+  private misses = 0;
+
+  /**
+   * Return a fresh entry and mark it most-recently-used. The Map's insertion
+   * order doubles as the LRU order, so re-inserting on hit is all it takes —
+   * eviction then pops from the front instead of sorting every entry.
+   */
+  private lookup(key: string): CachedImage | undefined {
+    const cached = this.cache.get(key);
+    if (!cached) return undefined;
+    if (Date.now() - cached.timestamp >= this.maxAge) {
+      this.cache.delete(key);
+      return undefined;
+    }
+    this.cache.delete(key);
+    this.cache.set(key, cached);
+    return cached;
+  }
 
   /**
    * Get a cached image or load it if not cached
@@ -20,11 +39,13 @@ class ImageCacheManager {
     const cacheKey = `${sessionId}-${photoId}`;
     
     // Check if we have a valid cached image
-    const cached = this.cache.get(cacheKey);
-    if (cached && Date.now() - cached.timestamp < this.maxAge) {
+    const cached = this.lookup(cacheKey);
+    if (cached) {
+      this.hits++;
       console.log(`✨ Using cached image for ${photoId}`);
       return cached.image;
     }
+    this.misses++;
 
     // Load the image
     console.log(`📥 Loading image for ${photoId}`);
@@ -73,10 +94,12 @@ class ImageCacheManager {
    */
   async getImageByUrl(url: string, cacheKey?: string): Promise<HTMLImageElement> {
     const key = cacheKey || `url:${url}`;
-    const cached = this.cache.get(key);
-    if (cached && Date.now() - cached.timestamp < this.maxAge) {
+    const cached = this.lookup(key);
+    if (cached) {
+      this.hits++;
       return cached.image;
     }
+    this.misses++;
     const img = await this.loadImage(url);
     this.cache.set(key, { image: img, url, timestamp: Date.now() });
     this.cleanup();
@@ -84,20 +107,14 @@ class ImageCacheManager {
   }
 
   /**
-   * Clean up old cache entries
+   * Evict least-recently-used entries until the cache is within `maxSize`.
    */
   private cleanup() {
-    if (this.cache.size <= this.maxSize) return;
-
-    // Sort entries by timestamp and remove oldest
-    const entries = Array.from(this.cache.entries())
-      .sort((a, b) => a[1].timestamp - b[1].timestamp);
-
-    const toRemove = entries.slice(0, this.cache.size - this.maxSize);
-    toRemove.forEach(([key]) => {
-      console.log(`🗑️ Removing old cached image: ${key}`);
-      this.cache.delete(key);
-    });
+    while (this.cache.size > this.maxSize) {
+      const oldest = this.cache.keys().next().value as string;
+      console.log(`🗑️ Removing old cached image: ${oldest}`);
+      this.cache.delete(oldest);
+    }
   }
 
   /**
@@ -128,6 +145,8 @@ class ImageCacheManager {
    */
   clear() {
     this.cache.clear();
+    this.hits = 0;
+    this.misses = 0;
     console.log('🗑️ Image cache cleared');
   }
 
@@ -138,6 +157,8 @@ class ImageCacheManager {
     return {
       size: this.cache.size,
       maxSize: this.maxSize,
+      hits: this.hits,
+      misses: this.misses,
       entries: Array.from(this.cache.keys())
     };
   }
@@ -157,22 +157,29 @@ export const generateTurningPointLabels = (
   };
 };
 
+// Accept various JPEG MIME types and PNG
+const VALID_IMAGE_TYPES: ReadonlySet<string> = new Set([
+  'image/jpeg',
+  'image/jpg',
+  'image/pjpeg', // Progressive JPEG
+  'image/png',
+]);
+const VALID_IMAGE_EXTENSIONS: ReadonlySet<string> = new Set(['.jpg', '.jpeg', '.png']);
+const MAX_IMAGE_FILE_SIZE = 20 * 1024 * 1024; // 20MB limit
+
 /**
- * Validate if file is a supported image format
+ * Validate if file is a supported image format.
+ *
+ * Runs once per file on every drop/import batch. The size check goes first
+ * (a number compare), the type check is a Set lookup, and the extension
+ * fallback slices only the tail after the last dot instead of lowercasing
+ * the whole name and running a regex over it.
  */
 export const isValidImageFile = (file: File): boolean => {
-  // Accept various JPEG MIME types and PNG
-  const validTypes = [
-    'image/jpeg',
-    'image/jpg', 
-    'image/pjpeg', // Progressive JPEG
-    'image/png'
-  ];
-  
-  const hasValidType = validTypes.includes(file.type) || 
-    file.name.toLowerCase().match(/\.(jpe?g|png)$/); // Fallback to file extension
-  
-  const hasValidSize = file.size <= 20 * 1024 * 1024; // 20MB limit
-  
-  return hasValidType && hasValidSize;
+  if (file.size > MAX_IMAGE_FILE_SIZE) return false;
+  if (VALID_IMAGE_TYPES.has(file.type)) return true;
+
+  // Fallback to file extension (some OS pickers report an empty type)
+  const dot = file.name.lastIndexOf('.');
+  return dot >= 0 && VALID_IMAGE_EXTENSIONS.has(file.name.slice(dot).toLowerCase());
 };
@@ -0,0 +1,30 @@
+// Bounded-concurrency map for per-photo storage work. Photo saves and loads
+// are independent (distinct ids, distinct files), but running them strictly
+// one after another makes a 20-photo import pay 20 full round-trips —
+// OPFS `createWritable` + close, or an Electron IPC hop + disk write each.
+// Firing all of them at once instead would hold every decoded blob in
+// memory simultaneously and flood the main process with IPC. A small pool
+// keeps the disk busy without either problem.
+
+/**
+ * Run `fn` over `items` with at most `limit` calls in flight. Results keep
+ * the input order. Rejections propagate like `Promise.all` (the first one
+ * wins); callers that want per-item isolation catch inside `fn`.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i], i);
+    }
+  };
+  const workers = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
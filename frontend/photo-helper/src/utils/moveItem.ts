@@ -0,0 +1,25 @@
+// Move one element of a list to another index — the slot-grid reorder
+// behind every in-grid photo drag.
+//
+// `splice(from, 1)` + `splice(to, 0, item)` on a copy shifts the tail twice
+// and allocates a throwaway removed-elements array on each call. Here the
+// copy is the only allocation: `copyWithin` slides just the elements
+// between the two indices over by one, then the moved element drops into
+// the gap.
+
+/**
+ * Return a copy of `items` with the element at `from` moved to `to`, the
+ * elements in between shifted by one. Same result as removing at `from`
+ * and inserting at `to`. Indices must be in range; the caller validates.
+ */
+export function moveItem<T>(items: readonly T[], from: number, to: number): T[] {
+  const out = items.slice();
+  const moving = out[from];
+  if (from < to) {
+    out.copyWithin(from, from + 1, to + 1);
+  } else if (from > to) {
+    out.copyWithin(to + 1, to, from);
+  }
+  out[to] = moving;
+  return out;
+}
@@ -9,7 +9,7 @@
 // See types/api.ts ApiPhoto.isPlaceholder.
 
 import type { ApiPhoto } from '../types/api';
-import { createDefaultCanvasState } from '../hooks/usePhotoSessionOPFS';
+import { createDefaultCanvasState } from './canvasStatePatch';
 
 /** Marks a synthetic placeholder id. Mirrors the `pm-` map-origin convention. */
 export const PLACEHOLDER_ID_PREFIX = 'placeholder-';
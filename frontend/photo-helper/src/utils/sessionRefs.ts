@@ -32,3 +32,46 @@ export function isPhotoReferencedInSession(
   if (s.candidates?.photos?.some?.((p: any) => p.id === photoId) === true) return true;
   return false;
 }
+
+/**
+ * Every photo id referenced anywhere in the session — active sets, both mode
+ * buckets and the candidate pool — as a hash set. Batch paths that need the
+ * reference check for many ids (e.g. `deleteCandidates`) build this once and
+ * answer each id in O(1) instead of re-scanning all seven containers per id
+ * with `isPhotoReferencedInSession`.
+ */
+export function collectReferencedPhotoIds(session: ApiPhotoSession): Set<string> {
+  const s = session as any;
+  const ids = new Set<string>();
+  const add = (photos: any) => {
+    if (!Array.isArray(photos)) return;
+    for (const p of photos) if (p?.id) ids.add(p.id);
+  };
+  for (const bucket of [s.sets, s.setsTrack, s.setsTurning]) {
+    add(bucket?.set1?.photos);
+    add(bucket?.set2?.photos);
+  }
+  add(s.candidates?.photos);
+  return ids;
+}
+
+/**
+ * True when two photo lists hold the same ids in the same order. Used on the
+ * per-mutation "did photos change?" check in `updateCurrentCompetition`,
+ * which runs on every slider tick: identical array references short-circuit
+ * (the untouched set keeps its array), and otherwise ids are compared in
+ * place instead of mapping + `JSON.stringify`-ing both lists each time.
+ */
+export function samePhotoIds(
+  a: ReadonlyArray<{ id: string }> | undefined,
+  b: ReadonlyArray<{ id: string }> | undefined,
+): boolean {
+  if (a === b) return true;
+  const left = a ?? [];
+  const right = b ?? [];
+  if (left.length !== right.length) return false;
+  for (let i = 0; i < left.length; i++) {
+    if (left[i].id !== right[i].id) return false;
+  }
+  return true;
+}
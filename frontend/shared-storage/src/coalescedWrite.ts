@@ -0,0 +1,119 @@
+// Latest-wins write coalescing for session persistence. Every canvas-state
+// slider tick, label edit and drag in the photo-helper editor goes through
+// `competitionService.updateCompetition`, which rewrites session.json AND the
+// competitions index; every marker drag and relabel in map-corridors
+// rewrites the corridors session.json. During a drag the renderer fires
+// those faster than OPFS / the Electron IPC round-trip can settle them, so
+// writes queued up behind each other and the disk did N full rewrites of
+// states that were already stale by the time they landed.
+//
+// The writer below keeps at most one write in flight per key. Submissions
+// that arrive while a write is running are merged into a single pending
+// value; when the in-flight write settles, only the merged value is written.
+// Nothing is delayed when idle — the first write starts synchronously — so
+// the "await persist, then update React state" contract in
+// `useCompetitionSystem.updateCurrentCompetition` still holds: each caller's
+// promise resolves once a write containing its state has landed, and rejects
+// if that write failed.
+
+// `minIntervalMs` additionally spaces consecutive writes, but only for
+// submissions that opt in with `{ coalesce: true }` (slider ticks, drags):
+// after such a write lands, further opted-in submissions keep merging for
+// that long before the next one starts. The idle path is still immediate
+// (leading edge); only a sustained burst is thinned out. A plain submission
+// never waits — it ends a running interval, so an awaited sequence of
+// structural edits (e.g. a map-picks handoff) writes back to back. Callers
+// whose state sits in the window wait for it, so `flush()` exists to cut
+// the window short on pagehide.
+
+export interface CoalescedSubmitOptions {
+  /** Let this submission wait out `minIntervalMs` to merge with later ones. */
+  coalesce?: boolean;
+}
+
+export interface CoalescedWriter<T> {
+  (value: T, options?: CoalescedSubmitOptions): Promise<void>;
+  /** Write any pending value now, skipping the interval, and wait until idle. */
+  flush(): Promise<void>;
+}
+
+export interface CoalescedWriterOptions {
+  /** Minimum gap between the end of one write and the start of the next. */
+  minIntervalMs?: number;
+}
+
+interface PendingBatch<T> {
+  value: T;
+  // true while every merged submission opted into the interval
+  coalesce: boolean;
+  waiters: Array<{ resolve: () => void; reject: (err: unknown) => void }>;
+}
+
+/**
+ * Wrap `write` so overlapping submissions collapse into one follow-up write.
+ * `merge(pending, next)` folds a new submission into the queued one; the
+ * default keeps the newest value (the session is a full snapshot).
+ */
+export function createCoalescedWriter<T>(
+  write: (value: T) => Promise<void>,
+  merge: (pending: T, next: T) => T = (_pending, next) => next,
+  options: CoalescedWriterOptions = {},
+): CoalescedWriter<T> {
+  const minIntervalMs = options.minIntervalMs ?? 0;
+  let pending: PendingBatch<T> | null = null;
+  let draining: Promise<void> | null = null;
+  let flushing = false;
+  let endInterval: (() => void) | null = null;
+
+  const waitInterval = () => new Promise<void>(resolve => {
+    const done = () => {
+      clearTimeout(timer);
+      endInterval = null;
+      resolve();
+    };
+    const timer = setTimeout(done, minIntervalMs);
+    endInterval = done;
+  });
+
+  const drain = async () => {
+    while (pending) {
+      const batch = pending;
+      pending = null;
+      try {
+        await write(batch.value);
+        for (const w of batch.waiters) w.resolve();
+      } catch (err) {
+        for (const w of batch.waiters) w.reject(err);
+      }
+      const spaced = batch.coalesce && (!pending || pending.coalesce);
+      if (minIntervalMs > 0 && !flushing && spaced) await waitInterval();
+    }
+    draining = null;
+  };
+
+  const submit = (value: T, submitOptions?: CoalescedSubmitOptions) => new Promise<void>((resolve, reject) => {
+    const coalesce = submitOptions?.coalesce === true;
+    if (pending) {
+      pending.value = merge(pending.value, value);
+      pending.coalesce = pending.coalesce && coalesce;
+      pending.waiters.push({ resolve, reject });
+    } else {
+      pending = { value, coalesce, waiters: [{ resolve, reject }] };
+      if (!draining) draining = drain();
+    }
+    if (!coalesce) endInterval?.();
+  });
+
+  const flush = async () => {
+    if (!draining) return;
+    flushing = true;
+    endInterval?.();
+    try {
+      await draining;
+    } finally {
+      flushing = false;
+    }
+  };
+
+  return Object.assign(submit, { flush });
+}
@@ -26,32 +26,19 @@ function createPathHandle(path: string): DirectoryHandle {
 }
 
 /**
- * Convert a File to base64 for IPC transfer
- */
-async function fileToBase64(file: File): Promise<string> {
-  return new Promise((resolve, reject) => {
-    const reader = new FileReader();
-    reader.onload = () => {
-      const result = reader.result as string;
-      // Remove the data URL prefix (e.g., "data:image/jpeg;base64,")
-      const base64 = result.split(',')[1];
-      resolve(base64);
-    };
-    reader.onerror = () => reject(reader.error);
-    reader.readAsDataURL(file);
-  });
-}
-
-/**
- * Convert base64 to Blob
+ * Convert base64 to Blob — photo payloads from main-process builds that
+ * predate the raw-bytes transport. Decodes straight into one Uint8Array: the
+ * old intermediate `new Array(n)` of numbers cost ~8 bytes per photo byte (a
+ * 5 MB photo briefly held a 40 MB array) plus a second full copy into the
+ * typed array.
  */
 function base64ToBlob(base64: string, mimeType: string): Blob {
   const byteCharacters = atob(base64);
-  const byteNumbers = new Array(byteCharacters.length);
-  for (let i = 0; i < byteCharacters.length; i++) {
-    byteNumbers[i] = byteCharacters.charCodeAt(i);
+  const len = byteCharacters.length;
+  const byteArray = new Uint8Array(len);
+  for (let i = 0; i < len; i++) {
+    byteArray[i] = byteCharacters.charCodeAt(i);
   }
-  const byteArray = new Uint8Array(byteNumbers);
   return new Blob([byteArray], { type: mimeType });
 }
 
@@ -91,19 +78,51 @@ export class ElectronStorage implements StorageInterface {
 
   async writeJSON(dir: DirectoryHandle, name: string, data: unknown): Promise<void> {
     const api = getElectronAPI();
-    await api.writeJSON(dir.path, name, data);
+    // Serialize here and ship the string. Sending the object made the
+    // session cross IPC as a structured-clone graph, get rebuilt as objects
+    // in the main process and then walked again by JSON.stringify there —
+    // on the one thread that also serves every window's IPC. A string
+    // clones as a flat copy and main writes its bytes as-is.
+    await api.writeJSONText(dir.path, name, JSON.stringify(data));
   }
 
   async readJSON<T>(dir: DirectoryHandle, name: string): Promise<T | null> {
     const api = getElectronAPI();
-    return await api.readJSON<T>(dir.path, name);
+    // Fetch the text and parse it here — the mirror of writeJSON. Parsing
+    // in the main process meant a second full walk to structured-clone the
+    // object graph back over IPC, on the thread serving every window.
+    const text = await api.readJSONText(dir.path, name);
+    if (text === null) return null;
+    try {
+      return JSON.parse(text) as T;
+    } catch (e) {
+      // Same contract as the main-process reader: malformed → logged, null.
+      console.error('Failed to read JSON:', e);
+      return null;
+    }
   }
 
   async savePhotoFile(photosDir: DirectoryHandle, photoId: string, file: File): Promise<void> {
     const api = getElectronAPI();
-    const base64Data = await fileToBase64(file);
+    // Raw bytes go over IPC as-is (structured clone copies typed arrays
+    // without re-encoding) — no base64 round-trip through a data URL.
+    const data = new Uint8Array(await file.arrayBuffer());
     const mimeType = file.type || 'image/jpeg';
-    await api.savePhotoFile(photosDir.path, photoId, base64Data, mimeType);
+    await api.savePhotoFile(photosDir.path, photoId, data, mimeType);
+  }
+
+  async savePhotoFiles(
+    photosDir: DirectoryHandle,
+    entries: Array<{ photoId: string; file: File }>
+  ): Promise<{ failed: string[] }> {
+    if (entries.length === 0) return { failed: [] };
+    const api = getElectronAPI();
+    const payload = await Promise.all(entries.map(async ({ photoId, file }) => ({
+      photoId,
+      data: new Uint8Array(await file.arrayBuffer()),
+      mimeType: file.type || 'image/jpeg',
+    })));
+    return await api.savePhotoFiles(photosDir.path, payload);
   }
 
   async getPhotoBlob(photosDir: DirectoryHandle, photoId: string): Promise<Blob> {
@@ -114,7 +133,9 @@ export class ElectronStorage implements StorageInterface {
       throw new Error(`Photo not found: ${photoId}`);
     }
 
-    return base64ToBlob(result.base64, result.mimeType);
+    // Current main process sends raw bytes; base64 is what older builds sent.
+    if (result.data) return new Blob([result.data], { type: result.mimeType });
+    return base64ToBlob(result.base64 ?? '', result.mimeType);
   }
 
   async deletePhotoFile(photosDir: DirectoryHandle, photoId: string): Promise<void> {
@@ -27,6 +27,7 @@ export type {
 
 export { dirnameOf } from './pathUtils';
 export { slugifyForFilename } from './slugify';
+export { createCoalescedWriter, type CoalescedWriter, type CoalescedWriterOptions, type CoalescedSubmitOptions } from './coalescedWrite';
 
 // Photo-thumb helpers — implementation primitives behind
 // `StorageInterface.savePhotoThumb`/`getPhotoThumb`/`deletePhotoThumb`.
@@ -77,6 +77,20 @@ export interface StorageInterface {
    */
   savePhotoFile(photosDir: DirectoryHandle, photoId: string, file: File): Promise<void>;
 
+  /**
+   * Save several photo files in one call. Optional — implemented by
+   * backends with a fixed per-call cost (Electron: one IPC round-trip per
+   * save) so a batch is submitted once; callers fall back to
+   * `savePhotoFile` per photo when it is absent.
+   * @param photosDir - Directory handle for photos
+   * @param entries - Photo ids and their files
+   * @returns Ids whose individual save failed (the others are written)
+   */
+  savePhotoFiles?(
+    photosDir: DirectoryHandle,
+    entries: Array<{ photoId: string; file: File }>
+  ): Promise<{ failed: string[] }>;
+
   /**
    * Get a photo as a Blob
    * @param photosDir - Directory handle for photos
@@ -178,9 +192,15 @@ export interface ElectronStorageAPI {
     init: () => Promise<{ rootPath: string; sessionsPath: string }>;
     ensureSessionDirs: (sessionId: string) => Promise<{ dirPath: string; photosPath: string }>;
     writeJSON: (dirPath: string, name: string, data: unknown) => Promise<void>;
+    writeJSONText: (dirPath: string, name: string, text: string) => Promise<void>;
     readJSON: <T>(dirPath: string, name: string) => Promise<T | null>;
-    savePhotoFile: (photosPath: string, photoId: string, base64Data: string, mimeType: string) => Promise<void>;
-    getPhotoBlob: (photosPath: string, photoId: string) => Promise<{ base64: string; mimeType: string } | null>;
+    readJSONText: (dirPath: string, name: string) => Promise<string | null>;
+    savePhotoFile: (photosPath: string, photoId: string, data: Uint8Array, mimeType: string) => Promise<void>;
+    savePhotoFiles: (
+      photosPath: string,
+      entries: Array<{ photoId: string; data: Uint8Array; mimeType: string }>
+    ) => Promise<{ failed: string[] }>;
+    getPhotoBlob: (photosPath: string, photoId: string) => Promise<{ data?: Uint8Array; base64?: string; mimeType: string } | null>;
     deletePhotoFile: (photosPath: string, photoId: string) => Promise<void>;
     clearDirectory: (dirPath: string) => Promise<void>;
     deleteSessionDir: (sessionId: string) => Promise<void>;